@@ -0,0 +1,154 @@
+"""
+Accuracy and latency of the local care event parser on a labelled corpus.
+
+Each corpus message is either labelled with the events a careful reader
+would log, or with None when it should go to the LLM (questions, negations,
+vague or unusual phrasings). Reports coverage (messages answered locally,
+i.e. care_event_agent model calls saved), precision of those answers, how
+many should-defer messages were wrongly answered, and per-message latency.
+Run from the repository root:
+
+    python -m benchmarks.bench_care_event_parser --repeat 200
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from parent_concierge.tools.event_parser import parse_care_events
+
+NOW = datetime(2025, 11, 21, 16, 30)
+
+# (event_type, timestamp, volume_ml, duration_minutes, notes)
+Expected = Optional[List[Tuple[str, str, Optional[int], Optional[int], Optional[str]]]]
+
+CORPUS: List[Tuple[str, Expected]] = [
+    ("90ml at 7:10", [("feed", "2025-11-21T07:10:00", 90, None, None)]),
+    ("120 ml", [("feed", "2025-11-21T16:30:00", 120, None, None)]),
+    ("She had 150ml at 2:45pm", [("feed", "2025-11-21T14:45:00", 150, None, None)]),
+    ("4oz bottle at 2pm", [("feed", "2025-11-21T14:00:00", 118, None, None)]),
+    ("bottle 100ml @ 11:20", [("feed", "2025-11-21T11:20:00", 100, None, None)]),
+    ("fed 80 ml at 9", [("feed", "2025-11-21T09:00:00", 80, None, None)]),
+    ("breastfed at 1:30", [("feed", "2025-11-21T13:30:00", None, None, None)]),
+    ("feed at 16:05", [("feed", "2025-11-21T16:05:00", None, None, None)]),
+    ("yesterday 120ml at 9pm", [("feed", "2025-11-20T21:00:00", 120, None, None)]),
+    ("last night 150ml at 11:30pm", [("feed", "2025-11-20T23:30:00", 150, None, None)]),
+    ("nap from 2:15 to 3pm", [("nap", "2025-11-21T14:15:00", None, 45, None)]),
+    ("napped 1:00-2:30pm", [("nap", "2025-11-21T13:00:00", None, 90, None)]),
+    ("napped for 45 mins", [("nap", "2025-11-21T16:30:00", None, 45, None)]),
+    ("nap 1h 30m", [("nap", "2025-11-21T16:30:00", None, 90, None)]),
+    ("1 hour nap at 1", [("nap", "2025-11-21T13:00:00", None, 60, None)]),
+    ("slept from 7pm to 6am", [("nap", "2025-11-20T19:00:00", None, 660, None)]),
+    ("nap at 2", [("nap", "2025-11-21T14:00:00", None, None, None)]),
+    ("she napped for half an hour at 10am", [("nap", "2025-11-21T10:00:00", None, 30, None)]),
+    ("wet diaper", [("diaper", "2025-11-21T16:30:00", None, None, "wet")]),
+    ("dirty nappy", [("diaper", "2025-11-21T16:30:00", None, None, "dirty")]),
+    ("poo at 10am", [("diaper", "2025-11-21T10:00:00", None, None, "dirty")]),
+    (
+        "wet and dirty diaper at 11:05",
+        [("diaper", "2025-11-21T11:05:00", None, None, "wet and dirty")],
+    ),
+    ("diaper change at 12:40", [("diaper", "2025-11-21T12:40:00", None, None, None)]),
+    (
+        "two wet diapers since 6am and a 90ml feed at 7",
+        [
+            ("diaper", "2025-11-21T06:00:00", None, None, "wet"),
+            ("diaper", "2025-11-21T06:00:00", None, None, "wet"),
+            ("feed", "2025-11-21T07:00:00", 90, None, None),
+        ],
+    ),
+    (
+        "120ml at 8am, nap 9:30 to 10:15am, wet diaper at 10:20",
+        [
+            ("feed", "2025-11-21T08:00:00", 120, None, None),
+            ("nap", "2025-11-21T09:30:00", None, 45, None),
+            ("diaper", "2025-11-21T10:20:00", None, None, "wet"),
+        ],
+    ),
+    (
+        "3 wet nappies today",
+        [("diaper", "2025-11-21T16:30:00", None, None, "wet")] * 3,
+    ),
+    # Should be left to the LLM.
+    ("how many feeds today?", None),
+    ("no wet diapers today", None),
+    ("she didn't nap at all", None),
+    ("fed 20 minutes on the left side", None),
+    ("she spat up most of her 90ml bottle", None),
+    ("expressed 120ml at 7", None),
+    ("sleep", None),
+    ("milk", None),
+    ("feeds have been hard today", None),
+    ("yesterday at 7 she had a bottle", None),
+    ("log a feed at 7:10 on Tuesday", None),
+    ("she seems unsettled after the 6pm bottle", None),
+    ("summarise yesterday", None),
+    ("nap from 9 till lunchtime", None),
+    ("thanks!", None),
+]
+
+
+def _as_dicts(expected: Expected) -> Optional[List[Dict[str, Any]]]:
+    if expected is None:
+        return None
+    keys = ("event_type", "timestamp", "volume_ml", "duration_minutes", "notes")
+    return [dict(zip(keys, row)) for row in expected]
+
+
+def run(repeat: int) -> Dict[str, Any]:
+    parsed = correct = wrong = false_accepts = should_parse = 0
+    timings: List[float] = []
+    mistakes: List[str] = []
+
+    for text, expected in CORPUS:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            events = parse_care_events(text, now=NOW)
+            timings.append(time.perf_counter() - start)
+
+        if expected is not None:
+            should_parse += 1
+        if events is None:
+            continue
+        parsed += 1
+        if expected is None:
+            false_accepts += 1
+            mistakes.append(f"answered, should defer: {text!r}")
+        elif events == _as_dicts(expected):
+            correct += 1
+        else:
+            wrong += 1
+            mistakes.append(f"wrong events: {text!r} -> {events}")
+
+    timings.sort()
+    return {
+        "messages": len(CORPUS),
+        "coverage": round(correct / should_parse, 3),
+        "precision": round(correct / parsed, 3) if parsed else None,
+        "wrong": wrong,
+        "false_accepts": false_accepts,
+        "p50_us": round(statistics.median(timings) * 1e6, 1),
+        "p99_us": round(timings[int(len(timings) * 0.99)] * 1e6, 1),
+        "mistakes": mistakes,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    result = run(args.repeat)
+    mistakes = result.pop("mistakes")
+    print(result)
+    for line in mistakes:
+        print("  " + line)
+    if mistakes:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
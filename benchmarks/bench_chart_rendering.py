@@ -0,0 +1,120 @@
+"""
+Chart throughput of create_bar_chart_artifact with N concurrent sessions.
+
+Each session awaits --charts chart tool calls on one shared event loop while
+a ticker coroutine measures how long the loop stalls. "inline" renders on the
+loop itself, as the tool did before the render pool; "thread" and "process"
+use the pool. Run from the repository root:
+
+    python -m benchmarks.bench_chart_rendering --sessions 1 8 32 --executor thread
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from parent_concierge.config import config
+from parent_concierge.tools import visualizations_tools
+
+BASE_TIME = datetime(2025, 11, 21, 6)
+
+
+class _ArtifactSink:
+    """Minimal stand-in for ToolContext.save_artifact."""
+
+    def __init__(self) -> None:
+        self.saved = 0
+        self.state: Dict[str, Any] = {}
+
+    async def save_artifact(self, filename: str, artifact: Any) -> int:
+        self.saved += 1
+        return self.saved - 1
+
+
+def _logs(session: int, chart: int) -> List[Dict[str, Any]]:
+    # Vary the values per chart so none is served from the chart cache.
+    return [
+        {"event_type": "feed", "timestamp": BASE_TIME.isoformat(), "volume_ml": 90 + session},
+        {
+            "event_type": "nap",
+            "timestamp": (BASE_TIME + timedelta(hours=1)).isoformat(),
+            "duration_minutes": 30 + chart,
+        },
+        {"event_type": "diaper", "timestamp": (BASE_TIME + timedelta(hours=2)).isoformat()},
+    ]
+
+
+async def _inline_chart(logs: List[Dict[str, Any]], sink: _ArtifactSink) -> None:
+    png = visualizations_tools.render_bar_chart_png(visualizations_tools.chart_values(logs))
+    await sink.save_artifact("daily_summary_chart.png", png)
+
+
+async def _session(session: int, charts: int, executor: str) -> None:
+    sink = _ArtifactSink()
+    for chart in range(charts):
+        logs = _logs(session, chart)
+        if executor == "inline":
+            await _inline_chart(logs, sink)
+        else:
+            await visualizations_tools.create_bar_chart_artifact(logs, sink)
+
+
+async def _ticker(stop: asyncio.Event, lags: List[float], interval: float = 0.005) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def _run(sessions: int, charts: int, executor: str) -> Dict[str, Any]:
+    stop = asyncio.Event()
+    lags: List[float] = []
+    ticker = asyncio.create_task(_ticker(stop, lags))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_session(s, charts, executor) for s in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    total = sessions * charts
+    return {
+        "executor": executor,
+        "workers": config.chart_render_workers,
+        "sessions": sessions,
+        "charts": total,
+        "seconds": round(elapsed, 3),
+        "charts_per_second": round(total / elapsed, 1),
+        "max_loop_stall_ms": round(max(lags, default=0.0) * 1000, 1),
+    }
+
+
+def run(sessions: int, charts: int, executor: str) -> Dict[str, Any]:
+    if executor != "inline":
+        config.chart_render_executor = executor
+    visualizations_tools._png_cache.clear()
+    try:
+        return asyncio.run(_run(sessions, charts, executor))
+    finally:
+        visualizations_tools.shutdown_render_executor()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--charts", type=int, default=4, help="Charts per session.")
+    parser.add_argument(
+        "--executor", choices=["inline", "thread", "process"], default="thread"
+    )
+    parser.add_argument("--workers", type=int, default=config.chart_render_workers)
+    args = parser.parse_args()
+
+    config.chart_render_workers = args.workers
+    for sessions in args.sessions:
+        print(run(sessions, args.charts, args.executor))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Write throughput of care_log_store.add_log with N concurrent writers.
+
+Each writer (a process or a thread) logs --events care events into a shared
+temporary care log; afterwards every event is read back to check none were
+lost. Run from the repository root:
+
+    python -m benchmarks.bench_concurrent_writers --writers 1 2 4 8 --backend journal
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+from parent_concierge.config import config
+from parent_concierge.tools import care_log_store, sqlite_store
+
+BASE_TIME = datetime(2025, 11, 21)
+
+
+def _configure(data_dir: Path, backend: str) -> None:
+    config.care_log_backend = backend
+    care_log_store.CARE_LOG_FILE = data_dir / "care_logs.json"
+    sqlite_store.SQLITE_DB_FILE = data_dir / "parent_concierge.db"
+
+
+def _write_events(data_dir: Path, backend: str, writer: int, events: int) -> None:
+    _configure(data_dir, backend)
+    for i in range(events):
+        care_log_store.add_log(
+            event_type="feed",
+            timestamp=(BASE_TIME + timedelta(seconds=i)).isoformat(),
+            volume_ml=90,
+            notes=f"{writer}:{i}",
+        )
+
+
+def run(writers: int, events: int, backend: str, mode: str) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        _configure(data_dir, backend)
+
+        start = time.perf_counter()
+        if mode == "process":
+            procs: List[multiprocessing.Process] = [
+                multiprocessing.Process(
+                    target=_write_events, args=(data_dir, backend, w, events)
+                )
+                for w in range(writers)
+            ]
+            for proc in procs:
+                proc.start()
+            for proc in procs:
+                proc.join()
+        else:
+            with ThreadPoolExecutor(max_workers=writers) as pool:
+                for w in range(writers):
+                    pool.submit(_write_events, data_dir, backend, w, events)
+        elapsed = time.perf_counter() - start
+
+        stored = care_log_store.get_logs_for_day(BASE_TIME.date().isoformat())
+        expected = writers * events
+        return {
+            "backend": backend,
+            "mode": mode,
+            "writers": writers,
+            "events": expected,
+            "lost": expected - len({e["notes"] for e in stored}),
+            "seconds": round(elapsed, 3),
+            "events_per_second": round(expected / elapsed, 1),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--events", type=int, default=200, help="Events per writer.")
+    parser.add_argument(
+        "--backend", choices=["json", "journal", "sqlite"], default="journal"
+    )
+    parser.add_argument("--mode", choices=["process", "thread"], default="process")
+    args = parser.parse_args()
+
+    for writers in args.writers:
+        print(run(writers, args.events, args.backend, args.mode))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Memory per event and time-ordering cost: list of dicts vs EventColumns.
+
+Builds --events synthetic care events (as read back from a JSON shard) and
+measures, with tracemalloc, the bytes each representation holds, then times
+putting each in timestamp order (as range queries do). Run from the repository root:
+
+    python -m benchmarks.bench_event_memory --events 100000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from parent_concierge.tools.event_columns import EventColumns
+
+BASE_TIME = datetime(2025, 1, 1)
+
+
+def _events_json(count: int) -> str:
+    kinds = [
+        ("feed", {"volume_ml": 120}),
+        ("nap", {"duration_minutes": 45}),
+        ("diaper", {}),
+    ]
+    events = []
+    for i in range(count):
+        event_type, extra = kinds[i % 3]
+        events.append(
+            {
+                "event_type": event_type,
+                "timestamp": (BASE_TIME + timedelta(minutes=37 * i)).isoformat(),
+                "volume_ml": extra.get("volume_ml"),
+                "duration_minutes": extra.get("duration_minutes"),
+                "notes": None,
+            }
+        )
+    return json.dumps(events)
+
+
+def _measure(build: Callable[[], Any]) -> Tuple[Any, int]:
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def _time(fn: Callable[[], Any], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(count: int) -> Dict[str, Any]:
+    raw = _events_json(count)
+    # Parse outside the measurement so only the retained structure counts.
+    parsed: List[Dict[str, Any]] = json.loads(raw)
+
+    dicts, dict_bytes = _measure(lambda: json.loads(raw))
+    columns, column_bytes = _measure(lambda: EventColumns.from_events(parsed))
+
+    return {
+        "events": count,
+        "dict_bytes_per_event": round(dict_bytes / count, 1),
+        "column_bytes_per_event": round(column_bytes / count, 1),
+        "memory_ratio": round(dict_bytes / column_bytes, 1),
+        "dict_sort_ms": round(
+            _time(lambda: sorted(dicts, key=lambda e: e["timestamp"])) * 1000, 2
+        ),
+        "column_sort_ms": round(_time(columns.time_order) * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 100000])
+    args = parser.parse_args()
+
+    for count in args.events:
+        print(run(count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Connections opened and turn latency: a client per agent vs the shared pool.
+
+Starts a local HTTP stand-in for the Gemini API that counts the connections
+it accepts and delays each new one by --handshake-ms (standing in for the
+TCP+TLS setup a real endpoint costs). Then plays --turns summary turns,
+each the hop sequence of the daily summary pipeline (orchestrator, fetcher,
+three parallel team agents, output agent, orchestrator), twice: once with a
+google-genai Client per agent as plain ADK Gemini objects build them, once
+with every agent on config.genai_clients. Run from the repository root:
+
+    python -m benchmarks.bench_genai_pool --turns 20 --handshake-ms 40
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from google.genai import Client, types
+
+from parent_concierge.config import GenAiClientRegistry
+
+MODEL = "gemini-2.5-flash"
+API_KEY = "bench"
+
+# One summary turn: sequential hops, agents inside a hop run concurrently.
+TURN = [
+    ["parent_concierge_agent"],
+    ["llm_care_event_fetcher"],
+    ["compute_stats_agent", "visualization_agent", "narrative_summary_agent"],
+    ["summary_output_agent"],
+    ["parent_concierge_agent"],
+]
+
+RESPONSE = json.dumps(
+    {
+        "candidates": [
+            {
+                "content": {"role": "model", "parts": [{"text": "ok"}]},
+                "finishReason": "STOP",
+            }
+        ],
+        "usageMetadata": {
+            "promptTokenCount": 10,
+            "candidatesTokenCount": 1,
+            "totalTokenCount": 11,
+        },
+    }
+).encode()
+
+
+class StandIn:
+    """Minimal keep-alive HTTP/1.1 server answering every POST with RESPONSE."""
+
+    def __init__(self, handshake_s: float, latency_s: float) -> None:
+        self.handshake_s = handshake_s
+        self.latency_s = latency_s
+        self.connections = 0
+        self.requests = 0
+        self.server: Any = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(self.handshake_s)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+                self.requests += 1
+                await asyncio.sleep(self.latency_s)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(RESPONSE)}\r\n\r\n".encode()
+                    + RESPONSE
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _play(turns: int, client_for: Callable[[str], Client]) -> List[float]:
+    latencies = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        for hop in TURN:
+            await asyncio.gather(
+                *(
+                    client_for(agent).aio.models.generate_content(model=MODEL, contents="hi")
+                    for agent in hop
+                )
+            )
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def _run_mode(mode: str, turns: int, handshake_s: float, latency_s: float) -> Dict[str, Any]:
+    stand_in = StandIn(handshake_s, latency_s)
+    base_url = await stand_in.start()
+    http_options = types.HttpOptions(base_url=base_url)
+
+    if mode == "per-agent":
+        clients: Dict[str, Client] = {}
+
+        def client_for(agent: str) -> Client:
+            if agent not in clients:
+                clients[agent] = Client(api_key=API_KEY, http_options=http_options)
+            return clients[agent]
+
+        latencies = await _play(turns, client_for)
+        for client in clients.values():
+            await client.aio.aclose()
+    else:
+        registry = GenAiClientRegistry()
+        latencies = await _play(
+            turns, lambda agent: registry.get(base_url=base_url, api_key=API_KEY)
+        )
+        await registry.aclose()
+
+    await stand_in.stop()
+    cold = latencies[0]
+    latencies.sort()
+    return {
+        "mode": mode,
+        "turns": turns,
+        "requests": stand_in.requests,
+        "connections": stand_in.connections,
+        "cold_turn_ms": round(cold * 1000, 1),
+        "median_turn_ms": round(latencies[len(latencies) // 2] * 1000, 1),
+        "total_s": round(sum(latencies), 2),
+    }
+
+
+def run(mode: str, turns: int, handshake_ms: float, latency_ms: float) -> Dict[str, Any]:
+    return asyncio.run(_run_mode(mode, turns, handshake_ms / 1000, latency_ms / 1000))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--handshake-ms", type=float, default=40.0)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    for mode in ("per-agent", "pooled"):
+        print(run(mode, args.turns, args.handshake_ms, args.latency_ms))
+
+
+if __name__ == "__main__":
+    main()
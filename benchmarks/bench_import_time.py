@@ -0,0 +1,76 @@
+"""
+Import-time budget for the agent package.
+
+Imports parent_concierge.parent_concierge_agent in a fresh interpreter under
+`python -X importtime`, prints the total and the slowest modules, and exits
+non-zero if the import exceeds --budget-ms or pulled in a module listed in
+--forbid (matplotlib by default; it is loaded on the first chart request).
+Run from the repository root:
+
+    python -m benchmarks.bench_import_time --budget-ms 15000
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+TARGET = "parent_concierge.parent_concierge_agent"
+
+# "import time:  self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(target: str = TARGET) -> Tuple[int, List[Tuple[str, int, int]]]:
+    """(total microseconds, [(module, self_us, cumulative_us), ...]) for one import."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: List[Tuple[str, int, int]] = []
+    total = 0
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append((name, int(self_us), int(cumulative_us)))
+        if len(indent) == 1:
+            # Top-level entries; their cumulative times add up to the whole import.
+            total += int(cumulative_us)
+    return total, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target", default=TARGET)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--forbid", nargs="*", default=["matplotlib"])
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    total, modules = measure(args.target)
+    top_level: Dict[str, int] = {}
+    for name, self_us, _ in modules:
+        root = name.split(".")[0]
+        top_level[root] = top_level.get(root, 0) + self_us
+
+    print(f"{args.target}: {total / 1000:.1f} ms")
+    for root, self_us in sorted(top_level.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"  {root:<30} {self_us / 1000:8.1f} ms")
+
+    failures = [
+        f"imports {name}" for name in args.forbid if name in top_level
+    ]
+    if args.budget_ms is not None and total / 1000 > args.budget_ms:
+        failures.append(f"over budget ({total / 1000:.1f} ms > {args.budget_ms} ms)")
+    if failures:
+        print("FAIL: " + "; ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
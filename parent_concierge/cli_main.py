@@ -1,6 +1,7 @@
 # parent_concierge/cli_main.py
 
 import asyncio
+import os
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -11,13 +12,20 @@ from google.adk.plugins.logging_plugin import LoggingPlugin
 from google.genai import types
 from google.adk.artifacts import InMemoryArtifactService
 
+from parent_concierge.config import genai_clients
+from parent_concierge.metrics_plugin import LatencyMetricsPlugin
 from parent_concierge.parent_concierge_agent import root_agent
+from parent_concierge.rate_limiter import ModelRateLimitPlugin
+from parent_concierge.resilience import TurnDeadlinePlugin
 
 
 # ---- Constants ----
 APP_NAME = "parent_concierge"
-USER_ID = "dev-user-1"
+USER_ID = "dev-user-1"  # Override with PARENT_CONCIERGE_USER_ID.
 SESSION_ID = "local-dev-session-1"
+# Set to a file path to record per-agent/per-tool latency as JSON lines; the
+# Prometheus text totals are written next to it (<path>.prom) on exit.
+METRICS_ENV = "PARENT_CONCIERGE_METRICS_FILE"
 
 
 def build_user_message(text: str) -> types.Content:
@@ -32,21 +40,31 @@ async def chat_loop() -> None:
     # Set up session service and create a session (async)
     session_service = InMemorySessionService()
     artifact_service = InMemoryArtifactService()
+    user_id = os.getenv("PARENT_CONCIERGE_USER_ID", USER_ID)
 
     await session_service.create_session(
         app_name=APP_NAME,
-        user_id=USER_ID,
+        user_id=user_id,
         session_id=SESSION_ID,
     )
 
-    # Set up logging plugin + runner
+    # Set up logging/metrics/deadline/rate-limit plugins + runner
     logging_plugin = LoggingPlugin()
+    metrics_file = os.getenv(METRICS_ENV)
+    metrics_plugin = LatencyMetricsPlugin(
+        jsonl_path=Path(metrics_file) if metrics_file else None
+    )
 
     runner = Runner(
         agent=root_agent,
         app_name=APP_NAME,
         session_service=session_service,
-        plugins=[logging_plugin],
+        plugins=[
+            logging_plugin,
+            metrics_plugin,
+            TurnDeadlinePlugin(),
+            ModelRateLimitPlugin(),
+        ],
         artifact_service=artifact_service,
     )
 
@@ -71,7 +89,7 @@ async def chat_loop() -> None:
             # the terminal, while final_text only captures the assistant's last
             # message for a clean summary printout.
             async for event in runner.run_async(
-                user_id=USER_ID,
+                user_id=user_id,
                 session_id=SESSION_ID,
                 new_message=user_message,
             ):
@@ -85,7 +103,11 @@ async def chat_loop() -> None:
                 print("Concierge: [no text response]\n")
 
     finally:
+        if metrics_file:
+            metrics_plugin.write_prometheus(Path(f"{metrics_file}.prom"))
+            metrics_plugin.close()
         await runner.close()
+        await genai_clients.aclose()
 
 
 def main() -> None:
@@ -1,25 +1,190 @@
+import asyncio
+import importlib.util
+import logging
 from dataclasses import dataclass
-from google.genai import types
+from typing import Any, Dict, Optional, Set, Tuple
+
+import httpx
+from google.adk.models.google_llm import Gemini
+from google.genai import Client, types
 
 
 @dataclass
 class ConciergeConfiguration:
-    """Configuration for ai models.
+    """Configuration for ai models and local storage.
 
     Attributes:
         worker_model (str): Model for working/generation tasks.
+        care_log_backend (str): Storage mode for care events. "json" rewrites
+            the pretty-printed array on every write; "journal" appends one
+            line per event to a JSONL journal and folds it into the array
+            snapshot during compaction; "sqlite" stores events in
+            tools.sqlite_store.SQLITE_DB_FILE.
+        profile_backend (str): Storage for the baby profile, "json" or "sqlite".
+        multi_tenant (bool): Keep each ADK user's profile and care log in
+            their own files under data/users/<user_id>/ instead of the
+            shared data/*.json files.
+        stats_backend (str): How the summary pipeline computes day_stats:
+            "local" aggregates in Python, "llm" asks the worker model to do
+            it with the built-in code executor.
+        summary_output_backend (str): How the final summary object is built:
+            "template" merges day_summary, day_stats and the chart id with a
+            fixed template; "llm" has the worker model polish the wording.
+        chart_render_executor (str): Where summary charts are drawn off the
+            event loop: "thread" (default) or "process" for a process pool
+            that renders in parallel without sharing the GIL.
+        chart_render_workers (int): Size of the chart render pool.
+        turn_latency_budget_s (float): Seconds one user turn may spend on
+            model calls, retries included, across the whole agent graph
+            (see resilience.DeadlineRetryLlm).
+        hedge_model_calls (bool): Send a duplicate of a model call that is
+            still running after the recent hedge_quantile latency and use
+            whichever answers first.
+        hedge_quantile (float): Latency quantile that triggers a hedge.
+        model_requests_per_minute (int): Process-wide cap on model calls per
+            minute (see rate_limiter); 0 (the default) disables it. Set it
+            to your API quota, e.g. 60.
+        model_tokens_per_minute (int): Process-wide cap on model tokens
+            (input plus output) per minute; 0 (the default) disables it.
+        http_max_connections (int): Size of the connection pool shared by
+            every agent's model (see genai_clients).
+        http_max_keepalive (int): Idle connections kept open in that pool.
+        http_keepalive_expiry_s (float): Seconds an idle connection stays open.
+        http2 (bool): Use HTTP/2 when the h2 package is installed, so
+            concurrent calls share one connection.
+        intent_router_threshold (float): Confidence the local intent
+            classifier needs before the root router sends a message straight
+            to care_event_agent or daily_summary_agent instead of the LLM
+            orchestrator. Only rule answers (confidence 1) are routed, as the
+            classifier model is not calibrated; above 1 sends everything to
+            the orchestrator.
     """
 
     worker_model: str = "gemini-2.5-flash"
+    care_log_backend: str = "json"
+    profile_backend: str = "json"
+    multi_tenant: bool = False
+    stats_backend: str = "local"
+    summary_output_backend: str = "template"
+    chart_render_executor: str = "thread"
+    chart_render_workers: int = 4
+    turn_latency_budget_s: float = 60.0
+    hedge_model_calls: bool = False
+    hedge_quantile: float = 0.95
+    model_requests_per_minute: int = 0
+    model_tokens_per_minute: int = 0
+    http_max_connections: int = 20
+    http_max_keepalive: int = 10
+    http_keepalive_expiry_s: float = 60.0
+    http2: bool = True
+    intent_router_threshold: float = 0.8
 
 
 retry_config = types.HttpRetryOptions(
-    # Backoff tuned for transient Google LLM rate-limit/server responses so
-    # retries smooth over occasional 429/5xx errors without long waits.
-    attempts=5,
-    exp_base=7,
+    # Retries for transient Google LLM rate-limit/server responses, applied by
+    # resilience.DeadlineRetryLlm: full-jitter backoff of at most 1, 2, 4 s,
+    # never sleeping past the turn's latency budget.
+    attempts=4,
+    exp_base=2,
     initial_delay=1,
+    max_delay=8,
     http_status_codes=[429, 500, 503, 504],
 )
 
 config = ConciergeConfiguration()
+
+logger = logging.getLogger(__name__)
+
+
+async def _aclose_pool(pool: httpx.AsyncClient) -> None:
+    try:
+        await pool.aclose()
+    except RuntimeError:
+        # Its connections belong to an event loop that has been closed and
+        # can't run their shutdown; the sockets go with the garbage collector.
+        logger.debug("Closed a genai pool whose event loop was already closed")
+
+
+class GenAiClientRegistry:
+    """
+    One google-genai Client per process (and base URL, API key and headers),
+    shared by every agent's model.
+
+    Each ADK Gemini object otherwise builds its own Client with its own
+    connection pool, so every hop of the summary pipeline opens a new
+    connection and pays a fresh TLS handshake. The shared client has a
+    bounded keep-alive httpx pool, HTTP/2 where available. httpx pools
+    belong to one event loop, so a loop change gets a fresh client and the
+    replaced pool is closed: on its own loop if that is still running
+    (another thread), otherwise on the current one.
+    """
+
+    def __init__(self) -> None:
+        # (base_url, api_key, headers) -> (event loop, client, pool)
+        self._clients: Dict[Tuple, Tuple[Any, Client, httpx.AsyncClient]] = {}
+        # Keeps pool-closing tasks alive until they finish.
+        self._closing: Set["asyncio.Task[None]"] = set()
+
+    def get(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ) -> Client:
+        try:
+            loop: Any = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        key = (base_url, api_key, tuple(sorted((headers or {}).items())))
+        entry = self._clients.get(key)
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+        if entry is not None:
+            self._close_replaced(entry[0], entry[2], loop)
+
+        pool = httpx.AsyncClient(
+            http2=config.http2 and importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=config.http_max_connections,
+                max_keepalive_connections=config.http_max_keepalive,
+                keepalive_expiry=config.http_keepalive_expiry_s,
+            ),
+            timeout=None,  # the per-turn budget bounds calls instead
+        )
+        client = Client(
+            api_key=api_key,
+            http_options=types.HttpOptions(
+                headers=headers, base_url=base_url, httpx_async_client=pool
+            ),
+        )
+        self._clients[key] = (loop, client, pool)
+        return client
+
+    def _close_replaced(self, old_loop: Any, pool: httpx.AsyncClient, loop: Any) -> None:
+        if old_loop is not None and old_loop.is_running():
+            asyncio.run_coroutine_threadsafe(_aclose_pool(pool), old_loop)
+        elif loop is not None:
+            task = loop.create_task(_aclose_pool(pool))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        else:
+            asyncio.run(_aclose_pool(pool))
+
+    async def aclose(self) -> None:
+        """Close the pooled connections of every client made on this loop."""
+        loop = asyncio.get_running_loop()
+        for key, (client_loop, _, pool) in list(self._clients.items()):
+            if client_loop is loop:
+                del self._clients[key]
+                await pool.aclose()
+
+
+genai_clients = GenAiClientRegistry()
+
+
+class PooledGemini(Gemini):
+    """Gemini model that uses the process-wide client from genai_clients."""
+
+    @property
+    def api_client(self) -> Client:
+        return genai_clients.get(headers=self._tracking_headers)
@@ -0,0 +1,332 @@
+import contextvars
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, TextIO, Tuple
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+
+# Per-agent and per-tool latency/token metrics for a Runner.
+#
+# Every finished span (a run, an agent, a model call, a tool call) becomes
+# one record, optionally appended to a JSON lines file, and is folded into
+# running totals that prometheus_text() renders in the Prometheus text
+# exposition format. Only the most recent records stay in memory, and the
+# file is written through one buffered handle flushed at the end of each
+# run, so a long-running server neither grows nor blocks on every span.
+#
+# Retries happen inside the model (resilience.DeadlineRetryLlm, or the
+# google-genai client's own retry options) and never reach ADK callbacks;
+# both log "Retrying ..." before each backoff sleep (and the wrapper
+# "Hedging ..." when it sends a duplicate), so a log handler counts those
+# against the model call that is current in the calling task.
+
+GENAI_CLIENT_LOGGER = "google_genai._api_client"
+RETRY_LOGGERS = (GENAI_CLIENT_LOGGER, "parent_concierge.resilience")
+METRIC_PREFIX = "parent_concierge"
+# Records kept in memory (LatencyMetricsPlugin.records).
+RECENT_RECORDS = 1000
+
+TOKEN_FIELDS = {
+    "prompt": "prompt_token_count",
+    "candidates": "candidates_token_count",
+    "thoughts": "thoughts_token_count",
+    "cached": "cached_content_token_count",
+}
+
+_current_model_call: contextvars.ContextVar[Optional[Dict[str, Any]]] = (
+    contextvars.ContextVar("current_model_call", default=None)
+)
+
+
+class _RetryCounter(logging.Handler):
+    def emit(self, record: logging.LogRecord) -> None:
+        call = _current_model_call.get()
+        if call is None:
+            return
+        if str(record.msg).startswith("Retrying"):
+            call["retries"] += 1
+        elif str(record.msg).startswith("Hedging"):
+            call["hedges"] += 1
+
+
+_retry_counter = _RetryCounter(level=logging.INFO)
+
+
+def _install_retry_counter() -> None:
+    for name in RETRY_LOGGERS:
+        logger = logging.getLogger(name)
+        if _retry_counter not in logger.handlers:
+            logger.addHandler(_retry_counter)
+        if not logger.isEnabledFor(logging.INFO):
+            logger.setLevel(logging.INFO)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class LatencyMetricsPlugin(BasePlugin):
+    """
+    Record wall time, model latency, retries, tool durations and token counts
+    per agent and per tool.
+
+    Args:
+        jsonl_path: If set, each finished span is appended to this file as
+            one JSON object per line. Call close() when done with the plugin.
+    """
+
+    def __init__(
+        self, name: str = "latency_metrics", jsonl_path: Optional[Path] = None
+    ) -> None:
+        super().__init__(name)
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self.records: Deque[Dict[str, Any]] = deque(maxlen=RECENT_RECORDS)
+        self._jsonl: Optional[TextIO] = None
+        # (metric, ((label, value), ...)) -> running total
+        self.totals: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = (
+            defaultdict(float)
+        )
+        self._started: Dict[Tuple[Any, ...], float] = {}
+        self._model_calls: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        _install_retry_counter()
+
+    # --- recording ---
+
+    def _add(self, metric: str, value: float, **labels: str) -> None:
+        self.totals[(metric, tuple(sorted(labels.items())))] += value
+
+    def _observe(self, metric: str, seconds: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        self.totals[(f"{metric}_seconds_sum", key)] += seconds
+        self.totals[(f"{metric}_seconds_count", key)] += 1
+        peak = (f"{metric}_seconds_max", key)
+        self.totals[peak] = max(self.totals[peak], seconds)
+
+    def _emit(self, record: Dict[str, Any]) -> None:
+        record = {"ts": round(time.time(), 3), **record}
+        self.records.append(record)
+        if self.jsonl_path is not None:
+            if self._jsonl is None:
+                self._jsonl = self.jsonl_path.open("a", encoding="utf-8")
+            self._jsonl.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def flush(self) -> None:
+        """Push buffered JSON lines to the file."""
+        if self._jsonl is not None:
+            self._jsonl.flush()
+
+    def close(self) -> None:
+        """Flush and close the JSON lines file; it reopens on the next span."""
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
+
+    def _elapsed(self, key: Tuple[Any, ...]) -> Optional[float]:
+        start = self._started.pop(key, None)
+        return None if start is None else time.perf_counter() - start
+
+    # --- runs and agents ---
+
+    async def before_run_callback(
+        self, *, invocation_context: InvocationContext
+    ) -> None:
+        self._started[("run", invocation_context.invocation_id)] = time.perf_counter()
+
+    async def after_run_callback(
+        self, *, invocation_context: InvocationContext
+    ) -> None:
+        seconds = self._elapsed(("run", invocation_context.invocation_id))
+        if seconds is None:
+            return
+        agent = invocation_context.agent.name
+        self._observe("run", seconds, agent=agent)
+        self._emit(
+            {
+                "kind": "run",
+                "invocation_id": invocation_context.invocation_id,
+                "agent": agent,
+                "duration_ms": round(seconds * 1000, 2),
+            }
+        )
+        self.flush()
+
+    async def before_agent_callback(
+        self, *, agent: BaseAgent, callback_context: CallbackContext
+    ) -> None:
+        key = ("agent", callback_context.invocation_id, agent.name)
+        self._started[key] = time.perf_counter()
+
+    async def after_agent_callback(
+        self, *, agent: BaseAgent, callback_context: CallbackContext
+    ) -> None:
+        seconds = self._elapsed(
+            ("agent", callback_context.invocation_id, agent.name)
+        )
+        if seconds is None:
+            return
+        self._observe("agent", seconds, agent=agent.name)
+        self._emit(
+            {
+                "kind": "agent",
+                "invocation_id": callback_context.invocation_id,
+                "agent": agent.name,
+                "duration_ms": round(seconds * 1000, 2),
+            }
+        )
+
+    # --- model calls ---
+
+    def _model_key(self, callback_context: CallbackContext) -> Tuple[Any, ...]:
+        # Agent names are unique within the tree, so this tells parallel
+        # branches apart too.
+        return (callback_context.invocation_id, callback_context.agent_name)
+
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> None:
+        call = {
+            "start": time.perf_counter(),
+            "retries": 0,
+            "hedges": 0,
+            "model": llm_request.model,
+        }
+        self._model_calls[self._model_key(callback_context)] = call
+        _current_model_call.set(call)
+
+    def _finish_model_call(
+        self,
+        callback_context: CallbackContext,
+        llm_response: Optional[LlmResponse],
+        error: Optional[Exception],
+    ) -> None:
+        call = self._model_calls.pop(self._model_key(callback_context), None)
+        _current_model_call.set(None)
+        if call is None:
+            return
+        seconds = time.perf_counter() - call["start"]
+        agent = callback_context.agent_name
+        self._observe("model", seconds, agent=agent)
+        self._add("model_retries_total", call["retries"], agent=agent)
+        self._add("model_hedges_total", call["hedges"], agent=agent)
+
+        tokens: Dict[str, int] = {}
+        usage = llm_response.usage_metadata if llm_response else None
+        if usage is not None:
+            for kind, field in TOKEN_FIELDS.items():
+                count = getattr(usage, field, None) or 0
+                tokens[kind] = count
+                self._add("model_tokens_total", count, agent=agent, type=kind)
+
+        record = {
+            "kind": "model",
+            "invocation_id": callback_context.invocation_id,
+            "agent": agent,
+            "model": call["model"],
+            "duration_ms": round(seconds * 1000, 2),
+            "retries": call["retries"],
+            "hedges": call["hedges"],
+            "tokens": tokens,
+        }
+        if error is not None:
+            self._add("model_errors_total", 1, agent=agent)
+            record["error"] = type(error).__name__
+        self._emit(record)
+
+    async def after_model_callback(
+        self, *, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> None:
+        if llm_response.partial:
+            return
+        self._finish_model_call(callback_context, llm_response, None)
+
+    async def on_model_error_callback(
+        self,
+        *,
+        callback_context: CallbackContext,
+        llm_request: LlmRequest,
+        error: Exception,
+    ) -> None:
+        self._finish_model_call(callback_context, None, error)
+
+    # --- tool calls ---
+
+    def _tool_key(self, tool: BaseTool, tool_context: ToolContext) -> Tuple[Any, ...]:
+        return ("tool", tool_context.invocation_id, tool_context.function_call_id, tool.name)
+
+    async def before_tool_callback(
+        self, *, tool: BaseTool, tool_args: Dict[str, Any], tool_context: ToolContext
+    ) -> None:
+        self._started[self._tool_key(tool, tool_context)] = time.perf_counter()
+
+    def _finish_tool_call(
+        self, tool: BaseTool, tool_context: ToolContext, error: Optional[Exception]
+    ) -> None:
+        seconds = self._elapsed(self._tool_key(tool, tool_context))
+        if seconds is None:
+            return
+        agent = tool_context.agent_name
+        self._observe("tool", seconds, tool=tool.name, agent=agent)
+        record = {
+            "kind": "tool",
+            "invocation_id": tool_context.invocation_id,
+            "agent": agent,
+            "tool": tool.name,
+            "duration_ms": round(seconds * 1000, 2),
+        }
+        if error is not None:
+            self._add("tool_errors_total", 1, tool=tool.name, agent=agent)
+            record["error"] = type(error).__name__
+        self._emit(record)
+
+    async def after_tool_callback(
+        self,
+        *,
+        tool: BaseTool,
+        tool_args: Dict[str, Any],
+        tool_context: ToolContext,
+        result: Dict[str, Any],
+    ) -> None:
+        self._finish_tool_call(tool, tool_context, None)
+
+    async def on_tool_error_callback(
+        self,
+        *,
+        tool: BaseTool,
+        tool_args: Dict[str, Any],
+        tool_context: ToolContext,
+        error: Exception,
+    ) -> None:
+        self._finish_tool_call(tool, tool_context, error)
+
+    # --- export ---
+
+    def prometheus_text(self) -> str:
+        """Running totals in the Prometheus text exposition format."""
+        lines: List[str] = []
+        by_metric: Dict[str, List[Tuple[Tuple[Tuple[str, str], ...], float]]] = (
+            defaultdict(list)
+        )
+        for (metric, labels), value in self.totals.items():
+            by_metric[metric].append((labels, value))
+
+        for metric in sorted(by_metric):
+            name = f"{METRIC_PREFIX}_{metric}"
+            kind = "counter" if metric.endswith(("_total", "_count", "_sum")) else "gauge"
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in sorted(by_metric[metric]):
+                rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                lines.append(f"{name}{{{rendered}}} {round(value, 6)!r}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path) -> None:
+        Path(path).write_text(self.prometheus_text(), encoding="utf-8")
@@ -0,0 +1,82 @@
+# parent_concierge/migrate_to_sqlite.py
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from parent_concierge.tools import baby_profile_store, care_log_store, sqlite_store
+
+
+def migrate(replace: bool = False, user_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Import the JSON care log (snapshot plus any journal) and profile into SQLite.
+
+    Args:
+        replace: Wipe the SQLite tables first. Without it, migrating into a
+            database that already holds events is refused so a second run
+            cannot duplicate the history.
+        user_id: Migrate this user's files when config.multi_tenant is on;
+            None migrates the shared files.
+
+    Returns:
+        { "status": "success", "events": <int>, "profile": bool }
+        or { "status": "error", "message": str }
+    """
+    if replace:
+        sqlite_store.clear(user_id)
+    elif sqlite_store.count_events(user_id):
+        return {
+            "status": "error",
+            "message": f"{sqlite_store.SQLITE_DB_FILE} already has care events; "
+            "pass --replace to overwrite them.",
+        }
+
+    events = care_log_store._load_events(user_id)
+    inserted = sqlite_store.insert_events(events, user_id)
+
+    profile = None
+    profile_file = baby_profile_store._profile_file(user_id)
+    if profile_file.exists():
+        raw = json.loads(profile_file.read_text(encoding="utf-8"))
+        profile = raw.get("profile")
+    if profile:
+        sqlite_store.store_profile(profile, user_id)
+
+    return {"status": "success", "events": inserted, "profile": bool(profile)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Import data/*.json into the SQLite storage backend.",
+    )
+    parser.add_argument("--db", type=Path, default=sqlite_store.SQLITE_DB_FILE)
+    parser.add_argument(
+        "--care-logs", type=Path, default=care_log_store.CARE_LOG_FILE
+    )
+    parser.add_argument(
+        "--profiles", type=Path, default=baby_profile_store.PROFILE_FILE
+    )
+    parser.add_argument(
+        "--user-id",
+        help="With config.multi_tenant on, migrate only this user's files.",
+    )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Delete existing SQLite rows before importing.",
+    )
+    args = parser.parse_args()
+
+    sqlite_store.SQLITE_DB_FILE = args.db
+    care_log_store.CARE_LOG_FILE = args.care_logs
+    baby_profile_store.PROFILE_FILE = args.profiles
+
+    result = migrate(replace=args.replace, user_id=args.user_id)
+    print(json.dumps(result))
+    if result["status"] != "success":
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
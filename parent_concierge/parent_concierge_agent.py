@@ -1,20 +1,38 @@
-from google.adk.agents import LlmAgent
-from google.adk.tools import FunctionTool, AgentTool
-from google.adk.models.google_llm import Gemini
+from typing import AsyncGenerator, Optional
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.tools import FunctionTool, AgentTool, ToolContext
+from google.genai import types
 
 from parent_concierge.tools.baby_profile_store import get_profile
+from parent_concierge.tools.care_log_store import get_logs_for_range
+from parent_concierge.tools.care_stats import object_from_state
+from parent_concierge.tools.get_today_date import get_today_date
+from parent_concierge.tools.intent_classifier import classify_intent
+from parent_concierge.tools.summary_template import (
+    NO_EVENTS_MESSAGE,
+    logged_events_sentence,
+)
+from parent_concierge.tools.trend_tools import create_trend_chart_artifact
 
 from parent_concierge.subagents.onboarding_agent import onboarding_agent
 from parent_concierge.subagents.care_event_agent import care_event_agent
 from parent_concierge.subagents.daily_summary_agent import daily_summary_agent
 
-from .config import config, retry_config
+from .config import config
+from .resilience import worker_llm
 
 # --- AGENT DEFINITIONS ---
 
+# Shared by the orchestrator's tool list and the intent router.
+care_event_tool = AgentTool(care_event_agent)
+daily_summary_tool = AgentTool(daily_summary_agent)
+
 parent_concierge_agent = LlmAgent(
     name="parent_concierge_agent",
-    model=Gemini(model=config.worker_model, retry_options=retry_config),
+    model=worker_llm(),
     description="""
         Top-level chat agent that talks to new parents,
         handles onboarding and daily summaries, uses a
@@ -53,7 +71,7 @@ parent_concierge_agent = LlmAgent(
         2. LOGGING CARE EVENTS
         ----------------------
         Sub-agent (used as a tool): `care_event_agent`
-        Tools (behind the scenes): `add_log`
+        Tools (behind the scenes): `add_logs`
 
         - If the user is describing a FEED, NAP, or DIAPER event, for example:
             - “She had 90ml at 7:10”
@@ -61,7 +79,8 @@ parent_concierge_agent = LlmAgent(
             - “Two wet diapers since 6am”
         then:
             - Call `care_event_agent` with the user’s message.
-            - Let `care_event_agent` handle extracting the structured details and calling `add_log`.
+            - Let `care_event_agent` handle extracting the structured details and calling `add_logs`.
+            - Pass the whole message in ONE call, even if it mentions several events.
         - After the tool call returns:
             - Confirm back to the user, in friendly language, what you logged
             (e.g. volume, type of event, approximate time).
@@ -95,7 +114,29 @@ parent_concierge_agent = LlmAgent(
                 - Do NOT show the artifact ID to the user or describe internal IDs.
                 - You may mention at a high level that a visual breakdown is available,
 
-        4. GENERAL QUESTIONS & CHITCHAT
+        4. TRENDS OVER A WEEK OR MONTH
+        ------------------------------
+        Tools: `create_trend_chart_artifact`, `get_logs_for_range`, `get_today_date`
+
+        - If the user asks how things have been going over several days, for example:
+            - “How have feeds been this week?”
+            - “Show me her naps over the last month.”
+        then:
+            - Call `create_trend_chart_artifact` with period "week" or "month"
+              (and end_date only if they name a different end day).
+            - The tool saves a chart of daily feed volume, nap time, diapers and
+              average time between feeds; tell the user a trend chart is available.
+            - Do NOT show filenames or versions to the user.
+
+        - To answer a specific question about several days in words, for example:
+            - “How many wet diapers since Monday?”
+            - “When was her longest nap this week?”
+        call `get_logs_for_range` once with start and end dates (YYYY-MM-DD,
+        use `get_today_date` to anchor "this week") and, if only one kind of
+        event matters, event_types such as ["diaper"]. Answer from the events
+        it returns; do not call it once per day.
+
+        5. GENERAL QUESTIONS & CHITCHAT
         -------------------------------
         - For general questions about logging, routines, or how to use the concierge:
             - Answer directly, in your own words.
@@ -117,11 +158,130 @@ parent_concierge_agent = LlmAgent(
 
     """,
     sub_agents=[onboarding_agent],
+    # The intent router above it is not a conversational agent.
+    disallow_transfer_to_parent=True,
     tools=[
         FunctionTool(get_profile),
-        AgentTool(care_event_agent),
-        AgentTool(daily_summary_agent),
+        care_event_tool,
+        daily_summary_tool,
+        FunctionTool(create_trend_chart_artifact),
+        FunctionTool(get_logs_for_range),
+        FunctionTool(get_today_date),
     ],
 )
 
-root_agent = parent_concierge_agent
+
+
+def _log_reply(text: str, tool_context: ToolContext) -> str:
+    # What add_logs saved, not a fresh parse of the text: relative times
+    # would be resolved against a later clock.
+    events = tool_context.state.get("care_event_logged_events")
+    if events:
+        return logged_events_sentence(events)
+    return str(tool_context.state.get("care_event_log_output") or "Logged.")
+
+
+def _summary_reply(text: str, tool_context: ToolContext) -> str:
+    summary = object_from_state(tool_context.state.get("summary_output"))
+    message = summary.get("message") or NO_EVENTS_MESSAGE
+    if summary.get("visualization_artifact_id"):
+        message += " A chart of the day is available too."
+    return message
+
+
+# intent -> (tool, reply built from the tool's state after it ran)
+ROUTES = {
+    "log": (care_event_tool, _log_reply),
+    "summary": (daily_summary_tool, _summary_reply),
+}
+
+
+def _agent_to_resume(
+    ctx: InvocationContext, orchestrator: BaseAgent
+) -> Optional[BaseAgent]:
+    """
+    The orchestrator's sub-agent the conversation was transferred to, if
+    it replied last and may still hand back (as Runner would resume it).
+    """
+    for event in reversed(ctx.session.events):
+        if event.author == "user":
+            continue
+        agent = orchestrator.find_sub_agent(event.author)
+        if agent is None:
+            return None
+        current = agent
+        while current is not orchestrator:
+            if not isinstance(current, LlmAgent) or current.disallow_transfer_to_parent:
+                return None
+            current = current.parent_agent
+        return agent
+    return None
+
+
+class IntentRouter(BaseAgent):
+    """
+    Send messages whose intent is clear straight to the specialist agent.
+
+    tools.intent_classifier reads the message locally. A "log" the care
+    event parser understood is run through care_event_agent and a "summary"
+    its rules are certain of through daily_summary_agent, via the same
+    AgentTools the orchestrator would call, and the router replies itself;
+    "90ml at 7" needs no model call at all. Anything else, including the
+    classifier model's own guesses, and every message before the baby
+    profile exists goes to the LLM orchestrator sub-agent, as does a
+    conversation an orchestrator sub-agent (onboarding_agent) is still
+    holding.
+    """
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        orchestrator = self.sub_agents[0]
+        resumed = _agent_to_resume(ctx, orchestrator)
+        if resumed is not None:
+            async for event in resumed.run_async(ctx):
+                yield event
+            return
+
+        text = ""
+        if ctx.user_content and ctx.user_content.parts:
+            text = " ".join(p.text for p in ctx.user_content.parts if p.text)
+
+        tool_context = ToolContext(ctx)
+        route = None
+        if text.strip() and get_profile(tool_context)["exists"]:
+            intent, confidence = classify_intent(text)
+            # Only rule answers (confidence 1.0) skip the orchestrator: the
+            # model's "log" or "summary" guess may be a worry or just venting.
+            if confidence < 1.0:
+                intent = "other"
+            if confidence >= config.intent_router_threshold:
+                route = ROUTES.get(intent)
+        if route is None:
+            async for event in orchestrator.run_async(ctx):
+                yield event
+            return
+
+        tool, reply = route
+        await tool.run_async(args={"request": text}, tool_context=tool_context)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(
+                role="model", parts=[types.Part(text=reply(text, tool_context))]
+            ),
+            # Carries the state and artifact changes the tool made.
+            actions=tool_context.actions,
+        )
+
+
+root_agent = IntentRouter(
+    name="intent_router",
+    description="""
+        Entry point. Routes clear care-event logs and day summaries straight
+        to the specialist agents; everything else goes to
+        parent_concierge_agent.
+    """,
+    sub_agents=[parent_concierge_agent],
+)
@@ -0,0 +1,211 @@
+import asyncio
+import contextvars
+import json
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.plugins.base_plugin import BasePlugin
+
+from .config import config
+
+# Process-wide limit on model calls: requests per minute and tokens per
+# minute, as token buckets. Every model call waits here (see
+# resilience.DeadlineRetryLlm) until both buckets have room.
+#
+# Waiters are served strictly by priority ("interactive" calls, such as
+# logging a feed, before "background" ones like the summary pipeline) and,
+# within a priority, round-robin across users so one parent's summary
+# can't starve everyone else's.
+
+PRIORITIES = ("interactive", "background")
+
+# Output tokens assumed for a call before its usage is known.
+DEFAULT_OUTPUT_TOKENS = 256
+CHARS_PER_TOKEN = 4
+
+current_user: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "current_user", default=""
+)
+
+
+class TokenBucket:
+    """Refills at per_minute / 60 units a second, up to `capacity`."""
+
+    def __init__(
+        self,
+        per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = per_minute / 60
+        self.capacity = capacity or per_minute
+        self.level = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if they are now)."""
+        self._refill()
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        """Remove `amount` units; a negative amount gives units back."""
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+
+class ModelRateLimiter:
+    """
+    Priority and per-user fair queue in front of request and token buckets.
+
+    Args:
+        requests_per_minute: Request budget; 0 or None for no request limit.
+        tokens_per_minute: Token budget; 0 or None for no token limit.
+        request_burst, token_burst: Bucket capacities; default to a full
+            minute's budget.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float],
+        tokens_per_minute: Optional[float],
+        request_burst: Optional[float] = None,
+        token_burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.requests = (
+            TokenBucket(requests_per_minute, request_burst, clock)
+            if requests_per_minute
+            else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute, token_burst, clock) if tokens_per_minute else None
+        )
+        # priority -> user -> waiting (future, tokens), users in serving order
+        self._queues: Dict[str, "OrderedDict[str, Deque[Tuple[asyncio.Future, int]]]"] = {
+            priority: OrderedDict() for priority in PRIORITIES
+        }
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.requests is not None or self.tokens is not None
+
+    async def acquire(
+        self, tokens: int, user_id: str = "", priority: str = "interactive"
+    ) -> None:
+        """Wait for one request and `tokens` tokens of budget."""
+        if not self.enabled:
+            return
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Waiters from another (finished) loop can never be woken.
+            self._loop = loop
+            self._timer = None
+            for queue in self._queues.values():
+                queue.clear()
+
+        waiter = loop.create_future()
+        self._queues[priority].setdefault(user_id, deque()).append((waiter, tokens))
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            self._dispatch()  # let the next waiter through
+            raise
+
+    def settle(self, estimated: int, actual: Optional[int]) -> None:
+        """Correct the token bucket once a call's real usage is known."""
+        if self.tokens is not None and actual is not None:
+            self.tokens.take(actual - estimated)
+
+    def _head(self) -> Optional[Tuple[str, str, Deque[Tuple[asyncio.Future, int]]]]:
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            while queue:
+                user_id, waiters = next(iter(queue.items()))
+                while waiters and waiters[0][0].done():
+                    waiters.popleft()  # cancelled while waiting
+                if waiters:
+                    return priority, user_id, waiters
+                del queue[user_id]
+        return None
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while True:
+            head = self._head()
+            if head is None:
+                return
+            priority, user_id, waiters = head
+            waiter, tokens = waiters[0]
+
+            wait = 0.0
+            if self.requests is not None:
+                wait = self.requests.wait_time(1)
+            if self.tokens is not None:
+                tokens = min(tokens, int(self.tokens.capacity))
+                wait = max(wait, self.tokens.wait_time(tokens))
+            if wait > 0:
+                self._timer = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                return
+
+            if self.requests is not None:
+                self.requests.take(1)
+            if self.tokens is not None:
+                self.tokens.take(tokens)
+            waiters.popleft()
+            queue = self._queues[priority]
+            if waiters:
+                queue.move_to_end(user_id)  # round-robin between users
+            else:
+                del queue[user_id]
+            waiter.set_result(None)
+
+
+def estimate_tokens(llm_request: LlmRequest) -> int:
+    """Rough token count of a request before it is sent: input plus output."""
+    chars = 0
+    for content in llm_request.contents or []:
+        for part in content.parts or []:
+            if part.text:
+                chars += len(part.text)
+            elif part.function_call or part.function_response:
+                chars += len(json.dumps(part.model_dump(exclude_none=True), default=str))
+    request_config = llm_request.config
+    if request_config is not None:
+        if isinstance(request_config.system_instruction, str):
+            chars += len(request_config.system_instruction)
+        for tool in request_config.tools or []:
+            chars += len(json.dumps(tool.model_dump(exclude_none=True), default=str))
+    output = (request_config.max_output_tokens if request_config else None) or DEFAULT_OUTPUT_TOKENS
+    return chars // CHARS_PER_TOKEN + output
+
+
+class ModelRateLimitPlugin(BasePlugin):
+    """Tell the limiter which user each model call is for (fair queuing)."""
+
+    def __init__(self, name: str = "model_rate_limit") -> None:
+        super().__init__(name)
+
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> None:
+        current_user.set(callback_context.session.user_id)
+
+
+model_rate_limiter = ModelRateLimiter(
+    config.model_requests_per_minute, config.model_tokens_per_minute
+)
@@ -0,0 +1,51 @@
+# parent_concierge/rebuild_daily_stats.py
+
+import argparse
+import json
+from pathlib import Path
+
+from parent_concierge.config import config
+from parent_concierge.tools import care_log_store, sqlite_store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Check the per-day aggregate table against the raw care events "
+            "and rebuild it."
+        ),
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["json", "journal", "sqlite"],
+        default=config.care_log_backend,
+    )
+    parser.add_argument(
+        "--care-logs", type=Path, default=care_log_store.CARE_LOG_FILE
+    )
+    parser.add_argument("--db", type=Path, default=sqlite_store.SQLITE_DB_FILE)
+    parser.add_argument(
+        "--user-id",
+        help="With config.multi_tenant on, check only this user's data.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report days whose stored stats differ; exit 1 if any do.",
+    )
+    args = parser.parse_args()
+
+    config.care_log_backend = args.backend
+    care_log_store.CARE_LOG_FILE = args.care_logs
+    sqlite_store.SQLITE_DB_FILE = args.db
+
+    result = care_log_store.rebuild_daily_stats(
+        user_id=args.user_id, check_only=args.check
+    )
+    print(json.dumps(result))
+    if args.check and result["mismatched_days"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
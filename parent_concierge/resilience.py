@@ -0,0 +1,259 @@
+import asyncio
+import contextvars
+import logging
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import AsyncGenerator, Deque, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.base_llm_connection import BaseLlmConnection
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+from google.genai import errors, types
+
+from .config import PooledGemini, config, retry_config
+from .rate_limiter import current_user, estimate_tokens, model_rate_limiter
+
+# Deadline-aware retries for model calls.
+#
+# The google-genai client's own retries back off per call with no idea how
+# long the parent has already been waiting, and a sequential summary
+# pipeline stacks them hop after hop. Instead each turn gets one latency
+# budget (config.turn_latency_budget_s, started by TurnDeadlinePlugin) that
+# every model call in the agent graph shares: attempts are cut off when it
+# runs out and the jittered backoff between attempts never sleeps past it.
+#
+# Optionally a call still running after the recent p95 latency gets a
+# hedged duplicate; whichever finishes first wins. Model calls only
+# generate content (tools run after), so a duplicate is safe.
+
+logger = logging.getLogger(__name__)
+
+# Recent successful attempt latencies per model, for the hedge threshold.
+LATENCY_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
+
+_turn_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "turn_deadline", default=None
+)
+# (session id, invocation id) of the run whose budget _turn_deadline holds.
+_turn_owner: contextvars.ContextVar[Optional[Tuple[str, str]]] = contextvars.ContextVar(
+    "turn_owner", default=None
+)
+_latencies: Dict[str, Deque[float]] = {}
+
+
+class TurnDeadlineExceeded(TimeoutError):
+    """The turn's latency budget ran out before the model answered."""
+
+
+class TurnDeadlinePlugin(BasePlugin):
+    """
+    Start a latency budget when a run begins and clear it when it ends.
+
+    Sub-agents and parallel branches inherit the budget. AgentTool runs are
+    nested Runners (with their own session) and the same plugins; they keep
+    the outer turn's budget rather than starting their own. A run in the
+    same session as the budget's owner is a new turn, so a turn that failed
+    before after_run_callback can't pass its spent budget on.
+    """
+
+    def __init__(self, name: str = "turn_deadline", budget_s: Optional[float] = None) -> None:
+        super().__init__(name)
+        self.budget_s = budget_s
+        # invocation id -> (deadline, owner) to restore when that run ends
+        self._previous: Dict[str, Tuple[Optional[float], Optional[Tuple[str, str]]]] = {}
+
+    async def before_run_callback(
+        self, *, invocation_context: InvocationContext
+    ) -> None:
+        session_id = invocation_context.session.id
+        previous = (_turn_deadline.get(), _turn_owner.get())
+        owner = previous[1]
+        if owner is not None and owner[0] == session_id:
+            # An earlier turn of this session failed before its
+            # after_run_callback; drop its budget rather than inherit it.
+            previous = self._previous.pop(owner[1], (None, None))
+        else:
+            remaining = remaining_budget()
+            if remaining is not None and remaining > 0:
+                return  # nested run inside a turn (or turn_deadline block) with a budget
+        budget = config.turn_latency_budget_s if self.budget_s is None else self.budget_s
+        self._previous[invocation_context.invocation_id] = previous
+        _turn_deadline.set(time.monotonic() + budget)
+        _turn_owner.set((session_id, invocation_context.invocation_id))
+
+    async def after_run_callback(
+        self, *, invocation_context: InvocationContext
+    ) -> None:
+        run = (invocation_context.session.id, invocation_context.invocation_id)
+        if _turn_owner.get() != run:
+            return
+        deadline, owner = self._previous.pop(run[1], (None, None))
+        _turn_deadline.set(deadline)
+        _turn_owner.set(owner)
+
+
+@contextmanager
+def turn_deadline(budget_s: float) -> Iterator[None]:
+    """Run a block under a latency budget of budget_s seconds."""
+    token = _turn_deadline.set(time.monotonic() + budget_s)
+    try:
+        yield
+    finally:
+        _turn_deadline.reset(token)
+
+
+def remaining_budget() -> Optional[float]:
+    """Seconds left in the current turn's budget, or None without one."""
+    deadline = _turn_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def hedge_threshold(model: str, quantile: float) -> Optional[float]:
+    """Recent `quantile` latency of `model`, once there are enough samples."""
+    samples = _latencies.get(model)
+    if not samples or len(samples) < HEDGE_MIN_SAMPLES:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+def record_latency(model: str, seconds: float) -> None:
+    _latencies.setdefault(model, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+
+def _retryable(error: BaseException, options: types.HttpRetryOptions) -> bool:
+    if isinstance(error, errors.APIError):
+        return error.code in (options.http_status_codes or ())
+    return isinstance(error, (httpx.TimeoutException, httpx.ConnectError))
+
+
+def backoff_delay(attempt: int, options: types.HttpRetryOptions) -> float:
+    """Full-jitter exponential backoff before retry number `attempt` (1-based)."""
+    cap = (options.initial_delay or 1.0) * (options.exp_base or 2.0) ** (attempt - 1)
+    if options.max_delay:
+        cap = min(cap, options.max_delay)
+    return random.uniform(0, cap)
+
+
+class DeadlineRetryLlm(BaseLlm):
+    """
+    Wrap a model with deadline-aware retries and optional hedged requests.
+
+    Retries follow `retry_options` (attempts, initial_delay, exp_base,
+    max_delay, http_status_codes) but stop once the turn's budget is spent.
+    Each attempt first waits its turn in rate_limiter.model_rate_limiter at
+    `priority`. Streaming calls are passed through with a single attempt.
+    """
+
+    inner: BaseLlm
+    retry_options: types.HttpRetryOptions
+    priority: str = "interactive"
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        if stream:
+            async for response in self.inner.generate_content_async(llm_request, stream=True):
+                yield response
+            return
+
+        attempts = max(1, self.retry_options.attempts or 1)
+        for attempt in range(1, attempts + 1):
+            remaining = remaining_budget()
+            if remaining is not None and remaining <= 0:
+                raise TurnDeadlineExceeded(f"turn budget spent before attempt {attempt}")
+            try:
+                responses = await asyncio.wait_for(self._call(llm_request), remaining)
+            except Exception as e:
+                remaining = remaining_budget()
+                if remaining is not None and remaining <= 0:
+                    raise TurnDeadlineExceeded(
+                        f"turn budget spent during attempt {attempt}"
+                    ) from e
+                if attempt == attempts or not _retryable(e, self.retry_options):
+                    raise
+                delay = backoff_delay(attempt, self.retry_options)
+                if remaining is not None and delay >= remaining:
+                    raise
+                logger.info(
+                    "Retrying %s in %.2f seconds as it raised %r.", self.model, delay, e
+                )
+                await asyncio.sleep(delay)
+                continue
+            for response in responses:
+                yield response
+            return
+
+    async def _attempt(self, llm_request: LlmRequest) -> List[LlmResponse]:
+        estimate = estimate_tokens(llm_request)
+        await model_rate_limiter.acquire(estimate, current_user.get(), self.priority)
+
+        start = time.monotonic()
+        responses = [
+            response
+            async for response in self.inner.generate_content_async(llm_request, stream=False)
+        ]
+        record_latency(self.model, time.monotonic() - start)
+
+        usage = next(
+            (r.usage_metadata for r in reversed(responses) if r.usage_metadata), None
+        )
+        model_rate_limiter.settle(estimate, usage.total_token_count if usage else None)
+        return responses
+
+    async def _call(self, llm_request: LlmRequest) -> List[LlmResponse]:
+        threshold = hedge_threshold(self.model, self.hedge_quantile) if self.hedge else None
+        if threshold is None:
+            return await self._attempt(llm_request)
+
+        tasks = [asyncio.ensure_future(self._attempt(llm_request))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=threshold)
+            if not done:
+                logger.info("Hedging %s after %.2f seconds.", self.model, threshold)
+                tasks.append(
+                    asyncio.ensure_future(self._attempt(llm_request.model_copy(deep=True)))
+                )
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def connect(self, llm_request: LlmRequest) -> BaseLlmConnection:
+        return self.inner.connect(llm_request)
+
+
+def worker_llm(priority: str = "interactive") -> DeadlineRetryLlm:
+    """
+    The worker model every LLM agent uses, wrapped in the retry policy.
+
+    Args:
+        priority: Rate limiter queue: "interactive" for agents a parent is
+            waiting on directly, "background" for the summary pipeline.
+    """
+    return DeadlineRetryLlm(
+        model=config.worker_model,
+        # Retries live in the wrapper; the shared client makes a single attempt.
+        inner=PooledGemini(model=config.worker_model),
+        retry_options=retry_config,
+        priority=priority,
+        hedge=config.hedge_model_calls,
+        hedge_quantile=config.hedge_quantile,
+    )
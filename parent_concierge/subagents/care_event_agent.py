@@ -1,25 +1,32 @@
-from google.adk.agents import LlmAgent
-from google.adk.tools import FunctionTool
-from google.adk.models.google_llm import Gemini
+from typing import AsyncGenerator
 
-from parent_concierge.tools.care_log_store import add_log
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.tools import FunctionTool, ToolContext
+from google.genai import types
+
+from parent_concierge.tools.care_log_store import add_logs
+from parent_concierge.tools.event_parser import parse_care_events
 from parent_concierge.tools.get_today_date import get_today_date
 
-from ..config import config, retry_config
+from ..resilience import worker_llm
 
 # --- AGENT DEFINITIONS ---
 
-care_event_agent = LlmAgent(
-    model=Gemini(model=config.worker_model, retry_options=retry_config),
-    name="care_event_agent",
+llm_care_event_agent = LlmAgent(
+    model=worker_llm(),
+    name="llm_care_event_agent",
     description="""
         This agent interprets user text into structured care events
-        and calls the add_log tool.  
+        and saves them all with one add_logs tool call.
     """,
     instruction="""
         You are the Care Event Agent. Your job is STRICTLY to:
 
-        1. Extract structured care event fields from user text:
+        1. Extract EVERY care event mentioned in the user text (a message may
+        describe several, e.g. "two wet diapers since 6am and a 90ml feed at 7"
+        is three events). For each event extract:
         - event_type: "feed", "nap", or "diaper"
         - timestamp: ISO datetime string (e.g. "2025-11-19T07:10:00")
         - volume_ml: optional integer (for feeds)
@@ -47,11 +54,19 @@ care_event_agent = LlmAgent(
         - Use that date when constructing the timestamp.
         - If no time is provided, assume the current time on yesterday’s date.
 
-        6. After extracting all fields, call the `add_log` tool EXACTLY ONCE
-        with the structured arguments.
+        6. After extracting all events, call the `add_logs` tool EXACTLY ONCE
+        with `events` set to the list of all of them, e.g.
+            [{"event_type": "diaper", "timestamp": "2025-11-19T06:30:00", "notes": "wet"},
+             {"event_type": "diaper", "timestamp": "2025-11-19T06:30:00", "notes": "wet"},
+             {"event_type": "feed", "timestamp": "2025-11-19T07:00:00", "volume_ml": 90}]
+        If a count is given without separate times ("two wet diapers since 6am"),
+        log that many events at the stated time.
 
-        7. After the tool executes successfully, return a specific short phrase
-        confirming the action, such as "Event logged successfully."
+        7. If the tool returns status "error", fix the events it lists and call
+        `add_logs` once more with the whole corrected list (nothing was saved).
+
+        8. After the tool executes successfully, return a specific short phrase
+        confirming the action, such as "3 events logged successfully."
         Do NOT chat, but DO provide this confirmation string.
 
         Rules:
@@ -61,9 +76,63 @@ care_event_agent = LlmAgent(
         - Do NOT give medical advice or interpretation.
         - Do NOT call any tools other than:
             - `get_today_date` (when needed for determining the date)
-            - `add_log` (for saving the event)
+            - `add_logs` (for saving the events)
 
     """,
-    tools=[FunctionTool(add_log), FunctionTool(get_today_date)],
+    tools=[FunctionTool(add_logs), FunctionTool(get_today_date)],
     output_key="care_event_log_output",
 )
+
+
+class ParsedCareEventAgent(BaseAgent):
+    """
+    Log care events without a model call when the message is easy to read.
+
+    Messages in the common shapes ("90ml at 7:10", "nap from 2:15 to 3pm",
+    "wet diaper") are parsed by tools.event_parser and saved with one
+    add_logs call; anything it isn't sure about is handed to the LLM care
+    event agent sub-agent.
+    """
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        text = ""
+        if ctx.user_content and ctx.user_content.parts:
+            text = " ".join(p.text for p in ctx.user_content.parts if p.text)
+
+        events = parse_care_events(text)
+        tool_context = ToolContext(ctx)
+        result = None
+        if events is not None:
+            result = add_logs(events, tool_context=tool_context)
+        if result is None or result.get("status") != "success":
+            async for event in self.sub_agents[0].run_async(ctx):
+                yield event
+            return
+
+        logged = result["logged"]
+        message = f"{logged} event{'' if logged == 1 else 's'} logged successfully."
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=message)]),
+            actions=EventActions(
+                state_delta={
+                    **tool_context.actions.state_delta,
+                    "care_event_log_output": message,
+                }
+            ),
+        )
+
+
+care_event_agent = ParsedCareEventAgent(
+    name="care_event_agent",
+    description="""
+        This agent interprets user text into structured care events
+        and saves them all with one add_logs call. Common phrasings are
+        parsed locally; anything else goes to llm_care_event_agent.
+    """,
+    sub_agents=[llm_care_event_agent],
+)
@@ -1,17 +1,23 @@
-from google.adk.agents import LlmAgent
-from google.adk.tools import FunctionTool
-from google.adk.models.google_llm import Gemini
+import json
+from typing import AsyncGenerator
 
-from ..config import config, retry_config
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.tools import FunctionTool, ToolContext
+from google.genai import types
+
+from ..resilience import worker_llm
 
 from parent_concierge.tools.care_log_store import get_logs_for_day
+from parent_concierge.tools.date_resolver import resolve_day
 from parent_concierge.tools.get_today_date import get_today_date
 
 # --- AGENT DEFINITIONS ---
 
-care_event_fetcher = LlmAgent(
-    model=Gemini(model=config.worker_model, retry_options=retry_config),
-    name="care_event_fetcher",
+llm_care_event_fetcher = LlmAgent(
+    model=worker_llm(priority="background"),
+    name="llm_care_event_fetcher",
     description="""
         Fetch all baby care events (feeds, naps, diapers) for a specific day.
         This agent is the first step of the daily summary pipeline.
@@ -65,3 +71,64 @@ care_event_fetcher = LlmAgent(
     tools=[FunctionTool(get_logs_for_day), FunctionTool(get_today_date)],
     output_key="logs_for_day",
 )
+
+
+class ResolvedDayFetcher(BaseAgent):
+    """
+    Fetch logs_for_day without a model call when the day is easy to read.
+
+    Common phrasings ("today", "yesterday", "12 Nov 2025", "last Tuesday")
+    are resolved by tools.date_resolver and the logs fetched directly; only
+    requests it can't resolve are handed to the LLM fetcher sub-agent.
+    """
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        text = ""
+        if ctx.user_content and ctx.user_content.parts:
+            text = " ".join(p.text for p in ctx.user_content.parts if p.text)
+
+        day = resolve_day(text)
+        if day is None:
+            # Clear a day resolved on an earlier turn: downstream stages only
+            # trust summary_day when it describes this turn's logs_for_day.
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                actions=EventActions(state_delta={"summary_day": None}),
+            )
+            async for event in self.sub_agents[0].run_async(ctx):
+                yield event
+            return
+
+        logs = get_logs_for_day(day, tool_context=ToolContext(ctx))
+
+        # Emit the logs as text as well, so the LLM agents further down the
+        # pipeline see them in the conversation exactly as before.
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(
+                role="model",
+                parts=[types.Part(text=json.dumps(logs, ensure_ascii=False))],
+            ),
+            actions=EventActions(
+                state_delta={"logs_for_day": logs, "summary_day": day}
+            ),
+        )
+
+
+care_event_fetcher = ResolvedDayFetcher(
+    name="care_event_fetcher",
+    description="""
+        Fetch all baby care events (feeds, naps, diapers) for a specific day.
+        Resolves common day phrasings locally and calls get_logs_for_day
+        directly; falls back to llm_care_event_fetcher for anything else.
+
+        Output is provided under the key logs_for_day.
+    """,
+    sub_agents=[llm_care_event_fetcher],
+)
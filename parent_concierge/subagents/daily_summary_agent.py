@@ -1,21 +1,60 @@
+from typing import Any, Dict, Mapping, Optional
+
 from google.adk.agents import SequentialAgent
 
+from parent_concierge.tools.care_stats import is_empty_event_list
+from parent_concierge.tools.summary_template import build_summary_output
+
+from .cached_summary_agent import CachedSummaryAgent
 from .care_event_fetcher import care_event_fetcher
+from .gate_agent import GateAgent
 from .parallel_summary_team import parallel_summary_team
 from .summary_output_agent import summary_output_agent
 
 
+def no_events_summary(state: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+    """Gate check: the canned summary_output for a day with nothing logged."""
+    logs = state.get("logs_for_day")
+    if not is_empty_event_list(logs):
+        return None
+    return {"summary_output": build_summary_output(logs, None, None, None)}
+
+
 # --- AGENT DEFINITIONS ---
 
+cached_summary_stages = CachedSummaryAgent(
+    name="cached_summary_stages",
+    sub_agents=[parallel_summary_team, summary_output_agent],
+    description="""
+        Run parallel_summary_team then summary_output_agent, or replay their
+        cached outputs when the same day's logs were summarised before.
+    """,
+)
+
+gated_summary_stages = GateAgent(
+    name="gated_summary_stages",
+    sub_agents=[cached_summary_stages],
+    checks=[no_events_summary],
+    output_key="summary_output",
+    description="""
+        Answer with the canned "nothing logged" summary_output when
+        logs_for_day is empty; otherwise run cached_summary_stages.
+    """,
+)
+
 daily_summary_agent = SequentialAgent(
     name="daily_summary_agent",
-    sub_agents=[care_event_fetcher, parallel_summary_team, summary_output_agent],
+    sub_agents=[care_event_fetcher, gated_summary_stages],
     description="""
-        Execute the full daily summary pipeline in three ordered steps:
+        Execute the full daily summary pipeline in three ordered steps
+        (steps 2 and 3 are skipped when the day has no logs, and their
+        outputs replayed when the day's logs are unchanged since it was last
+        summarised):
 
         1. care_event_fetcher
         - Interprets the user's request for a summary day (e.g. "today", "yesterday", or a date).
-        - Uses tools like `get_today_date` if needed.
+        - Resolves common phrasings locally; otherwise asks the LLM fetcher,
+          which uses tools like `get_today_date` if needed.
         - Calls `get_logs_for_day` to fetch all events for that day.
         - Produces: logs_for_day
 
@@ -26,7 +65,8 @@ daily_summary_agent = SequentialAgent(
             - narrative_summary   → produces day_summary (natural-language text)
 
         3. summary_output_agent
-        - Combines logs_for_day, day_stats, day_visualization, and day_summary.
+        - Combines logs_for_day, day_stats, day_visualization, and day_summary
+          (with a fixed template by default, or an LLM polish pass).
         - Produces a single final object under the key daily_summary_output:
             {
                 "message": <final summary string>,
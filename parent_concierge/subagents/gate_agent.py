@@ -0,0 +1,54 @@
+import json
+from typing import Any, AsyncGenerator, Callable, Dict, List, Mapping, Optional
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+from pydantic import Field
+
+# A cheap pre-check on session state: None lets the guarded stages run, a
+# state delta answers in their place.
+GateCheck = Callable[[Mapping[str, Any]], Optional[Dict[str, Any]]]
+
+# --- AGENT DEFINITIONS ---
+
+
+class GateAgent(BaseAgent):
+    """
+    Run the sub-agents in order, unless a cheap check can answer for them.
+
+    Each of `checks` looks at the session state before the sub-agents run.
+    The first to return a state delta wins: it is emitted as this agent's
+    event (with the value under `output_key` as the reply text, as the
+    skipped final stage would have replied) and the sub-agents are skipped.
+    """
+
+    checks: List[GateCheck] = Field(default_factory=list)
+    output_key: Optional[str] = None
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        for check in self.checks:
+            delta = check(ctx.session.state)
+            if delta is None:
+                continue
+
+            content = None
+            if self.output_key in delta:
+                value = delta[self.output_key]
+                text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+                content = types.Content(role="model", parts=[types.Part(text=text)])
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                content=content,
+                actions=EventActions(state_delta=delta),
+            )
+            return
+
+        for agent in self.sub_agents:
+            async for event in agent.run_async(ctx):
+                yield event
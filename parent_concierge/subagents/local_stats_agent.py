@@ -0,0 +1,53 @@
+import json
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from parent_concierge.tools.care_stats import compute_day_stats, events_from_state
+
+# --- AGENT DEFINITIONS ---
+
+
+class LocalStatsAgent(BaseAgent):
+    """
+    Deterministic stand-in for the LLM stats agent.
+
+    Reads the events under `input_key`, aggregates them in Python and writes
+    the same day_stats object to `output_key`. The stats are also emitted as
+    JSON text so later LLM stages see them in the conversation, exactly as
+    they would the LLM agent's reply.
+    """
+
+    input_key: str = "logs_for_day"
+    output_key: str = "day_stats"
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        events = events_from_state(ctx.session.state.get(self.input_key))
+        stats = compute_day_stats(events)
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(
+                role="model",
+                parts=[types.Part(text=json.dumps(stats))],
+            ),
+            actions=EventActions(state_delta={self.output_key: stats}),
+        )
+
+
+local_compute_stats = LocalStatsAgent(
+    name="compute_stats",
+    description="""
+        Compute structured, machine-readable statistics for the day’s baby care
+        events in plain Python (no model call).
+        Consumes only logs_for_day.
+        Produces a JSON object under the key day_stats.
+    """,
+)
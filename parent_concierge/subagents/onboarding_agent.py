@@ -1,15 +1,14 @@
 from google.adk.agents import LlmAgent
 from google.adk.tools import FunctionTool
-from google.adk.models.google_llm import Gemini
 
-from ..config import config, retry_config
+from ..resilience import worker_llm
 
 from parent_concierge.tools.baby_profile_store import save_profile
 
 # --- AGENT DEFINITIONS ---
 
 onboarding_agent = LlmAgent(
-    model=Gemini(model=config.worker_model, retry_options=retry_config),
+    model=worker_llm(),
     name="onboarding_agent",
     description="""
         Collects and maintains the baby's 
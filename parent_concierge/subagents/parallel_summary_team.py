@@ -1,15 +1,16 @@
 from google.adk.agents import LlmAgent, ParallelAgent
-from google.adk.models.google_llm import Gemini
 from google.adk.code_executors import BuiltInCodeExecutor
 
 from parent_concierge.tools.visualizations_tools import create_bar_chart_artifact
 
-from ..config import config, retry_config
+from ..config import config
+from ..resilience import worker_llm
+from .local_stats_agent import local_compute_stats
 
 # --- AGENT DEFINITIONS ---
 
-compute_stats = LlmAgent(
-    model=Gemini(model=config.worker_model, retry_options=retry_config),
+llm_compute_stats = LlmAgent(
+    model=worker_llm(priority="background"),
     name="compute_stats",
     description="""
         Compute structured, machine-readable statistics for the day’s baby care events.
@@ -53,9 +54,15 @@ compute_stats = LlmAgent(
     output_key="day_stats",
 )
 
+# Counting and summing needs no model: the local agent writes the same
+# day_stats shape without a Gemini round trip or remote code execution.
+compute_stats = (
+    local_compute_stats if config.stats_backend == "local" else llm_compute_stats
+)
+
 
 create_visualization = LlmAgent(
-    model=Gemini(model=config.worker_model, retry_options=retry_config),
+    model=worker_llm(priority="background"),
     name="create_visualization",
     description="""
         Create an ACTUAL image chart (PNG) of today's baby care activity by
@@ -91,7 +98,7 @@ create_visualization = LlmAgent(
 )
 
 narrative_summary = LlmAgent(
-    model=Gemini(model=config.worker_model, retry_options=retry_config),
+    model=worker_llm(priority="background"),
     name="narrative_summary",
     description="""
         Produce a friendly, concise natural-language summary of the day’s baby care
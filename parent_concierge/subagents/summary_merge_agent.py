@@ -0,0 +1,54 @@
+import json
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from parent_concierge.tools.summary_template import build_summary_output
+
+# --- AGENT DEFINITIONS ---
+
+
+class SummaryMergeAgent(BaseAgent):
+    """
+    Deterministic stand-in for the LLM summary output agent.
+
+    Builds the {message, visualization_artifact_id} object from logs_for_day,
+    day_stats, day_summary and day_visualization with a fixed template and
+    writes it to `output_key`, saving the pipeline's last serial model call.
+    """
+
+    output_key: str = "summary_output"
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        output = build_summary_output(
+            state.get("logs_for_day"),
+            state.get("day_stats"),
+            state.get("day_summary"),
+            state.get("day_visualization"),
+        )
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(
+                role="model",
+                parts=[types.Part(text=json.dumps(output, ensure_ascii=False))],
+            ),
+            actions=EventActions(state_delta={self.output_key: output}),
+        )
+
+
+template_summary_output = SummaryMergeAgent(
+    name="summary_output_agent",
+    description="""
+        Combine the narrative, stats, and visualization artifact into the final
+        daily summary output for the parent using a fixed template (no model call).
+    """,
+)
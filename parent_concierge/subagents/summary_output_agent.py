@@ -1,12 +1,13 @@
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
 
-from ..config import config, retry_config
+from ..config import config
+from ..resilience import worker_llm
+from .summary_merge_agent import template_summary_output
 
 # --- AGENT DEFINITIONS ---
 
-summary_output_agent = LlmAgent(
-    model=Gemini(model=config.worker_model, retry_options=retry_config),
+llm_summary_output_agent = LlmAgent(
+    model=worker_llm(priority="background"),
     name="summary_output_agent",
     description="""
         Combine the narrative, stats, and visualization artifact into a final,
@@ -70,3 +71,11 @@ summary_output_agent = LlmAgent(
     """,
     output_key="summary_output",
 )
+
+# The merge is mostly copying: the template builds the same object without
+# another serial model round trip. "llm" keeps this agent as a polish pass.
+summary_output_agent = (
+    template_summary_output
+    if config.summary_output_backend == "template"
+    else llm_summary_output_agent
+)
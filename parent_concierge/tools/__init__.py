@@ -1,13 +1,17 @@
 from .baby_profile_store import get_profile, save_profile
-from .care_log_store import add_log, get_logs_for_day
+from .care_log_store import add_log, add_logs, get_logs_for_day, get_logs_for_range
 from .get_today_date import get_today_date
+from .trend_tools import create_trend_chart_artifact
 from .visualizations_tools import create_bar_chart_artifact
 
 __all__ = [
     "get_profile",
     "save_profile",
     "add_log",
+    "add_logs",
     "get_logs_for_day",
+    "get_logs_for_range",
     "get_today_date",
     "create_bar_chart_artifact",
+    "create_trend_chart_artifact",
 ]
@@ -1,23 +1,49 @@
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from google.adk.tools import ToolContext
+
+from parent_concierge.config import config
+from parent_concierge.tools import sqlite_store
+from parent_concierge.tools.file_lock import atomic_write_text
+from parent_concierge.tools.read_cache import (
+    LRUCache,
+    bump_write_version,
+    file_signature,
+    write_version,
+)
+from parent_concierge.tools.tenancy import tenant_path, user_id_from_context
 
 PROFILE_FILE = Path("data/profiles.json")
-# Single-profile JSON store that is created on first access; this module does
-# not manage multiple users or require a preexisting file.
+# Single-profile JSON store that is created on first access. With
+# config.multi_tenant enabled each user gets their own copy under
+# data/users/<user>/, chosen from the ADK session's user_id.
+
+# Parsed get_profile results, checked against the file's size/mtime (or the
+# database's data_version) and this process's write version on every read.
+CACHE_MAX_PROFILES = 1024
+_profile_cache = LRUCache(max_entries=CACHE_MAX_PROFILES)
+
 
+def _profile_file(user_id: Optional[str]) -> Path:
+    return tenant_path(PROFILE_FILE, user_id)
 
-def _ensure_file_exists() -> None:
+
+def _ensure_file_exists(profile_file: Path) -> None:
     """Create the JSON file if it doesn't exist."""
-    if not PROFILE_FILE.exists():
-        PROFILE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        PROFILE_FILE.write_text("{}", encoding="utf-8")
+    if not profile_file.exists():
+        profile_file.parent.mkdir(parents=True, exist_ok=True)
+        profile_file.write_text("{}", encoding="utf-8")
 
 
-def get_profile() -> Dict[str, Any]:
+def get_profile(tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
     """
     Tool-friendly getter.
 
+    Args:
+        tool_context: Injected by ADK; selects the user's profile.
+
     Returns:
         {
           "exists": bool,
@@ -30,8 +56,33 @@ def get_profile() -> Dict[str, Any]:
           } | None
         }
     """
-    _ensure_file_exists()
-    raw = json.loads(PROFILE_FILE.read_text(encoding="utf-8"))
+    user_id = user_id_from_context(tool_context)
+    if config.profile_backend == "sqlite":
+        cache_key = sqlite_store.database_file(user_id)
+        validator = (write_version(cache_key), sqlite_store.data_version(user_id))
+    else:
+        cache_key = _profile_file(user_id)
+        _ensure_file_exists(cache_key)
+        validator = (write_version(cache_key), file_signature(cache_key))
+
+    result = _profile_cache.get(cache_key, validator)
+    if result is None:
+        result = _read_profile(user_id)
+        _profile_cache.put(cache_key, result, validator)
+
+    return {
+        "exists": result["exists"],
+        "profile": dict(result["profile"]) if result["profile"] else None,
+    }
+
+
+def _read_profile(user_id: Optional[str]) -> Dict[str, Any]:
+    if config.profile_backend == "sqlite":
+        profile = sqlite_store.load_profile(user_id)
+        return {"exists": profile is not None, "profile": profile}
+
+    profile_file = _profile_file(user_id)
+    raw = json.loads(profile_file.read_text(encoding="utf-8"))
 
     if "profile" not in raw:
         return {"exists": False, "profile": None}
@@ -48,6 +99,7 @@ def save_profile(
     date_of_birth: str,
     feeding_type: str,
     country: str,
+    tool_context: Optional[ToolContext] = None,
 ) -> Dict[str, str]:
     """
     Tool-friendly setter.
@@ -58,12 +110,11 @@ def save_profile(
         date_of_birth: ISO date string, e.g. "2024-08-01".
         feeding_type: "breast", "bottle", or "mixed".
         country: Country code/name.
+        tool_context: Injected by ADK; selects the user's profile.
 
     Returns:
         { "status": "success" }
     """
-    _ensure_file_exists()
-
     profile_dict = {
         "parent_name": parent_name,
         "baby_name": baby_name,
@@ -72,11 +123,18 @@ def save_profile(
         "country": country,
     }
 
+    user_id = user_id_from_context(tool_context)
+    if config.profile_backend == "sqlite":
+        sqlite_store.store_profile(profile_dict, user_id)
+        bump_write_version(sqlite_store.database_file(user_id))
+        return {"status": "success"}
+
+    profile_file = _profile_file(user_id)
+    _ensure_file_exists(profile_file)
+
     data = {"profile": profile_dict}
 
-    PROFILE_FILE.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    atomic_write_text(profile_file, json.dumps(data, indent=2, ensure_ascii=False))
+    bump_write_version(profile_file)
 
     return {"status": "success"}
@@ -1,16 +1,373 @@
+import copy
 import json
+import os
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from datetime import datetime, date as date_cls
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime, date as date_cls, timedelta
+
+from google.adk.tools import ToolContext
+from pydantic import BaseModel
+
+from parent_concierge.config import config
+from parent_concierge.tools import sqlite_store, summary_cache
+from parent_concierge.tools.care_stats import add_event_to_day_stats, empty_day_stats
+from parent_concierge.tools.event_columns import EVENT_FIELDS, EVENT_TYPES, EventColumns
+from parent_concierge.tools.file_lock import (
+    InterProcessLock,
+    atomic_write_text,
+    write_temp_sibling,
+)
+from parent_concierge.tools.read_cache import (
+    LRUCache,
+    bump_write_version,
+    file_signature,
+    write_version,
+)
+from parent_concierge.tools.tenancy import tenant_path, user_id_from_context
 
 CARE_LOG_FILE = Path("data/care_logs.json")
 
+# In "journal" mode the pretty-printed array in CARE_LOG_FILE is only a
+# snapshot; new events are appended to a JSONL journal next to it and folded
+# back into the snapshot once the journal grows past this size.
+JOURNAL_COMPACT_THRESHOLD_BYTES = 1024 * 1024
+
+# Bumped whenever the layout of the day index changes, so indexes written by
+# older code are rebuilt instead of trusted.
+DAY_INDEX_FORMAT = 2
+
+# Parsed events per (care log, day) as compact EventColumns, shared by every
+# session in the process.
+# Entries are checked against the source files' size/mtime and this process's
+# write version, so repeat summaries skip the disk without serving stale data.
+CACHE_MAX_DAYS = 256
+_day_cache = LRUCache(max_entries=CACHE_MAX_DAYS)
+
+
+class _LogLocks:
+    """
+    Locks for one care log file (one tenant), held across threads and processes.
+
+    io guards every read-modify-write and the short file-set transitions
+    (append, journal rotation, snapshot swap) so concurrent writers never lose
+    an event and readers never see one twice or not at all. compaction
+    serialises the slow snapshot rebuilds. Always take compaction before io.
+    """
+
+    def __init__(self, log_file: Path):
+        self.io = InterProcessLock(log_file.with_name(log_file.name + ".lock"))
+        self.compaction = InterProcessLock(
+            log_file.with_name(log_file.name + ".compaction.lock")
+        )
+        self.compaction_thread: Optional[threading.Thread] = None
+
+
+_locks: Dict[Path, _LogLocks] = {}
+_locks_guard = threading.Lock()
+
+
+def _locks_for(log_file: Path) -> _LogLocks:
+    with _locks_guard:
+        locks = _locks.get(log_file)
+        if locks is None:
+            locks = _locks[log_file] = _LogLocks(log_file)
+        return locks
+
+
+def _log_file(user_id: Optional[str]) -> Path:
+    """The care log file holding this user's events."""
+    return tenant_path(CARE_LOG_FILE, user_id)
+
+
+def _journal_file(log_file: Path) -> Path:
+    """Append-only journal of events not yet folded into the snapshot."""
+    return log_file.with_suffix(".jsonl")
+
+
+def _pending_journal_file(log_file: Path) -> Path:
+    """Journal segment that a running (or interrupted) compaction is folding in."""
+    return log_file.with_name(log_file.stem + ".compacting.jsonl")
+
+
+def _day_index_dir(log_file: Path) -> Path:
+    """Directory of per-day shards, one JSONL file per ISO date."""
+    return log_file.with_name(log_file.stem + "_by_day")
 
-def _ensure_file_exists() -> None:
+
+def _day_index_manifest(log_file: Path) -> Path:
+    return _day_index_dir(log_file) / "_manifest.json"
+
+
+def _day_shard_file(log_file: Path, day: date_cls) -> Path:
+    return _day_index_dir(log_file) / f"{day.isoformat()}.jsonl"
+
+
+def _shard_days(log_file: Path, start: date_cls, end: date_cls) -> List[date_cls]:
+    """The days start..end that have a shard (i.e. any events), in order."""
+    days = []
+    for path in _day_index_dir(log_file).glob("*.jsonl"):
+        try:
+            day = date_cls.fromisoformat(path.stem)
+        except ValueError:
+            continue
+        if start <= day <= end:
+            days.append(day)
+    return sorted(days)
+
+
+def _day_stats_file(log_file: Path, day: date_cls) -> Path:
+    """The day's pre-aggregated day_stats, kept next to its shard."""
+    return _day_index_dir(log_file) / f"{day.isoformat()}.stats.json"
+
+
+def _ensure_file_exists(log_file: Path) -> None:
     """Create the JSON file if it doesn't exist."""
-    if not CARE_LOG_FILE.exists():
-        CARE_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        CARE_LOG_FILE.write_text("[]", encoding="utf-8")
+    if not log_file.exists():
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        log_file.write_text("[]", encoding="utf-8")
+
+
+def _read_snapshot(log_file: Path) -> List[Dict[str, Any]]:
+    """Read the compacted JSON array, treating anything else as empty."""
+    raw = json.loads(log_file.read_text(encoding="utf-8"))
+    return raw if isinstance(raw, list) else []
+
+
+def _read_journal(path: Path) -> List[Dict[str, Any]]:
+    """Read one JSON event per line from a journal file."""
+    if not path.exists():
+        return []
+
+    events: List[Dict[str, Any]] = []
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-append; the event was
+                # never acknowledged, so dropping it is safe.
+                continue
+            if isinstance(item, dict):
+                events.append(item)
+    return events
+
+
+def _load_events(user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Return every stored event in insertion order: snapshot, then journals."""
+    log_file = _log_file(user_id)
+    with _locks_for(log_file).io:
+        _ensure_file_exists(log_file)
+        return (
+            _read_snapshot(log_file)
+            + _read_journal(_pending_journal_file(log_file))
+            + _read_journal(_journal_file(log_file))
+        )
+
+
+def _dump_snapshot(events: List[Dict[str, Any]]) -> str:
+    return json.dumps(events, indent=2, ensure_ascii=False)
+
+
+def _event_day(event: Dict[str, Any]) -> Optional[date_cls]:
+    """The calendar day an event belongs to, or None for a missing/bad timestamp."""
+    ts_str = event.get("timestamp")
+    if not ts_str:
+        return None
+    try:
+        return datetime.fromisoformat(ts_str).date()
+    except (TypeError, ValueError):
+        return None
+
+
+def _source_signature(log_file: Path) -> List[Any]:
+    """Size and mtime of every file the events are read from."""
+    return file_signature(
+        log_file, _pending_journal_file(log_file), _journal_file(log_file)
+    )
+
+
+def _day_index_is_current(log_file: Path) -> bool:
+    """True if the day shards were built from exactly the files on disk now."""
+    manifest = _day_index_manifest(log_file)
+    if not manifest.exists():
+        return False
+    try:
+        raw = json.loads(manifest.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return False
+    return (
+        raw.get("format") == DAY_INDEX_FORMAT
+        and raw.get("source") == _source_signature(log_file)
+    )
+
+
+def _write_day_index_manifest(log_file: Path) -> None:
+    # Derived data: a lost manifest only costs one rebuild, so skip the fsync.
+    atomic_write_text(
+        _day_index_manifest(log_file),
+        json.dumps({"format": DAY_INDEX_FORMAT, "source": _source_signature(log_file)}),
+        durable=False,
+    )
+
+
+def _read_day_stats(log_file: Path, day: date_cls) -> Dict[str, Any]:
+    path = _day_stats_file(log_file, day)
+    if not path.exists():
+        return empty_day_stats()
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _append_to_day_index(log_file: Path, events: List[Dict[str, Any]]) -> None:
+    """Add new events to their day shards and fold them into the day stats."""
+    by_day: Dict[date_cls, List[Dict[str, Any]]] = {}
+    for event in events:
+        day = _event_day(event)
+        if day is not None:
+            by_day.setdefault(day, []).append(event)
+
+    for day, day_events in by_day.items():
+        with _day_shard_file(log_file, day).open("a", encoding="utf-8") as fh:
+            fh.write(
+                "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in day_events)
+            )
+
+        stats = _read_day_stats(log_file, day)
+        for event in day_events:
+            add_event_to_day_stats(stats, event)
+        atomic_write_text(_day_stats_file(log_file, day), json.dumps(stats), durable=False)
+
+
+def rebuild_day_index(user_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Rebuild the per-day shards and their day_stats from the full care log.
+
+    get_logs_for_day does this automatically the first time it notices the
+    shards are missing or out of date (e.g. after care_logs.json was edited by
+    hand); call it directly to pay that cost up front.
+
+    Args:
+        user_id: Whose care log to index; None for the shared log.
+
+    Returns:
+        { "status": "success", "days": <int> }
+    """
+    log_file = _log_file(user_id)
+    with _locks_for(log_file).io:
+        by_day: Dict[date_cls, List[str]] = {}
+        stats_by_day: Dict[date_cls, Dict[str, Any]] = {}
+        for event in _load_events(user_id):
+            day = _event_day(event)
+            if day is not None:
+                by_day.setdefault(day, []).append(
+                    json.dumps(event, ensure_ascii=False) + "\n"
+                )
+                add_event_to_day_stats(
+                    stats_by_day.setdefault(day, empty_day_stats()), event
+                )
+
+        index_dir = _day_index_dir(log_file)
+        index_dir.mkdir(parents=True, exist_ok=True)
+        for stale in [*index_dir.glob("*.jsonl"), *index_dir.glob("*.stats.json")]:
+            stale.unlink()
+        for day, lines in by_day.items():
+            _day_shard_file(log_file, day).write_text("".join(lines), encoding="utf-8")
+            _day_stats_file(log_file, day).write_text(
+                json.dumps(stats_by_day[day]), encoding="utf-8"
+            )
+        _write_day_index_manifest(log_file)
+
+    return {"status": "success", "days": len(by_day)}
+
+
+def _append_to_journal(user_id: Optional[str], events: List[Dict[str, Any]]) -> None:
+    """Append one line per event with a single fsync; cost is independent of history."""
+    lines = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+    log_file = _log_file(user_id)
+    journal = _journal_file(log_file)
+
+    with _locks_for(log_file).io:
+        _ensure_file_exists(log_file)
+        index_current = _day_index_is_current(log_file)
+        with journal.open("a", encoding="utf-8") as fh:
+            fh.write(lines)
+            fh.flush()
+            os.fsync(fh.fileno())
+        journal_size = journal.stat().st_size
+        if index_current:
+            _append_to_day_index(log_file, events)
+            _write_day_index_manifest(log_file)
+
+    if journal_size >= JOURNAL_COMPACT_THRESHOLD_BYTES:
+        _start_background_compaction(user_id)
+
+
+def _start_background_compaction(user_id: Optional[str]) -> None:
+    """Fold the journal into the snapshot on a daemon thread, at most one per log."""
+    locks = _locks_for(_log_file(user_id))
+
+    with locks.io:
+        if locks.compaction_thread is not None and locks.compaction_thread.is_alive():
+            return
+        locks.compaction_thread = threading.Thread(
+            target=compact_care_log,
+            args=(user_id,),
+            name="care-log-compaction",
+            daemon=True,
+        )
+        locks.compaction_thread.start()
+
+
+def compact_care_log(user_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fold the JSONL journal into the pretty-printed CARE_LOG_FILE snapshot.
+
+    Safe to call on demand while events are being logged: the journal is
+    rotated aside first, so appends keep going to a fresh journal while the
+    snapshot is rebuilt.
+
+    Args:
+        user_id: Whose care log to compact; None for the shared log.
+
+    Returns:
+        { "status": "success", "compacted_events": <int> }
+    """
+    log_file = _log_file(user_id)
+    locks = _locks_for(log_file)
+
+    with locks.compaction:
+        pending = _pending_journal_file(log_file)
+
+        with locks.io:
+            _ensure_file_exists(log_file)
+            journal = _journal_file(log_file)
+            # A leftover pending segment means an earlier compaction was
+            # interrupted; fold that one in before rotating the live journal.
+            if not pending.exists() and journal.exists():
+                index_current = _day_index_is_current(log_file)
+                journal.replace(pending)
+                if index_current:
+                    _write_day_index_manifest(log_file)
+            if not pending.exists():
+                return {"status": "success", "compacted_events": 0}
+            snapshot = _read_snapshot(log_file)
+
+        pending_events = _read_journal(pending)
+        tmp_file = write_temp_sibling(log_file, _dump_snapshot(snapshot + pending_events))
+
+        with locks.io:
+            # Compaction moves events between files without changing them, so
+            # the day shards stay valid if they were valid beforehand.
+            index_current = _day_index_is_current(log_file)
+            os.replace(tmp_file, log_file)
+            pending.unlink()
+            if index_current:
+                _write_day_index_manifest(log_file)
+
+    return {"status": "success", "compacted_events": len(pending_events)}
 
 
 def add_log(
@@ -19,6 +376,7 @@ def add_log(
     volume_ml: Optional[int] = None,
     duration_minutes: Optional[int] = None,
     notes: Optional[str] = None,
+    tool_context: Optional[ToolContext] = None,
 ) -> Dict[str, str]:
     """
     Append a care event to the log file.
@@ -29,16 +387,11 @@ def add_log(
         volume_ml: Optional, for feeds.
         duration_minutes: Optional, for naps.
         notes: Optional free-text notes.
+        tool_context: Injected by ADK; selects the user's care log.
 
     Returns:
         { "status": "success" }
     """
-    _ensure_file_exists()
-    raw = json.loads(CARE_LOG_FILE.read_text(encoding="utf-8"))
-
-    if not isinstance(raw, list):
-        raw = []
-
     event: Dict[str, Any] = {
         "event_type": event_type,
         "timestamp": timestamp,
@@ -46,23 +399,140 @@ def add_log(
         "duration_minutes": duration_minutes,
         "notes": notes,
     }
+    _persist_events([event], user_id_from_context(tool_context))
+    return {"status": "success"}
 
-    raw.append(event)
 
-    CARE_LOG_FILE.write_text(
-        json.dumps(raw, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+class CareEvent(BaseModel):
+    """One care event for add_logs; same fields as add_log's arguments."""
 
-    return {"status": "success"}
+    event_type: str
+    timestamp: str
+    volume_ml: Optional[int] = None
+    duration_minutes: Optional[int] = None
+    notes: Optional[str] = None
+
+
+def _validated_event(item: Any) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """(event dict, None) for a valid add_logs item, else (None, reason)."""
+    if isinstance(item, BaseModel):
+        item = item.model_dump()
+    if not isinstance(item, dict):
+        return None, "not an object"
+
+    unknown = set(item) - set(EVENT_FIELDS)
+    if unknown:
+        return None, f"unknown fields {sorted(unknown)}"
+    if item.get("event_type") not in EVENT_TYPES:
+        return None, f"event_type must be one of {list(EVENT_TYPES)}"
+    if _event_day(item) is None:
+        return None, "timestamp must be an ISO datetime, e.g. 2025-11-19T07:10:00"
+
+    event: Dict[str, Any] = {"event_type": item["event_type"], "timestamp": item["timestamp"]}
+    for field in ("volume_ml", "duration_minutes"):
+        value = item.get(field)
+        # JSON numbers from the model may arrive as 90.0.
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if value is not None and (
+            not isinstance(value, int) or isinstance(value, bool) or value < 0
+        ):
+            return None, f"{field} must be a non-negative integer"
+        event[field] = value
+    notes = item.get("notes")
+    if notes is not None and not isinstance(notes, str):
+        return None, "notes must be text"
+    event["notes"] = notes
+    return event, None
+
+
+def add_logs(
+    events: List[CareEvent],
+    tool_context: Optional[ToolContext] = None,
+) -> Dict[str, Any]:
+    """
+    Save several care events at once, e.g. everything in "two wet diapers
+    since 6am and a 90ml feed at 7".
+
+    The batch is validated first and written in a single write; if any event
+    is invalid nothing is saved.
 
+    Args:
+        events: Care events, each with event_type ("feed", "nap" or "diaper"),
+            timestamp (ISO datetime, e.g. "2025-11-19T07:10:00") and optional
+            volume_ml, duration_minutes and notes.
+        tool_context: Injected by ADK; selects the user's care log. The
+            saved events are also put in its state under
+            "care_event_logged_events".
+
+    Returns:
+        { "status": "success", "logged": <int> }
+        or { "status": "error", "errors": [{"index": <int>, "error": <str>}, ...] }
+    """
+    valid: List[Dict[str, Any]] = []
+    errors: List[Dict[str, Any]] = []
+    for index, item in enumerate(events or []):
+        event, error = _validated_event(item)
+        if error is not None:
+            errors.append({"index": index, "error": error})
+        else:
+            valid.append(event)
+
+    if errors:
+        return {"status": "error", "errors": errors}
+    if valid:
+        _persist_events(valid, user_id_from_context(tool_context))
+    if tool_context is not None:
+        tool_context.state["care_event_logged_events"] = valid
+    return {"status": "success", "logged": len(valid)}
+
+
+def _persist_events(events: List[Dict[str, Any]], user_id: Optional[str]) -> None:
+    """Append events to the user's care log in one write, whatever the backend."""
+    for day in {_event_day(event) for event in events} - {None}:
+        summary_cache.invalidate_day(user_id, day.isoformat())
+
+    if config.care_log_backend == "sqlite":
+        sqlite_store.insert_events(events, user_id)
+        bump_write_version(sqlite_store.database_file(user_id))
+        return
+
+    log_file = _log_file(user_id)
+    if config.care_log_backend == "journal":
+        _append_to_journal(user_id, events)
+        bump_write_version(log_file)
+        return
+
+    locks = _locks_for(log_file)
+    with locks.compaction, locks.io:
+        index_current = _day_index_is_current(log_file)
+        raw = _load_events(user_id)
+        raw.extend(events)
+        atomic_write_text(log_file, _dump_snapshot(raw))
+
+        # Any journal left over from journal mode is now part of the snapshot.
+        _pending_journal_file(log_file).unlink(missing_ok=True)
+        _journal_file(log_file).unlink(missing_ok=True)
 
-def get_logs_for_day(day: str) -> List[Dict[str, Any]]:
+        if index_current:
+            _append_to_day_index(log_file, events)
+            _write_day_index_manifest(log_file)
+        bump_write_version(log_file)
+
+
+def get_logs_for_day(
+    day: str,
+    tool_context: Optional[ToolContext] = None,
+) -> List[Dict[str, Any]]:
     """
     Return all care events whose timestamp.date() == the given day.
 
+    Only the day's shard is read; the full history is scanned just once to
+    (re)build the shards when they are missing or stale.
+
     Args:
         day: ISO date string, e.g. "2025-11-19".
+        tool_context: Injected by ADK; selects the user's care log.
 
     Returns:
         List of dicts, each with keys:
@@ -72,29 +542,214 @@ def get_logs_for_day(day: str) -> List[Dict[str, Any]]:
         - duration_minutes
         - notes
     """
-    _ensure_file_exists()
-    raw = json.loads(CARE_LOG_FILE.read_text(encoding="utf-8"))
-
     try:
         target_date = date_cls.fromisoformat(day)
     except ValueError:
         # If date is bad, just return no events instead of raising.
         return []
 
-    events: List[Dict[str, Any]] = []
+    # Dicts are built fresh from the cached columns, so callers can't mutate
+    # the cache.
+    return _day_events(target_date, user_id_from_context(tool_context)).to_dicts()
 
-    for item in raw:
-        ts_str = item.get("timestamp")
-        if not ts_str:
-            continue
 
-        try:
-            ts = datetime.fromisoformat(ts_str)
-        except ValueError:
-            # Skip malformed timestamps so one bad entry doesn't break the day view.
-            continue
-
-        if ts.date() == target_date:
-            events.append(item)
+def _day_events(target_date: date_cls, user_id: Optional[str]) -> EventColumns:
+    """One day's events, in insertion order, from the cache or the store."""
+    if config.care_log_backend == "sqlite":
+        db_file = sqlite_store.database_file(user_id)
+        cache_key = (db_file, target_date)
+        validator = (write_version(db_file), sqlite_store.data_version(user_id))
+        events = _day_cache.get(cache_key, validator)
+        if events is None:
+            events = EventColumns.from_events(
+                sqlite_store.select_events_for_day(target_date, user_id)
+            )
+            if len(events):
+                _day_cache.put(cache_key, events, validator)
+        return events
 
+    log_file = _log_file(user_id)
+    cache_key = (log_file, target_date)
+    events = _day_cache.get(
+        cache_key, (write_version(log_file), _source_signature(log_file))
+    )
+    if events is None:
+        with _locks_for(log_file).io:
+            _ensure_file_exists(log_file)
+            if not _day_index_is_current(log_file):
+                rebuild_day_index(user_id)
+            validator = (write_version(log_file), _source_signature(log_file))
+            events = EventColumns.from_events(
+                _read_journal(_day_shard_file(log_file, target_date))
+            )
+            # Empty days are cheap to re-check and would only crowd out
+            # days that have events.
+            if len(events):
+                _day_cache.put(cache_key, events, validator)
     return events
+
+
+def get_day_stats(target_date: date_cls, user_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    The day's day_stats from the aggregate table add_log keeps up to date,
+    without reading the day's events.
+    """
+    if config.care_log_backend == "sqlite":
+        return sqlite_store.select_daily_stats(target_date, target_date, user_id).get(
+            target_date.isoformat(), empty_day_stats()
+        )
+
+    log_file = _log_file(user_id)
+    cache_key = (log_file, target_date, "stats")
+    stats = _day_cache.get(
+        cache_key, (write_version(log_file), _source_signature(log_file))
+    )
+    if stats is None:
+        with _locks_for(log_file).io:
+            _ensure_file_exists(log_file)
+            if not _day_index_is_current(log_file):
+                rebuild_day_index(user_id)
+            validator = (write_version(log_file), _source_signature(log_file))
+            stats = _read_day_stats(log_file, target_date)
+            # As in _day_events: a month of empty days would push out the
+            # days that have events.
+            if stats != empty_day_stats():
+                _day_cache.put(cache_key, stats, validator)
+    return copy.deepcopy(stats)
+
+
+def iter_daily_stats(
+    start: date_cls, end: date_cls, user_id: Optional[str] = None
+) -> Iterator[Tuple[date_cls, Dict[str, Any]]]:
+    """(day, day_stats) for every day start..end, zeros on days with no events."""
+    stored = (
+        sqlite_store.select_daily_stats(start, end, user_id)
+        if config.care_log_backend == "sqlite"
+        else None
+    )
+
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        if stored is None:
+            yield day, get_day_stats(day, user_id)
+        else:
+            yield day, stored.get(day.isoformat()) or empty_day_stats()
+
+
+def rebuild_daily_stats(
+    user_id: Optional[str] = None, check_only: bool = False
+) -> Dict[str, Any]:
+    """
+    Compare the per-day aggregate table with a full recomputation from the
+    raw events and (unless check_only) rebuild it.
+
+    Args:
+        user_id: Whose care log to check; None for the shared log.
+        check_only: Report mismatches without rewriting anything.
+
+    Returns:
+        { "status": "success", "days": <int>, "mismatched_days": [<ISO day>, ...] }
+    """
+    if config.care_log_backend == "sqlite":
+        expected = sqlite_store.expected_daily_stats(user_id)
+        stored = sqlite_store.stored_daily_stats(user_id)
+    else:
+        expected: Dict[str, Dict[str, Any]] = {}
+        for event in _load_events(user_id):
+            day = _event_day(event)
+            if day is not None:
+                add_event_to_day_stats(
+                    expected.setdefault(day.isoformat(), empty_day_stats()), event
+                )
+        stored = {
+            path.name[: -len(".stats.json")]: json.loads(path.read_text(encoding="utf-8"))
+            for path in _day_index_dir(_log_file(user_id)).glob("*.stats.json")
+        }
+
+    mismatched = sorted(
+        day for day in set(expected) | set(stored) if expected.get(day) != stored.get(day)
+    )
+    if not check_only:
+        if config.care_log_backend == "sqlite":
+            sqlite_store.rebuild_daily_stats(user_id)
+            bump_write_version(sqlite_store.database_file(user_id))
+        else:
+            rebuild_day_index(user_id)
+            bump_write_version(_log_file(user_id))
+
+    return {"status": "success", "days": len(expected), "mismatched_days": mismatched}
+
+
+def iter_logs_for_range(
+    start: date_cls,
+    end: date_cls,
+    event_types: Optional[Iterable[str]] = None,
+    user_id: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the events dated start..end (inclusive) in timestamp order.
+
+    Only one day's events are held at a time (the day shards, or a cursor
+    over the SQLite timestamp index), so long ranges never load the whole
+    history, and only days that have events are read. Events with equal
+    timestamps keep their insertion order.
+
+    Args:
+        start: First day of the range.
+        end: Last day of the range.
+        event_types: Only yield these event types; None means all.
+        user_id: ADK user id selecting the care log (multi-tenant mode).
+    """
+    wanted = set(event_types) if event_types is not None else None
+
+    if config.care_log_backend == "sqlite":
+        for event in sqlite_store.iter_events_for_range(start, end, wanted, user_id):
+            yield event
+        return
+
+    log_file = _log_file(user_id)
+    with _locks_for(log_file).io:
+        _ensure_file_exists(log_file)
+        if not _day_index_is_current(log_file):
+            rebuild_day_index(user_id)
+        days = _shard_days(log_file, start, end)
+
+    for day in days:
+        # Sorted on the parsed epoch-second column; dicts are only built for
+        # the rows actually yielded.
+        events = _day_events(day, user_id)
+        yield from events.iter_dicts(events.time_order(wanted))
+
+
+def get_logs_for_range(
+    start: str,
+    end: str,
+    event_types: Optional[List[str]] = None,
+    tool_context: Optional[ToolContext] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Return all care events from the start day through the end day, in time order.
+
+    Use this for questions about several days ("this week", "since Monday")
+    instead of calling get_logs_for_day once per day.
+
+    Args:
+        start: First day, ISO date string, e.g. "2025-11-17".
+        end: Last day (inclusive), ISO date string, e.g. "2025-11-23".
+        event_types: Optional filter, any of "feed", "nap", "diaper".
+        tool_context: Injected by ADK; selects the user's care log.
+
+    Returns:
+        List of event dicts with the same keys as get_logs_for_day, ordered by
+        timestamp; empty if a date is invalid or start is after end.
+    """
+    try:
+        start_date = date_cls.fromisoformat(start)
+        end_date = date_cls.fromisoformat(end)
+    except ValueError:
+        return []
+    return list(
+        iter_logs_for_range(
+            start_date, end_date, event_types, user_id_from_context(tool_context)
+        )
+    )
@@ -0,0 +1,134 @@
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def _decode_text(value: Any) -> Any:
+    """Parse JSON text (optionally in a ```json fence); other values pass through."""
+    if not isinstance(value, str):
+        return value
+    text = _CODE_FENCE.sub("", value.strip())
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
+
+
+def events_from_state(value: Any) -> List[Dict[str, Any]]:
+    """
+    Normalise a session-state value holding care events into a list of dicts.
+
+    Deterministic stages store the list itself, but an LlmAgent's output_key
+    stores the model's text, which may be a JSON list, a JSON object wrapping
+    one (e.g. {"logs_for_day": [...]}) or either inside a ```json fence.
+    Anything unreadable counts as no events.
+    """
+    value = _decode_text(value)
+
+    if isinstance(value, dict):
+        value = next((v for v in value.values() if isinstance(v, list)), [])
+
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+def is_empty_event_list(value: Any) -> bool:
+    """
+    True only for a state value that certainly holds no events: [] itself
+    or text that decodes to []. Unlike events_from_state, unreadable text
+    (e.g. prose around a JSON list) is not taken to mean an empty day.
+    """
+    return _decode_text(value) == []
+
+
+def object_from_state(value: Any) -> Dict[str, Any]:
+    """
+    Normalise a session-state value holding one JSON object (e.g. an LLM
+    agent's {"artifact_id": ...} reply) into a dict; unreadable means {}.
+    """
+    value = _decode_text(value)
+    return value if isinstance(value, dict) else {}
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def empty_day_stats() -> Dict[str, Any]:
+    """day_stats for a day with no events."""
+    return {
+        "feeds": {"count": 0, "total_volume_ml": 0},
+        "naps": {"count": 0, "total_minutes": 0},
+        "diapers": {"count": 0},
+        "first_event_time": None,
+        "last_event_time": None,
+    }
+
+
+def add_event_to_day_stats(stats: Dict[str, Any], event: Dict[str, Any]) -> None:
+    """
+    Fold one more event into a day_stats object, in place.
+
+    Folding a day's events in insertion order gives exactly
+    compute_day_stats(events), which is how the per-day aggregate table kept
+    by care_log_store stays equal to a full recomputation.
+    """
+    etype = event.get("event_type")
+    if etype == "feed":
+        stats["feeds"]["count"] += 1
+        vol = event.get("volume_ml")
+        if isinstance(vol, (int, float)):
+            stats["feeds"]["total_volume_ml"] += int(vol)
+    elif etype == "nap":
+        stats["naps"]["count"] += 1
+        mins = event.get("duration_minutes")
+        if isinstance(mins, (int, float)):
+            stats["naps"]["total_minutes"] += int(mins)
+    elif etype == "diaper":
+        stats["diapers"]["count"] += 1
+
+    ts = _parse_timestamp(event.get("timestamp"))
+    if ts is None:
+        return
+    first = _parse_timestamp(stats["first_event_time"])
+    last = _parse_timestamp(stats["last_event_time"])
+    try:
+        if first is None or ts < first:
+            stats["first_event_time"] = event["timestamp"]
+        if last is None or ts > last:
+            stats["last_event_time"] = event["timestamp"]
+    except TypeError:
+        # Naive and offset-aware timestamps can't be ordered; keep the
+        # bounds from whichever kind was seen first.
+        return
+
+
+def compute_day_stats(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate one day's care events into the day_stats shape.
+
+    Args:
+        events: Care event dicts as returned by get_logs_for_day.
+
+    Returns:
+        {
+          "feeds": {"count": int, "total_volume_ml": int},
+          "naps": {"count": int, "total_minutes": int},
+          "diapers": {"count": int},
+          "first_event_time": str (ISO) | None,
+          "last_event_time": str (ISO) | None
+        }
+    """
+    stats = empty_day_stats()
+    for event in events:
+        add_event_to_day_stats(stats, event)
+    return stats
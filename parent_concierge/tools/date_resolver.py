@@ -0,0 +1,165 @@
+import re
+from datetime import date, timedelta
+from typing import List, Optional
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        [
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ],
+        start=1,
+    )
+    for name in names
+}
+# Full names only: abbreviations like "sat" or "sun" are ordinary words too.
+_WEEKDAYS = {
+    name: number
+    for number, name in enumerate(
+        ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+    )
+}
+
+_MONTH = r"(?P<month>" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + r")\.?"
+_WEEKDAY = r"(?P<weekday>" + "|".join(_WEEKDAYS) + r")"
+_DAY = r"(?P<day>\d{1,2})(?:st|nd|rd|th)?"
+_YEAR = r"(?:,?\s+(?P<year>\d{4}))?"
+
+_ISO_DATE = re.compile(r"\b(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})\b")
+_DAY_MONTH = re.compile(rf"\b{_DAY}\s+(?:of\s+)?{_MONTH}{_YEAR}\b")
+_MONTH_DAY = re.compile(rf"\b{_MONTH}\s+{_DAY}{_YEAR}\b")
+_DAYS_AGO = re.compile(r"\b(?P<n>\d{1,2}|a|one|two|three|four|five|six|seven)\s+days?\s+ago\b")
+_LAST_WEEKDAY = re.compile(rf"\b(?:(?P<last>last|past)\s+|on\s+)?{_WEEKDAY}\b")
+
+_YESTERDAY = re.compile(r"\b(yesterday|last night)\b")
+_DAY_BEFORE_YESTERDAY = re.compile(r"\bday before yesterday\b")
+_TODAY = re.compile(
+    r"\b(today|tonight|this (morning|afternoon|evening)|so far|earlier|right now)\b"
+)
+
+_WORD_NUMBERS = {"a": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7}
+
+# Anything that hints at a date this module can't read (numeric d/m/y dates,
+# "last week", "the 12th", "on his birthday", ...) sends the request to the
+# LLM rather than silently falling back to today.
+_UNRESOLVED_DATE_HINT = re.compile(
+    r"\d|\b(week|month|weekend|ago|before|after|since|birthday|christmas|"
+    r"tomorrow)\b"
+)
+
+
+def _most_recent(day: int, month: int, today: date) -> Optional[date]:
+    """The latest past-or-today date with this day and month."""
+    for year in (today.year, today.year - 1):
+        try:
+            candidate = date(year, month, day)
+        except ValueError:
+            continue
+        if candidate <= today:
+            return candidate
+    return None
+
+
+def _explicit_dates(text: str, today: date) -> Optional[List[date]]:
+    """Calendar dates written out in text, or None if one of them is invalid."""
+    found: List[date] = []
+    spans: List[range] = []
+
+    for pattern in (_ISO_DATE, _DAY_MONTH, _MONTH_DAY):
+        for match in pattern.finditer(text):
+            if any(match.start() in span for span in spans):
+                continue
+            spans.append(range(match.start(), match.end()))
+            month = match.group("month")
+            month_num = int(month) if month.isdigit() else _MONTHS[month.rstrip(".")]
+            day = int(match.group("day"))
+            year = match.group("year")
+            if year:
+                try:
+                    found.append(date(int(year), month_num, day))
+                except ValueError:
+                    return None
+                continue
+            recent = _most_recent(day, month_num, today)
+            if recent is None:
+                return None
+            found.append(recent)
+    return found
+
+
+def resolve_day(
+    text: str, today: Optional[date] = None, default_to_today: bool = True
+) -> Optional[str]:
+    """
+    Resolve the day a summary request refers to, without a model call.
+
+    Handles "today"/"this morning"/"tonight"/"so far", "yesterday"/"last
+    night", "the day before yesterday", "N days ago", weekday names
+    ("on Tuesday", "last Tuesday"), ISO dates and written dates such as
+    "12 Nov 2025", "12th of November" or "November 12, 2025". A request
+    with no date wording at all defaults to today.
+
+    Args:
+        text: The user's request.
+        today: Reference date; defaults to the current local date.
+        default_to_today: False to return None, rather than today, for a
+            request with no date wording.
+
+    Returns:
+        ISO date string (YYYY-MM-DD), or None when the phrasing is ambiguous
+        or not understood and the caller should fall back to the LLM.
+    """
+    today = today or date.today()
+    lowered = text.lower()
+
+    candidates: List[date] = []
+
+    explicit = _explicit_dates(lowered, today)
+    if explicit is None:
+        return None
+    candidates.extend(explicit)
+    # Strip explicit dates so their month/day words don't match below.
+    for pattern in (_ISO_DATE, _DAY_MONTH, _MONTH_DAY):
+        lowered = pattern.sub(" ", lowered)
+
+    if _DAY_BEFORE_YESTERDAY.search(lowered):
+        candidates.append(today - timedelta(days=2))
+        lowered = _DAY_BEFORE_YESTERDAY.sub(" ", lowered)
+    if _YESTERDAY.search(lowered):
+        candidates.append(today - timedelta(days=1))
+    if _TODAY.search(lowered):
+        candidates.append(today)
+
+    for match in _DAYS_AGO.finditer(lowered):
+        n = match.group("n")
+        candidates.append(today - timedelta(days=int(n) if n.isdigit() else _WORD_NUMBERS[n]))
+    lowered = _DAYS_AGO.sub(" ", lowered)
+
+    for match in _LAST_WEEKDAY.finditer(lowered):
+        back = (today.weekday() - _WEEKDAYS[match.group("weekday")]) % 7
+        if back == 0 and match.group("last"):
+            back = 7
+        candidates.append(today - timedelta(days=back))
+    lowered = _LAST_WEEKDAY.sub(" ", lowered)
+
+    unique = set(candidates)
+    if len(unique) > 1:
+        # e.g. "compare today with yesterday": not a single-day request.
+        return None
+    if unique:
+        return unique.pop().isoformat()
+
+    if _UNRESOLVED_DATE_HINT.search(lowered) or not default_to_today:
+        return None
+    return today.isoformat()
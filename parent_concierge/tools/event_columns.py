@@ -0,0 +1,132 @@
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Compact, column-per-field storage for care events held in memory (the
+# per-day read cache). A dict event costs a few hundred bytes plus a parsed
+# datetime per query; here an event is one slot in each of a few typed
+# arrays, timestamps are parsed once into epoch seconds and event types are
+# small integer codes. Events become dicts again only at the tool boundary.
+
+EVENT_FIELDS = ("event_type", "timestamp", "volume_ml", "duration_minutes", "notes")
+EVENT_TYPES = ("feed", "nap", "diaper")
+_TYPE_CODES = {name: code for code, name in enumerate(EVENT_TYPES)}
+
+# Marks a missing volume/duration in the integer columns.
+MISSING = -(2**63)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch_seconds(timestamp: Any) -> Optional[int]:
+    """Wall-clock seconds since 1970-01-01 (offset ignored), or None if unparseable."""
+    if not isinstance(timestamp, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    return int((parsed.replace(tzinfo=None) - _EPOCH).total_seconds())
+
+
+def _format_seconds(seconds: int) -> str:
+    return (_EPOCH + timedelta(seconds=seconds)).isoformat()
+
+
+def _int_or_none(value: Any) -> bool:
+    return value is None or (isinstance(value, int) and not isinstance(value, bool))
+
+
+class EventColumns:
+    """
+    Immutable columnar batch of care events.
+
+    Regular events (known type, a timestamp that round-trips through epoch
+    seconds, int-or-None volume/duration, no extra keys) live only in the
+    columns. Anything else keeps its original dict in a small side table so
+    to_dicts() always returns exactly what was stored.
+    """
+
+    __slots__ = ("seconds", "types", "volumes", "durations", "notes", "_irregular")
+
+    def __init__(self) -> None:
+        self.seconds = array("q")
+        self.types = array("b")
+        self.volumes = array("q")
+        self.durations = array("q")
+        self.notes: List[Optional[str]] = []
+        self._irregular: Dict[int, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]]) -> "EventColumns":
+        columns = cls()
+        for event in events:
+            columns._append(event)
+        return columns
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        seconds = _epoch_seconds(event.get("timestamp"))
+        code = _TYPE_CODES.get(event.get("event_type"), -1)
+        volume = event.get("volume_ml")
+        duration = event.get("duration_minutes")
+        notes = event.get("notes")
+
+        regular = (
+            seconds is not None
+            and code >= 0
+            and _format_seconds(seconds) == event["timestamp"]
+            and _int_or_none(volume)
+            and _int_or_none(duration)
+            and (notes is None or isinstance(notes, str))
+            and event.keys() == set(EVENT_FIELDS)
+        )
+        if not regular:
+            self._irregular[len(self.types)] = dict(event)
+
+        self.seconds.append(MISSING if seconds is None else seconds)
+        self.types.append(code)
+        self.volumes.append(volume if regular and volume is not None else MISSING)
+        self.durations.append(duration if regular and duration is not None else MISSING)
+        self.notes.append(notes if regular else None)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def event(self, index: int) -> Dict[str, Any]:
+        """Row `index` as a new event dict."""
+        irregular = self._irregular.get(index)
+        if irregular is not None:
+            return dict(irregular)
+        volume = self.volumes[index]
+        duration = self.durations[index]
+        return {
+            "event_type": EVENT_TYPES[self.types[index]],
+            "timestamp": _format_seconds(self.seconds[index]),
+            "volume_ml": None if volume == MISSING else volume,
+            "duration_minutes": None if duration == MISSING else duration,
+            "notes": self.notes[index],
+        }
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [self.event(i) for i in range(len(self))]
+
+    def time_order(self, event_types: Optional[Iterable[str]] = None) -> List[int]:
+        """
+        Row indices in timestamp order (stable, so ties keep insertion
+        order), optionally only rows of the given event types.
+        """
+        rows: Sequence[int] = range(len(self))
+        if event_types is not None:
+            wanted = set(event_types)
+            rows = [i for i in rows if self._event_type(i) in wanted]
+        return sorted(rows, key=self.seconds.__getitem__)
+
+    def iter_dicts(self, rows: Iterable[int]) -> Iterator[Dict[str, Any]]:
+        for index in rows:
+            yield self.event(index)
+
+    def _event_type(self, index: int) -> Any:
+        code = self.types[index]
+        if code >= 0:
+            return EVENT_TYPES[code]
+        return self._irregular[index].get("event_type")
@@ -0,0 +1,291 @@
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+# Deterministic extractor for the handful of phrasings most care-event
+# messages use ("90ml at 7:10", "nap from 2:15 to 3pm", "two wet diapers
+# since 6am"). It only answers when every word of the message is accounted
+# for; anything else returns None and goes to llm_care_event_agent.
+
+ML_PER_OZ = 29.5735
+
+# An ambiguous 12-hour time later than now by more than this is read as
+# yesterday's; an unambiguous one ("3:15pm", "15:15") goes to the LLM.
+FUTURE_TOLERANCE = timedelta(minutes=5)
+
+_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+_COUNT = r"(?P<count>\d{1,2}|" + "|".join(_NUMBER_WORDS) + r")"
+
+_FEED_WORDS = {
+    "feed", "fed", "feeding", "bottle", "drank", "formula", "milk",
+    "breastfed", "nursed", "nursing", "breast",
+}
+_NAP_WORDS = {"nap", "napped", "napping", "slept", "sleep", "asleep"}
+_DIAPER_NOTES = {
+    "wet": "wet",
+    "dirty": "dirty",
+    "poo": "dirty",
+    "poop": "dirty",
+    "poopy": "dirty",
+    "pooey": "dirty",
+    "soiled": "dirty",
+    "mixed": "wet and dirty",
+}
+_DIAPER_WORDS = {"diaper", "diapers", "nappy", "nappies"}
+
+# Filler that may appear around the recognised parts without changing them.
+_FILLER = {
+    "she", "he", "they", "baby", "had", "has", "have", "just", "at", "around",
+    "about", "approx", "approximately", "was", "were", "did", "took", "for",
+    "from", "to", "until", "till", "of", "got", "gave", "log", "logged",
+    "please", "another", "her", "his", "him", "my", "we", "i", "there",
+    "ok", "so", "oh", "change", "changed", "new", "today", "this", "morning",
+    "afternoon", "evening", "tonight", "yesterday", "last", "night", "went",
+    "down", "woke", "up", "since", "in", "total", "the", "a", "an", "and",
+    "ml", "oz", "min", "mins", "minutes", "hour", "hours", "hr", "hrs",
+}
+
+_QUESTION = re.compile(r"\?|^\s*(how|what|when|why|did|does|do|can|could|should|is|are|show)\b")
+_BOTH_DIAPER = re.compile(r"\bwet\s*(?:and|&|\+|/)\s*(?:dirty|poo|poopy|poop)\b")
+_CLAUSE_SPLIT = re.compile(r"\s*(?:,|;|\band\b|\bthen\b|\bplus\b|\balso\b)\s*")
+_YESTERDAY = re.compile(r"\b(yesterday|last night)\b")
+
+_VOLUME = re.compile(r"\b(?P<amount>\d+(?:\.\d+)?)\s*(?P<unit>ml|mls|millilitres?|milliliters?|oz|ounces?)\b")
+_DURATION = re.compile(
+    r"\b(?:(?P<hours>\d+(?:\.\d+)?|an|a|one|half an?)\s*(?:h|hr|hrs|hours?)"
+    r"(?:\s*(?:and\s*)?(?P<hmins>\d{1,2})\s*(?:m|min|mins|minutes?)?)?"
+    r"|(?P<mins>\d{1,3})\s*(?:m|min|mins|minutes?))\b"
+)
+_TIME = (
+    r"(?P<{p}h>\d{{1,2}})(?::(?P<{p}m>\d{{2}}))?\s*(?P<{p}mer>am|pm|a\.m\.|p\.m\.)?"
+)
+_RANGE = re.compile(
+    r"\b(?:from\s+)?" + _TIME.format(p="s") + r"\s*(?:to|until|till|-|–)\s*"
+    + _TIME.format(p="e") + r"(?!\s*(?:ml|oz|min|h\b))"
+)
+_AT_TIME = re.compile(
+    r"(?:\b(?P<prefix>at|around|about|since|@)\s*)?" + _TIME.format(p="")
+    + r"(?!\s*(?:ml|mls|oz|min|mins|minutes?|h|hr|hrs|hours?|diapers?|nappies|nappy)\b)"
+)
+_DIAPER_COUNT = re.compile(
+    rf"\b{_COUNT}\s+(?:(?P<kind>wet|dirty|poo|poopy|soiled|mixed)\s+)?(?:diapers?|nappies|nappy)\b"
+)
+
+
+def _clock(hour: int, minute: int, meridiem: Optional[str]) -> Optional[List[Tuple[int, int]]]:
+    """Candidate (hour, minute) readings of a clock time, or None if invalid."""
+    if minute > 59:
+        return None
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem.startswith("p") else 0)
+        return [(hour, minute)]
+    if hour > 23:
+        return None
+    if hour == 0 or hour > 12:
+        return [(hour, minute)]
+    # "7:10" could be morning or evening; the caller picks the recent one.
+    return [(hour % 12, minute), (hour % 12 + 12, minute)]
+
+
+def _resolve(
+    readings: List[Tuple[int, int]], now: datetime, yesterday: bool
+) -> Optional[datetime]:
+    """The most recent past moment matching one of the readings."""
+    base = now.date() - timedelta(days=1) if yesterday else now.date()
+    if yesterday:
+        if len(readings) != 1:
+            return None  # "yesterday at 7" is genuinely ambiguous
+        hour, minute = readings[0]
+        return datetime.combine(base, datetime.min.time()).replace(hour=hour, minute=minute)
+
+    candidates = []
+    # Only "7:10" (morning or evening) may mean yesterday evening; a later
+    # "3:15pm" today is a typo or a note made in advance, not yesterday.
+    for day_offset in (0, 1) if len(readings) > 1 else (0,):
+        day = base - timedelta(days=day_offset)
+        for hour, minute in readings:
+            moment = datetime.combine(day, datetime.min.time()).replace(hour=hour, minute=minute)
+            if moment <= now + FUTURE_TOLERANCE:
+                candidates.append(moment)
+    return max(candidates) if candidates else None
+
+
+def _duration_minutes(match: "re.Match[str]") -> Optional[int]:
+    if match.group("mins"):
+        return int(match.group("mins"))
+    hours_text = match.group("hours")
+    if hours_text.startswith("half"):
+        hours = 0.5
+    elif hours_text in _NUMBER_WORDS:
+        hours = _NUMBER_WORDS[hours_text]
+    else:
+        hours = float(hours_text)
+    minutes = hours * 60 + int(match.group("hmins") or 0)
+    return round(minutes)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.replace(second=0, microsecond=0).isoformat()
+
+
+def _parse_clause(
+    clause: str, now: datetime, yesterday: bool
+) -> Optional[List[Dict[str, Any]]]:
+    """Events for one clause, or None if any part of it isn't understood."""
+    rest = f" {clause} "
+    volume_ml: Optional[int] = None
+    duration: Optional[int] = None
+    moment: Optional[datetime] = None
+    count = 1
+    diaper_note: Optional[str] = None
+
+    match = _VOLUME.search(rest)
+    if match:
+        amount = float(match.group("amount"))
+        if match.group("unit").startswith(("oz", "ounce")):
+            amount *= ML_PER_OZ
+        volume_ml = round(amount)
+        rest = rest[: match.start()] + " " + rest[match.end():]
+
+    match = _RANGE.search(rest)
+    if match:
+        start = _clock(int(match.group("sh")), int(match.group("sm") or 0), match.group("smer"))
+        end = _clock(int(match.group("eh")), int(match.group("em") or 0), match.group("emer"))
+        if start is None or end is None:
+            return None
+        if not match.group("smer") and match.group("emer") and len(start) == 2:
+            # "2:15 to 3pm": the start shares the end's half of the day,
+            # unless that would put it after the end ("11 to 1pm").
+            same_half = start[1] if end[0][0] >= 12 else start[0]
+            start = [same_half] if same_half <= end[0] else [start[0]]
+        end_moment = _resolve(end, now, yesterday)
+        if end_moment is None:
+            return None
+        start_moment = None
+        for hour, minute in start:
+            candidate = end_moment.replace(hour=hour, minute=minute)
+            if candidate > end_moment:
+                candidate -= timedelta(days=1)
+            if start_moment is None or candidate > start_moment:
+                start_moment = candidate
+        moment = start_moment
+        duration = int((end_moment - start_moment).total_seconds() // 60)
+        rest = rest[: match.start()] + " " + rest[match.end():]
+
+    match = _DURATION.search(rest)
+    if match:
+        if duration is not None:
+            return None
+        duration = _duration_minutes(match)
+        rest = rest[: match.start()] + " " + rest[match.end():]
+
+    match = _DIAPER_COUNT.search(rest)
+    if match:
+        text = match.group("count")
+        count = int(text) if text.isdigit() else _NUMBER_WORDS[text]
+        if match.group("kind"):
+            diaper_note = _DIAPER_NOTES[match.group("kind")]
+        rest = rest[: match.start()] + " diaper " + rest[match.end():]
+
+    match = _AT_TIME.search(rest)
+    while match and not (match.group("prefix") or match.group("m") or match.group("mer")):
+        # A bare number isn't a time; leave it to make the clause unknown.
+        match = _AT_TIME.search(rest, match.end())
+    if match:
+        if moment is not None:
+            return None
+        readings = _clock(int(match.group("h")), int(match.group("m") or 0), match.group("mer"))
+        if readings is None:
+            return None
+        moment = _resolve(readings, now, yesterday)
+        if moment is None:
+            return None
+        rest = rest[: match.start()] + " " + rest[match.end():]
+
+    words = re.findall(r"[a-z']+|\d+", rest)
+    kinds = set()
+    for word in words:
+        if word in _FEED_WORDS:
+            kinds.add("feed")
+        elif word in _NAP_WORDS:
+            kinds.add("nap")
+        elif word in _DIAPER_WORDS:
+            kinds.add("diaper")
+        elif word in _DIAPER_NOTES:
+            kinds.add("diaper")
+            note = _DIAPER_NOTES[word]
+            if diaper_note not in (None, note):
+                return None
+            diaper_note = note
+        elif word not in _FILLER:
+            return None
+
+    if not kinds and volume_ml is not None:
+        kinds.add("feed")
+    if len(kinds) != 1:
+        return None
+    kind = kinds.pop()
+
+    if kind == "feed" and (duration is not None or count != 1):
+        return None
+    if kind == "nap" and (volume_ml is not None or count != 1):
+        return None
+    if kind == "diaper" and (volume_ml is not None or duration is not None):
+        return None
+    if kind != "diaper" and moment is None and volume_ml is None and duration is None:
+        # A lone "sleep" or "milk" may not be an event at all.
+        return None
+    if moment is None:
+        if yesterday:
+            return None
+        moment = now
+
+    event = {
+        "event_type": kind,
+        "timestamp": _iso(moment),
+        "volume_ml": volume_ml,
+        "duration_minutes": duration,
+        "notes": diaper_note if kind == "diaper" else None,
+    }
+    return [dict(event) for _ in range(count)]
+
+
+def parse_care_events(
+    text: str, now: Optional[datetime] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Extract add_log arguments from a care-event message without a model call.
+
+    Args:
+        text: The parent's message, e.g. "two wet diapers since 6am and a
+            90ml feed at 7".
+        now: Reference time for "at 7:10"-style times; defaults to now.
+
+    Returns:
+        A list of event dicts (event_type, timestamp, volume_ml,
+        duration_minutes, notes), or None when the message isn't clearly a
+        set of feed/nap/diaper events and the LLM should handle it.
+    """
+    now = now or datetime.now()
+    lowered = text.lower().strip().rstrip(".!")
+    if not lowered or _QUESTION.search(lowered):
+        return None
+
+    yesterday = bool(_YESTERDAY.search(lowered))
+    lowered = _YESTERDAY.sub(" ", lowered)
+    lowered = _BOTH_DIAPER.sub("mixed", lowered)
+
+    events: List[Dict[str, Any]] = []
+    for clause in _CLAUSE_SPLIT.split(lowered):
+        if not clause.strip():
+            continue
+        parsed = _parse_clause(clause, now, yesterday)
+        if parsed is None:
+            return None
+        events.extend(parsed)
+    return events or None
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    # Without flock the in-process locks in the stores still hold, but several
+    # processes sharing one data/ directory are not protected from each other.
+    fcntl = None  # type: ignore[assignment]
+
+
+class InterProcessLock:
+    """
+    Exclusive lock shared by threads in this process and by other processes.
+
+    A threading.RLock orders threads here; an flock on a sidecar file orders
+    processes. The flock is taken only by the outermost acquire, because two
+    flocks on separate descriptors of the same file block each other even
+    inside one process.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = -1
+
+    def acquire(self) -> None:
+        self._thread_lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except BaseException:
+                if self._fd >= 0:
+                    os.close(self._fd)
+                    self._fd = -1
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._fd >= 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = -1
+        self._thread_lock.release()
+
+    def __enter__(self) -> "InterProcessLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+def write_temp_sibling(path: Path, text: str, durable: bool = True) -> Path:
+    """Write text to a temp file next to path, ready to os.replace over it.
+
+    durable=False skips the fsync, for derived files that can be rebuilt.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+            if durable:
+                fh.flush()
+                os.fsync(fh.fileno())
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return Path(tmp_name)
+
+
+def atomic_write_text(path: Path, text: str, durable: bool = True) -> None:
+    """
+    Replace path with text so readers see either the old or the new file.
+
+    A crash mid-write leaves the previous contents intact.
+    """
+    tmp_file = write_temp_sibling(path, text, durable=durable)
+    try:
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,148 @@
+import re
+from functools import lru_cache
+from typing import Any, Tuple
+
+from parent_concierge.tools.date_resolver import resolve_day
+from parent_concierge.tools.event_parser import parse_care_events
+
+# Local intent classifier for the router in front of the orchestrator.
+#
+# "log": the message describes feeds/naps/diapers to record.
+# "summary": it asks for an overview of one day.
+# "other": anything else (trends, profile changes, questions, chat), which
+#   stays with the LLM orchestrator.
+#
+# Rules answer first and are certain: anything about health or worry is
+# "other" (it needs the orchestrator's care, whatever else it mentions), a
+# message the care event parser fully understands is a log, and a request
+# that says "summary"/"recap", or asks how a day went and names the day, is a
+# summary. Everything else goes to a small character n-gram logistic
+# regression trained on the examples below; callers only act on its answer
+# above a confidence threshold.
+
+INTENTS = ("log", "summary", "other")
+
+_SUMMARY = re.compile(r"\b(summary|summari[sz]e|recap|overview)\b")
+# Only a summary when the day is named too: "how did she get a rash?" isn't.
+_DAY_QUESTION = re.compile(
+    r"\b(how (was|has|did|is)|how's|what did .* look like|what happened)\b"
+)
+# Multi-day or profile questions look like summaries but aren't.
+_NOT_A_DAY_SUMMARY = re.compile(
+    r"\b(week|month|trend|since|days|profile|name|birthday|update|change)\b"
+)
+_HEALTH_OR_WORRY = re.compile(
+    r"\b(fever\w*|temperature|rash\w*|vomit\w*|sick|ill|unwell|poorly|cough\w*|"
+    r"cold|congest\w*|diarrh\w*|constipat\w*|blood\w*|pain\w*|hurt\w*|cry\w*|"
+    r"cried|colic\w*|jaundice\w*|breath\w*|medicine|medication|doctor|gp|"
+    r"hospital|dehydrat\w*|spit|spat|worr\w*|concern\w*|scared|anxious|normal|"
+    r"no|not|hasn't|hasnt|didn't|didnt|won't|wont|refus\w*|without)\b"
+)
+
+TRAINING_EXAMPLES = [
+    ("90ml at 7", "log"),
+    ("she had 120ml at 10:30", "log"),
+    ("bottle of 4oz just now", "log"),
+    ("fed her 100 ml around 6", "log"),
+    ("breastfed for 20 minutes on the left side", "log"),
+    ("nursed both sides at 3am", "log"),
+    ("nap from 2:15 to 3pm", "log"),
+    ("he napped for about 40 minutes after lunch", "log"),
+    ("slept 7pm to 5am with one wake", "log"),
+    ("went down for a nap at 1 and woke at 2:30", "log"),
+    ("wet diaper", "log"),
+    ("dirty nappy at 9", "log"),
+    ("changed a poopy diaper just now", "log"),
+    ("two wet diapers since 6am", "log"),
+    ("log a feed of 80ml", "log"),
+    ("please log a nap of an hour", "log"),
+    ("she drank 60ml of formula before bed", "log"),
+    ("big poo after the morning feed", "log"),
+    ("another bottle, 150ml, at 11", "log"),
+    ("add a wet nappy at 4:45", "log"),
+    ("how has today been?", "summary"),
+    ("can you summarise yesterday", "summary"),
+    ("give me a summary of today", "summary"),
+    ("what did feeds and naps look like today", "summary"),
+    ("how was her day", "summary"),
+    ("recap of yesterday please", "summary"),
+    ("how did last night go", "summary"),
+    ("daily summary", "summary"),
+    ("how many feeds has she had today", "summary"),
+    ("overview of 12 Nov", "summary"),
+    ("what happened yesterday", "summary"),
+    ("summary for Tuesday", "summary"),
+    ("how much did he drink today", "summary"),
+    ("how long did she nap today in total", "summary"),
+    ("how have feeds been this week?", "other"),
+    ("show me her naps over the last month", "other"),
+    ("how many wet diapers since Monday", "other"),
+    ("is it normal for a baby to feed every hour?", "other"),
+    ("she has a fever, what should I do", "other"),
+    ("change her date of birth to 3 March", "other"),
+    ("update the feeding type to formula", "other"),
+    ("hi", "other"),
+    ("thanks so much!", "other"),
+    ("what can you do?", "other"),
+    ("how do I log a feed?", "other"),
+    ("when was her longest nap this week", "other"),
+    ("I'm so tired today", "other"),
+    ("can you show me a trend chart", "other"),
+    ("my name is Sam", "other"),
+    ("any tips for getting her to sleep longer?", "other"),
+]
+
+
+@lru_cache(maxsize=1)
+def _model() -> Any:
+    # scikit-learn is only imported (and the model trained) on first use so
+    # importing the agent stays cheap.
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+
+    texts, labels = zip(*TRAINING_EXAMPLES)
+    model = make_pipeline(
+        TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), lowercase=True),
+        LogisticRegression(C=20, max_iter=1000),
+    )
+    model.fit(texts, labels)
+    return model
+
+
+def rule_intent(text: str) -> str:
+    """The intent the rules are certain of, or "" when they aren't."""
+    lowered = text.lower()
+    if _HEALTH_OR_WORRY.search(lowered):
+        return "other"
+    if parse_care_events(text) is not None:
+        return "log"
+    if _NOT_A_DAY_SUMMARY.search(lowered):
+        return ""
+    if _SUMMARY.search(lowered) and resolve_day(text) is not None:
+        return "summary"
+    if (
+        _DAY_QUESTION.search(lowered)
+        and resolve_day(text, default_to_today=False) is not None
+    ):
+        return "summary"
+    return ""
+
+
+def classify_intent(text: str) -> Tuple[str, float]:
+    """
+    Classify a user message as "log", "summary" or "other".
+
+    Returns:
+        (intent, confidence in 0..1). Rule matches have confidence 1.0.
+    """
+    if not text.strip():
+        return "other", 1.0
+    intent = rule_intent(text)
+    if intent:
+        return intent, 1.0
+
+    model = _model()
+    probabilities = model.predict_proba([text])[0]
+    best = probabilities.argmax()
+    return str(model.classes_[best]), float(probabilities[best])
@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded LRU map whose entries carry a validator.
+
+    A lookup only hits when the caller's current validator equals the one
+    stored with the entry, so callers pass something that changes whenever
+    the underlying data may have changed (file size/mtime, a write version).
+    The least recently used entry is evicted once max_entries is exceeded,
+    or once the values' total sizeof() exceeds max_bytes when that is set.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._sizeof = sizeof
+        self._bytes = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, validator: Any = None) -> Optional[Any]:
+        """Return the cached value, or None on a miss or a stale entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != validator:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, validator: Any = None) -> None:
+        with self._lock:
+            self._discard(key)
+            size = self._sizeof(value) if self.max_bytes is not None else 0
+            self._entries[key] = (validator, value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Bumped by every write made through this process, so cached reads are
+# invalidated even when a rewrite leaves size and mtime looking unchanged.
+_write_versions: Dict[Hashable, int] = defaultdict(int)
+_versions_lock = threading.Lock()
+
+
+def bump_write_version(key: Hashable) -> None:
+    with _versions_lock:
+        _write_versions[key] += 1
+
+
+def write_version(key: Hashable) -> int:
+    return _write_versions[key]
+
+
+def file_signature(*paths: Path) -> List[Any]:
+    """Size and mtime of each path (None if missing), for use in a validator."""
+    signature: List[Any] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            signature.append(None)
+        else:
+            signature.append([stat.st_size, stat.st_mtime_ns])
+    return signature
@@ -0,0 +1,308 @@
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Set
+from datetime import datetime, date as date_cls
+
+from parent_concierge.tools.care_stats import add_event_to_day_stats, empty_day_stats
+from parent_concierge.tools.tenancy import tenant_path
+
+SQLITE_DB_FILE = Path("data/parent_concierge.db")
+# Optional SQLite engine behind care_log_store/baby_profile_store, selected via
+# config.care_log_backend / config.profile_backend = "sqlite". The tool
+# functions keep their signatures; only the storage underneath changes. With
+# multi-tenancy each user gets their own database file, so SQLite's
+# database-wide write lock never spans two families.
+
+# Per-thread cap on open connections; the least recently used one is closed
+# when a thread touches more tenants than this.
+MAX_POOLED_CONNECTIONS = 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS care_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_type TEXT,
+    timestamp TEXT,
+    volume_ml INTEGER,
+    duration_minutes INTEGER,
+    notes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_care_logs_timestamp ON care_logs (timestamp);
+CREATE TABLE IF NOT EXISTS daily_stats (
+    day TEXT PRIMARY KEY,
+    stats TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    profile TEXT NOT NULL
+);
+"""
+
+_EVENT_COLUMNS = ("event_type", "timestamp", "volume_ml", "duration_minutes", "notes")
+
+# One connection per (process, thread, database file). SQLite connections are
+# cheap to keep open but not to share across threads, and a forked worker must
+# never reuse its parent's handle.
+_local = threading.local()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5.0)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    has_events = conn.execute("SELECT EXISTS (SELECT 1 FROM care_logs)").fetchone()[0]
+    has_stats = conn.execute("SELECT EXISTS (SELECT 1 FROM daily_stats)").fetchone()[0]
+    if has_events and not has_stats:
+        # A database created before the aggregate table existed.
+        _rebuild_daily_stats(conn)
+    return conn
+
+
+def _event_day(timestamp: Any) -> Optional[str]:
+    try:
+        return datetime.fromisoformat(timestamp).date().isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+def _aggregate_by_day(rows: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    """day_stats per ISO day for events given in insertion order."""
+    by_day: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        event = dict(row)
+        day = _event_day(event.get("timestamp"))
+        if day is not None:
+            add_event_to_day_stats(by_day.setdefault(day, empty_day_stats()), event)
+    return by_day
+
+
+def _rebuild_daily_stats(conn: sqlite3.Connection) -> int:
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        by_day = _aggregate_by_day(
+            conn.execute(
+                "SELECT event_type, timestamp, volume_ml, duration_minutes, notes"
+                " FROM care_logs ORDER BY id"
+            )
+        )
+        conn.execute("DELETE FROM daily_stats")
+        conn.executemany(
+            "INSERT INTO daily_stats (day, stats) VALUES (?, ?)",
+            [(day, json.dumps(stats)) for day, stats in by_day.items()],
+        )
+    return len(by_day)
+
+
+def database_file(user_id: Optional[str] = None) -> Path:
+    """The SQLite file holding this user's data."""
+    return tenant_path(SQLITE_DB_FILE, user_id)
+
+
+def get_connection(user_id: Optional[str] = None) -> sqlite3.Connection:
+    """Return this thread's pooled connection to the user's database, opening it once."""
+    pool: Optional["OrderedDict[str, sqlite3.Connection]"] = getattr(_local, "pool", None)
+    if pool is None or getattr(_local, "pid", None) != os.getpid():
+        pool = _local.pool = OrderedDict()
+        _local.pid = os.getpid()
+
+    db_file = database_file(user_id)
+    key = str(db_file.resolve())
+    conn = pool.get(key)
+    if conn is None:
+        conn = pool[key] = _connect(db_file)
+        while len(pool) > MAX_POOLED_CONNECTIONS:
+            _, evicted = pool.popitem(last=False)
+            evicted.close()
+    else:
+        pool.move_to_end(key)
+    return conn
+
+
+def close_connections() -> None:
+    """Close this thread's pooled connections (e.g. at shutdown or in tests)."""
+    pool = getattr(_local, "pool", None) or {}
+    for conn in pool.values():
+        conn.close()
+    pool.clear()
+
+
+def data_version(user_id: Optional[str] = None) -> tuple:
+    """
+    Change token for commits made by *other* connections to the database.
+
+    PRAGMA data_version is per connection, so the connection identity is part
+    of the token; commits through this same connection are not reflected and
+    must be tracked by the caller.
+    """
+    conn = get_connection(user_id)
+    return (id(conn), conn.execute("PRAGMA data_version").fetchone()[0])
+
+
+def insert_events(
+    events: Iterable[Dict[str, Any]], user_id: Optional[str] = None
+) -> int:
+    """
+    Insert care events in one transaction and return how many were written.
+
+    The daily_stats rows of the days touched are folded forward in the same
+    (immediate) transaction, so they always match the events.
+    """
+    events = list(events)
+    rows = [tuple(event.get(col) for col in _EVENT_COLUMNS) for event in events]
+    conn = get_connection(user_id)
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT INTO care_logs (event_type, timestamp, volume_ml, duration_minutes, notes)"
+            " VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        for day, added in _group_by_day(events).items():
+            row = conn.execute("SELECT stats FROM daily_stats WHERE day = ?", (day,)).fetchone()
+            stats = json.loads(row["stats"]) if row else empty_day_stats()
+            for event in added:
+                add_event_to_day_stats(stats, event)
+            conn.execute(
+                "INSERT INTO daily_stats (day, stats) VALUES (?, ?)"
+                " ON CONFLICT (day) DO UPDATE SET stats = excluded.stats",
+                (day, json.dumps(stats)),
+            )
+    return len(rows)
+
+
+def _group_by_day(events: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    by_day: Dict[str, List[Dict[str, Any]]] = {}
+    for event in events:
+        day = _event_day(event.get("timestamp"))
+        if day is not None:
+            by_day.setdefault(day, []).append(event)
+    return by_day
+
+
+def select_daily_stats(
+    start: date_cls, end: date_cls, user_id: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Stored day_stats for the days start..end that have events, keyed by ISO day."""
+    rows = get_connection(user_id).execute(
+        "SELECT day, stats FROM daily_stats WHERE day >= ? AND day <= ? ORDER BY day",
+        (start.isoformat(), end.isoformat()),
+    )
+    return {row["day"]: json.loads(row["stats"]) for row in rows}
+
+
+def stored_daily_stats(user_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Every stored daily_stats row, keyed by ISO day."""
+    rows = get_connection(user_id).execute("SELECT day, stats FROM daily_stats")
+    return {row["day"]: json.loads(row["stats"]) for row in rows}
+
+
+def rebuild_daily_stats(user_id: Optional[str] = None) -> int:
+    """Recompute every daily_stats row from care_logs; returns the number of days."""
+    return _rebuild_daily_stats(get_connection(user_id))
+
+
+def expected_daily_stats(user_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """day_stats recomputed from the raw events, for consistency checks."""
+    return _aggregate_by_day(
+        get_connection(user_id).execute(
+            "SELECT event_type, timestamp, volume_ml, duration_minutes, notes"
+            " FROM care_logs ORDER BY id"
+        )
+    )
+
+
+def _after_day(day: date_cls) -> str:
+    """
+    Exclusive upper bound for timestamps on `day`. "~" sorts after every
+    character of an ISO timestamp, and unlike the next day's date it can't
+    overflow at date.max.
+    """
+    return day.isoformat() + "~"
+
+
+def select_events_for_day(
+    target_date: date_cls, user_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Events on target_date in insertion order, via a range scan of the timestamp index."""
+    start = target_date.isoformat()
+    end = _after_day(target_date)
+    rows = get_connection(user_id).execute(
+        "SELECT event_type, timestamp, volume_ml, duration_minutes, notes"
+        " FROM care_logs WHERE timestamp >= ? AND timestamp < ? ORDER BY id",
+        (start, end),
+    )
+
+    events: List[Dict[str, Any]] = []
+    for row in rows:
+        try:
+            # ISO strings sort by date, but a malformed one can still land in
+            # the range; skip it the same way the JSON store does.
+            if datetime.fromisoformat(row["timestamp"]).date() != target_date:
+                continue
+        except ValueError:
+            continue
+        events.append(dict(row))
+    return events
+
+
+def iter_events_for_range(
+    start: date_cls,
+    end: date_cls,
+    event_types: Optional[Set[str]] = None,
+    user_id: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream events dated start..end (inclusive) in timestamp order, straight
+    from a cursor over the timestamp index.
+    """
+    query = (
+        "SELECT event_type, timestamp, volume_ml, duration_minutes, notes"
+        " FROM care_logs WHERE timestamp >= ? AND timestamp < ?"
+    )
+    params: List[Any] = [start.isoformat(), _after_day(end)]
+    if event_types is not None:
+        query += f" AND event_type IN ({', '.join('?' * len(event_types))})"
+        params.extend(sorted(event_types))
+    query += " ORDER BY timestamp, id"
+
+    for row in get_connection(user_id).execute(query, params):
+        try:
+            if not start <= datetime.fromisoformat(row["timestamp"]).date() <= end:
+                continue
+        except ValueError:
+            continue
+        yield dict(row)
+
+
+def count_events(user_id: Optional[str] = None) -> int:
+    return get_connection(user_id).execute("SELECT COUNT(*) FROM care_logs").fetchone()[0]
+
+
+def load_profile(user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    row = get_connection(user_id).execute("SELECT profile FROM profiles WHERE id = 1").fetchone()
+    return json.loads(row["profile"]) if row else None
+
+
+def store_profile(profile: Dict[str, Any], user_id: Optional[str] = None) -> None:
+    conn = get_connection(user_id)
+    with conn:
+        conn.execute(
+            "INSERT INTO profiles (id, profile) VALUES (1, ?)"
+            " ON CONFLICT (id) DO UPDATE SET profile = excluded.profile",
+            (json.dumps(profile, ensure_ascii=False),),
+        )
+
+
+def clear(user_id: Optional[str] = None) -> None:
+    """Delete every care event and the profile."""
+    conn = get_connection(user_id)
+    with conn:
+        conn.execute("DELETE FROM care_logs")
+        conn.execute("DELETE FROM daily_stats")
+        conn.execute("DELETE FROM profiles")
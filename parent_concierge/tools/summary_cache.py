@@ -0,0 +1,39 @@
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from parent_concierge.tools.read_cache import LRUCache
+from parent_concierge.tools.tenancy import storage_owner
+
+# Finished daily summaries, one entry per (storage owner, day). Each entry is
+# validated against a hash of the day's events, so a summary is only reused
+# for byte-for-byte the same logs; add_log also drops the entry for the day it
+# writes to.
+SUMMARY_CACHE_MAX_ENTRIES = 512
+_summary_cache = LRUCache(max_entries=SUMMARY_CACHE_MAX_ENTRIES)
+
+
+def events_hash(events: List[Dict[str, Any]]) -> str:
+    """Stable hash of a day's events, independent of dict key order."""
+    canonical = json.dumps(events, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def lookup(
+    user_id: Optional[str], day: str, events: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """The cached summary for this day if it was built from these exact events."""
+    return _summary_cache.get((storage_owner(user_id), day), events_hash(events))
+
+
+def store(
+    user_id: Optional[str],
+    day: str,
+    events: List[Dict[str, Any]],
+    summary: Dict[str, Any],
+) -> None:
+    _summary_cache.put((storage_owner(user_id), day), summary, events_hash(events))
+
+
+def invalidate_day(user_id: Optional[str], day: str) -> None:
+    _summary_cache.pop((storage_owner(user_id), day))
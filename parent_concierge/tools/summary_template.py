@@ -0,0 +1,148 @@
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from parent_concierge.tools.care_stats import (
+    compute_day_stats,
+    events_from_state,
+    object_from_state,
+)
+
+NO_EVENTS_MESSAGE = (
+    "I don't see any care events logged for that day yet. Once you log feeds, "
+    "naps or diapers, I can summarise them for you."
+)
+
+
+def _plural(count: int, noun: str) -> str:
+    return f"{count} {noun}" if count == 1 else f"{count} {noun}s"
+
+
+def _duration(minutes: int) -> str:
+    hours, mins = divmod(minutes, 60)
+    if not hours:
+        return f"{mins} min"
+    return f"{hours} h {mins} min" if mins else f"{hours} h"
+
+
+def _count(section: Any, key: str) -> int:
+    value = section.get(key) if isinstance(section, dict) else None
+    return int(value) if isinstance(value, (int, float)) else 0
+
+
+def stats_sentence(day_stats: Dict[str, Any]) -> Optional[str]:
+    """
+    One short sentence with the day's key numbers, e.g. "In total that's
+    3 feeds (360 ml), 2 naps (1 h 30 min) and 4 diaper changes."
+
+    Returns None when nothing was logged.
+    """
+    feeds = _count(day_stats.get("feeds"), "count")
+    volume = _count(day_stats.get("feeds"), "total_volume_ml")
+    naps = _count(day_stats.get("naps"), "count")
+    nap_minutes = _count(day_stats.get("naps"), "total_minutes")
+    diapers = _count(day_stats.get("diapers"), "count")
+
+    parts = []
+    if feeds:
+        parts.append(_plural(feeds, "feed") + (f" ({volume} ml)" if volume else ""))
+    if naps:
+        parts.append(
+            _plural(naps, "nap") + (f" ({_duration(nap_minutes)})" if nap_minutes else "")
+        )
+    if diapers:
+        parts.append(_plural(diapers, "diaper change"))
+    if not parts:
+        return None
+
+    listed = parts[0] if len(parts) == 1 else ", ".join(parts[:-1]) + " and " + parts[-1]
+    return f"In total that's {listed}."
+
+
+def _event_phrase(event: Dict[str, Any]) -> str:
+    event_type = event.get("event_type")
+    if event_type == "feed":
+        if event.get("volume_ml"):
+            return f"{event['volume_ml']} ml feed"
+        if event.get("duration_minutes"):
+            return f"{_duration(event['duration_minutes'])} feed"
+        return "feed"
+    if event_type == "nap":
+        if event.get("duration_minutes"):
+            return f"{_duration(event['duration_minutes'])} nap"
+        return "nap"
+    notes = event.get("notes")
+    return f"{notes} diaper" if notes else "diaper change"
+
+
+def _event_time(timestamp: Any, today: date) -> str:
+    try:
+        moment = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return ""
+    if moment.date() == today:
+        return f" at {moment:%H:%M}"
+    return f" at {moment:%H:%M} on {moment:%d %b}"
+
+
+def logged_events_sentence(
+    events: List[Dict[str, Any]], today: Optional[date] = None
+) -> str:
+    """
+    Confirm logged events in one sentence, e.g. "Logged a 90 ml feed at
+    07:00 and 2 wet diapers at 06:00."
+    """
+    today = today or date.today()
+    groups: Dict[Tuple[str, str], int] = {}
+    for event in events:
+        key = (_event_phrase(event), _event_time(event.get("timestamp"), today))
+        groups[key] = groups.get(key, 0) + 1
+
+    parts = [
+        (f"a {phrase}" if count == 1 else f"{count} {phrase}s") + when
+        for (phrase, when), count in groups.items()
+    ]
+    if not parts:
+        return "Nothing to log."
+    listed = parts[0] if len(parts) == 1 else ", ".join(parts[:-1]) + " and " + parts[-1]
+    return f"Logged {listed}."
+
+
+def visualization_artifact_id(day_visualization: Any) -> Optional[str]:
+    """The chart artifact id from the visualization agent's reply, if any."""
+    reply = object_from_state(day_visualization)
+    artifact_id = reply.get("artifact_id") or reply.get("filename")
+    return artifact_id if isinstance(artifact_id, str) and artifact_id else None
+
+
+def build_summary_output(
+    logs_for_day: Any,
+    day_stats: Any,
+    day_summary: Any,
+    day_visualization: Any,
+) -> Dict[str, Any]:
+    """
+    Merge the summary team's outputs into the final summary object.
+
+    Args:
+        logs_for_day: The day's events (list or LLM JSON text).
+        day_stats: The day_stats object or its JSON text; recomputed from
+            the events when missing.
+        day_summary: The narrative paragraph.
+        day_visualization: The visualization agent's {"artifact_id": ...} reply.
+
+    Returns:
+        {"message": str, "visualization_artifact_id": str | None}
+    """
+    events: List[Dict[str, Any]] = events_from_state(logs_for_day)
+    if not events:
+        return {"message": NO_EVENTS_MESSAGE, "visualization_artifact_id": None}
+
+    stats = object_from_state(day_stats) or compute_day_stats(events)
+    narrative = day_summary.strip() if isinstance(day_summary, str) else ""
+    sentence = stats_sentence(stats)
+
+    message = " ".join(part for part in (narrative, sentence) if part)
+    return {
+        "message": message or NO_EVENTS_MESSAGE,
+        "visualization_artifact_id": visualization_artifact_id(day_visualization),
+    }
@@ -0,0 +1,56 @@
+import hashlib
+import re
+from pathlib import Path
+from typing import Optional
+
+from google.adk.tools import ToolContext
+
+from parent_concierge.config import config
+
+# Per-family storage: with config.multi_tenant enabled, every store file moves
+# from data/<name> to data/users/<tenant>/<name>, so one family's writes never
+# rewrite or lock another family's files and the shard is found by path alone.
+TENANTS_DIR_NAME = "users"
+
+_SAFE_USER_ID = re.compile(r"^[A-Za-z0-9_.@-]{1,64}$")
+
+
+def user_id_from_context(tool_context: Optional[ToolContext]) -> Optional[str]:
+    """The ADK session's user_id, or None when called outside an agent run."""
+    if tool_context is None:
+        return None
+    return tool_context.session.user_id
+
+
+def storage_owner(user_id: Optional[str]) -> Optional[str]:
+    """
+    The user whose files back this user's data: the user themself with
+    multi-tenancy on, otherwise None (everyone shares the single-tenant files).
+    Use it to key process-wide caches of stored data.
+    """
+    return user_id if config.multi_tenant and user_id else None
+
+
+def tenant_key(user_id: str) -> str:
+    """Filesystem-safe directory name for a user_id."""
+    if _SAFE_USER_ID.match(user_id) and user_id not in {".", ".."}:
+        return user_id
+    return "u-" + hashlib.sha256(user_id.encode("utf-8")).hexdigest()[:32]
+
+
+def tenant_path(path: Path, user_id: Optional[str]) -> Path:
+    """
+    Map a shared store path to the given user's shard.
+
+    Args:
+        path: The single-tenant location, e.g. Path("data/care_logs.json").
+        user_id: ADK user id, or None for the shared (single-tenant) files.
+
+    Returns:
+        path unchanged when multi-tenancy is off or there is no user, else
+        path.parent / "users" / <tenant_key(user_id)> / path.name.
+    """
+    owner = storage_owner(user_id)
+    if owner is None:
+        return path
+    return path.parent / TENANTS_DIR_NAME / tenant_key(owner) / path.name
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import math
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from google.adk.tools import ToolContext
+
+from parent_concierge.tools.care_log_store import iter_daily_stats, iter_logs_for_range
+from parent_concierge.tools.tenancy import user_id_from_context
+from parent_concierge.tools.visualizations_tools import save_chart_artifact
+
+if TYPE_CHECKING:
+    import pandas
+
+TREND_FILENAME = "care_trend_chart.png"
+TREND_PERIOD_DAYS = {"week": 7, "month": 30}
+TREND_COLUMNS = [
+    "feed_volume_ml",
+    "nap_minutes",
+    "diaper_count",
+    "mean_feed_interval_minutes",
+]
+# Style parameters of the trend chart; part of its cache key.
+TREND_STYLE: Dict[str, Any] = {
+    "figsize": (10, 6.5),
+    "dpi": 110,
+    "title": "Care Trends",
+    "max_xticks": 10,
+}
+
+# pandas and matplotlib are imported inside the functions that use them so
+# importing the agent stays cheap (see visualizations_tools).
+
+
+def aggregate_trends(
+    events: List[Dict[str, Any]],
+    start: date,
+    end: date,
+    daily_stats: Optional[Iterable[Tuple[date, Dict[str, Any]]]] = None,
+) -> "pandas.DataFrame":
+    """
+    Per-day trend table for start..end (inclusive), built with pandas
+    group-bys rather than a Python loop over events.
+
+    Args:
+        events: Care event dicts, in any order; events outside the range and
+            events without a parseable timestamp are ignored.
+        start: First day of the range.
+        end: Last day of the range.
+        daily_stats: Optional (day, day_stats) pairs from the store's
+            aggregate table. When given, the volume/nap/diaper columns come
+            from them and `events` only needs the feeds (for intervals).
+
+    Returns:
+        DataFrame indexed by every day in the range with columns
+        feed_volume_ml, nap_minutes, diaper_count (0 on days with no events)
+        and mean_feed_interval_minutes (NaN on days with fewer than one
+        interval). A feed's interval is measured from the previous feed, so
+        the first feed of a day counts the gap since last night's feed.
+    """
+    import pandas as pd
+
+    days = pd.date_range(start, end, freq="D")
+    frame = pd.DataFrame(
+        events, columns=["event_type", "timestamp", "volume_ml", "duration_minutes"]
+    )
+
+    try:
+        timestamps = pd.to_datetime(frame["timestamp"], errors="coerce", format="ISO8601")
+    except (TypeError, ValueError):
+        # Mixed naive and offset-aware timestamps: compare them all as UTC.
+        timestamps = pd.to_datetime(
+            frame["timestamp"], errors="coerce", format="ISO8601", utc=True
+        ).dt.tz_convert(None)
+    if getattr(timestamps.dt, "tz", None) is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+
+    frame = frame.assign(
+        ts=timestamps,
+        volume_ml=pd.to_numeric(frame["volume_ml"], errors="coerce"),
+        duration_minutes=pd.to_numeric(frame["duration_minutes"], errors="coerce"),
+    ).dropna(subset=["ts"])
+    frame["day"] = frame["ts"].dt.normalize()
+
+    feeds = frame[frame["event_type"] == "feed"].sort_values("ts")
+    intervals = feeds["ts"].diff().dt.total_seconds() / 60
+    in_range = frame[(frame["day"] >= days[0]) & (frame["day"] <= days[-1])]
+    kinds = in_range["event_type"]
+
+    table = pd.DataFrame(index=days)
+    if daily_stats is not None:
+        stored = pd.DataFrame.from_records(
+            [
+                (
+                    pd.Timestamp(day),
+                    stats["feeds"]["total_volume_ml"],
+                    stats["naps"]["total_minutes"],
+                    stats["diapers"]["count"],
+                )
+                for day, stats in daily_stats
+            ],
+            columns=["day", "feed_volume_ml", "nap_minutes", "diaper_count"],
+            index="day",
+        )
+        table = table.join(stored)
+    else:
+        table["feed_volume_ml"] = (
+            in_range["volume_ml"].where(kinds == "feed").groupby(in_range["day"]).sum()
+        )
+        table["nap_minutes"] = (
+            in_range["duration_minutes"].where(kinds == "nap").groupby(in_range["day"]).sum()
+        )
+        table["diaper_count"] = (kinds == "diaper").groupby(in_range["day"]).sum()
+    table = table.fillna(0).astype(
+        {"feed_volume_ml": int, "nap_minutes": int, "diaper_count": int}
+    )
+    table["mean_feed_interval_minutes"] = intervals.groupby(feeds["day"]).mean()
+    table.index.name = "day"
+    return table[TREND_COLUMNS]
+
+
+def trend_key(series: Dict[str, List[Any]], style: Dict[str, Any] = TREND_STYLE) -> str:
+    """Content hash of a trend chart: its plotted series plus the style."""
+    payload = json.dumps({"trend": series, "style": style}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_trend_chart_png(
+    series: Dict[str, List[Any]], style: Dict[str, Any] = TREND_STYLE
+) -> bytes:
+    """
+    Draw the four per-day trend panels and return them as PNG bytes.
+
+    Args:
+        series: {"days": [ISO dates], <TREND_COLUMNS>: [value per day]};
+            missing feed intervals are None.
+    """
+    import io
+
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=style["figsize"])
+    axes = fig.subplots(2, 2, sharex=True)
+    labels = [day[5:] for day in series["days"]]  # MM-DD
+    positions = list(range(len(labels)))
+
+    panels = [
+        (axes[0][0], "feed_volume_ml", "Feed volume (ml)", "bar"),
+        (axes[0][1], "nap_minutes", "Nap time (mins)", "bar"),
+        (axes[1][0], "diaper_count", "Diapers", "bar"),
+        (axes[1][1], "mean_feed_interval_minutes", "Avg feed interval (mins)", "line"),
+    ]
+    for ax, column, title, kind in panels:
+        values = [float("nan") if v is None else v for v in series[column]]
+        if kind == "bar":
+            ax.bar(positions, values, zorder=2)
+        else:
+            ax.plot(positions, values, marker="o", zorder=2)
+        ax.set_title(title, fontsize=11)
+        ax.grid(axis="y", linestyle="--", alpha=0.35, zorder=0)
+
+    step = max(1, -(-len(labels) // style["max_xticks"]))
+    for ax in axes[1]:
+        ax.set_xticks(positions[::step])
+        ax.set_xticklabels(labels[::step], rotation=45, ha="right", fontsize=9)
+
+    fig.suptitle(style["title"], fontsize=14)
+    fig.tight_layout()
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=style["dpi"])
+    return buf.getvalue()
+
+
+def _series(table: "pandas.DataFrame") -> Dict[str, List[Any]]:
+    series: Dict[str, List[Any]] = {"days": [d.date().isoformat() for d in table.index]}
+    for column in TREND_COLUMNS:
+        values = table[column].round(1) if column == "mean_feed_interval_minutes" else table[column]
+        series[column] = [
+            None if isinstance(v, float) and math.isnan(v) else v for v in values.tolist()
+        ]
+    return series
+
+
+async def create_trend_chart_artifact(
+    period: str = "week",
+    end_date: Optional[str] = None,
+    *,
+    tool_context: ToolContext,
+) -> Dict[str, Any]:
+    """
+    Generate a PNG trend chart of daily feed volume, nap minutes, diaper
+    counts and average feed interval over the last week or month.
+
+    Args:
+        period: "week" (7 days) or "month" (30 days).
+        end_date: Last day of the range as YYYY-MM-DD; defaults to today.
+
+    Returns:
+        {
+          "filename": "care_trend_chart.png",
+          "version": <int version>,
+          "start_date": "YYYY-MM-DD",
+          "end_date": "YYYY-MM-DD",
+        }
+        or {"error": <message>} for an unknown period or bad date.
+    """
+    if period not in TREND_PERIOD_DAYS:
+        return {"error": f"period must be one of {sorted(TREND_PERIOD_DAYS)}"}
+    try:
+        end = date.fromisoformat(end_date) if end_date else date.today()
+        # Feeds are read from the day before start (see below).
+        start = end - timedelta(days=TREND_PERIOD_DAYS[period] - 1)
+        feeds_from = start - timedelta(days=1)
+    except (ValueError, OverflowError):
+        return {"error": "end_date must be YYYY-MM-DD"}
+
+    # Totals come from the store's per-day aggregates; only the feeds are
+    # read, from one extra day back so the first day's feed intervals can
+    # reach back to the previous evening.
+    user_id = user_id_from_context(tool_context)
+    feeds = list(
+        iter_logs_for_range(feeds_from, end, ["feed"], user_id)
+    )
+    daily_stats = iter_daily_stats(start, end, user_id)
+
+    series = _series(aggregate_trends(feeds, start, end, daily_stats))
+    result = await save_chart_artifact(
+        tool_context,
+        TREND_FILENAME,
+        trend_key(series),
+        render_trend_chart_png,
+        series,
+    )
+    result.update(start_date=start.isoformat(), end_date=end.isoformat())
+    return result
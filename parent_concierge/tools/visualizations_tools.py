@@ -1,48 +1,63 @@
+import asyncio
+import functools
+import hashlib
 import io
+import json
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 
-import matplotlib.pyplot as plt
-from matplotlib.offsetbox import OffsetImage, AnnotationBbox
-import google.genai.types as types
 from google.adk.tools import ToolContext
+from google.genai import types
 
+from parent_concierge.config import config
+from parent_concierge.tools.read_cache import LRUCache
 
-# Pre-load icons (64x64 PNGs) from the assets folder so repeated tool calls
-# reuse cached images instead of re-reading from disk inside the async flow.
+
+# Icons (64x64 PNGs) from the assets folder. matplotlib and the icons are
+# loaded on the first render, not at import, so starting the agent (CLI, tests,
+# cold starts) doesn't pay for them unless a chart is drawn.
 ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
 FEED_ICON_PATH = ASSETS_DIR / "feed_icon.png"
 NAP_ICON_PATH = ASSETS_DIR / "nap_icon.png"
 DIAPER_ICON_PATH = ASSETS_DIR / "diaper_icon.png"
 
+CHART_FILENAME = "daily_summary_chart.png"
+CHART_METRICS = ["Feeds (ml)", "Naps (mins)", "Diapers"]
+# Everything besides the bar values that changes the rendered pixels; part of
+# the chart cache key, so edit it here rather than inline in the renderer.
+CHART_STYLE: Dict[str, Any] = {
+    "figsize": (7, 4.5),
+    "dpi": 120,
+    "title": "Daily Care Summary",
+    "icon_zoom": 0.4,
+    "label_offset": 8,
+    "icon_offset": 30,  # Spacing keeps labels/icons from overlapping small bars.
+}
 
-def _load_icon(path: Path, zoom: float = 0.6) -> OffsetImage:
-    """Load an icon image and wrap it as an OffsetImage for use with AnnotationBbox."""
-    img = plt.imread(path)
-    return OffsetImage(img, zoom=zoom)
-
-
-FEED_ICON_IMG = _load_icon(FEED_ICON_PATH, zoom=0.4)
-NAP_ICON_IMG = _load_icon(NAP_ICON_PATH, zoom=0.4)
-DIAPER_ICON_IMG = _load_icon(DIAPER_ICON_PATH, zoom=0.4)
+# Rendered PNGs keyed by chart_key(values); a day's chart is only drawn once
+# per process. Bounded by total PNG size as well as entry count.
+CHART_CACHE_MAX_ENTRIES = 256
+CHART_CACHE_MAX_BYTES = 16 * 1024 * 1024
+_png_cache = LRUCache(max_entries=CHART_CACHE_MAX_ENTRIES, max_bytes=CHART_CACHE_MAX_BYTES)
 
+# Session-state key mapping filename -> {chart_key: artifact version} for
+# the latest chart saved under that filename in this session, so asking for
+# the same chart again reuses that version instead of adding a new one.
+# Older versions are never reused: the chart id the summary carries is
+# just the filename, which resolves to the latest version.
+CHART_VERSIONS_STATE_KEY = "chart_artifact_versions"
 
-async def create_bar_chart_artifact(
-    logs_for_day: List[Dict[str, Any]],
-    tool_context: ToolContext,
-) -> Dict[str, Any]:
-    """
-    Generate a PNG bar chart representing feeds, naps, and diapers for a given day.
+# Rendering runs in a bounded pool so a PNG being drawn never blocks the
+# event loop serving other sessions. Created on first use; see
+# config.chart_render_executor / config.chart_render_workers.
+_render_executor: Optional[Executor] = None
+_render_executor_lock = threading.Lock()
 
-    Args:
-        logs_for_day: List of care events for the day.
 
-    Returns:
-        {
-          "filename": "daily_summary_chart.png",
-          "version": <int version>,
-        }
-    """
+def chart_values(logs_for_day: List[Dict[str, Any]]) -> List[int]:
+    """[total feed ml, total nap minutes, diaper count] for the chart bars."""
     total_feed_ml = 0
     total_nap_minutes = 0
     diaper_count = 0
@@ -60,14 +75,47 @@ async def create_bar_chart_artifact(
         elif etype == "diaper":
             diaper_count += 1
 
-    metrics = ["Feeds (ml)", "Naps (mins)", "Diapers"]
-    values = [total_feed_ml, total_nap_minutes, diaper_count]
+    return [total_feed_ml, total_nap_minutes, diaper_count]
 
-    fig, ax = plt.subplots(figsize=(7, 4.5))
 
-    bars = ax.bar(metrics, values, zorder=2)
+@functools.cache
+def _icon_arrays() -> Dict[str, Any]:
+    """
+    Icon pixel arrays by chart metric, read once per process. Only the arrays
+    are shared: matplotlib artists belong to one figure, so each render wraps
+    them in fresh OffsetImages.
+    """
+    import matplotlib.image as mpimg
+
+    return {
+        "Feeds (ml)": mpimg.imread(FEED_ICON_PATH),
+        "Naps (mins)": mpimg.imread(NAP_ICON_PATH),
+        "Diapers": mpimg.imread(DIAPER_ICON_PATH),
+    }
+
+
+def chart_key(values: List[int], style: Dict[str, Any] = CHART_STYLE) -> str:
+    """Content hash of a chart: its bar values plus the style parameters."""
+    payload = json.dumps({"values": list(values), "style": style}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_bar_chart_png(values: List[int], style: Dict[str, Any] = CHART_STYLE) -> bytes:
+    """
+    Draw the daily summary bar chart and return it as PNG bytes.
 
-    ax.set_title("Daily Care Summary", fontsize=14, pad=12)
+    Uses the object-oriented Figure API with its own Agg canvas and no pyplot
+    state, so it is safe to call from several threads or processes at once.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.offsetbox import AnnotationBbox, OffsetImage
+
+    fig = Figure(figsize=style["figsize"])
+    ax = fig.subplots()
+
+    bars = ax.bar(CHART_METRICS, values, zorder=2)
+
+    ax.set_title(style["title"], fontsize=14, pad=12)
     ax.set_ylabel("Value", fontsize=12)
     ax.tick_params(axis="x", labelrotation=10, labelsize=11)
     ax.tick_params(axis="y", labelsize=10)
@@ -78,16 +126,12 @@ async def create_bar_chart_artifact(
 
     ax.set_ylim(0, max_val * 1.35 + 10)
 
-    LABEL_OFFSET = 8
-    ICON_OFFSET = 30  # Spacing keeps labels/icons from overlapping small bars.
+    LABEL_OFFSET = style["label_offset"]
+    ICON_OFFSET = style["icon_offset"]
 
-    icon_map = {
-        "Feeds (ml)": FEED_ICON_IMG,
-        "Naps (mins)": NAP_ICON_IMG,
-        "Diapers": DIAPER_ICON_IMG,
-    }
+    icon_map = _icon_arrays()
 
-    for bar, metric_label, value in zip(bars, metrics, values):
+    for bar, metric_label, value in zip(bars, CHART_METRICS, values):
         height = bar.get_height()
         x_center = bar.get_x() + bar.get_width() / 2
 
@@ -101,9 +145,8 @@ async def create_bar_chart_artifact(
             fontsize=11,
         )
 
-        icon_img = icon_map[metric_label]
         ab = AnnotationBbox(
-            icon_img,
+            OffsetImage(icon_map[metric_label], zoom=style["icon_zoom"]),
             (x_center, height),
             xybox=(0, LABEL_OFFSET + ICON_OFFSET),
             frameon=False,
@@ -113,24 +156,120 @@ async def create_bar_chart_artifact(
         )
         ax.add_artist(ab)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     buf = io.BytesIO()
-    plt.savefig(buf, format="png", dpi=120)
-    plt.close(fig)
-    buf.seek(0)
+    fig.savefig(buf, format="png", dpi=style["dpi"])
+    return buf.getvalue()
+
+
+def _get_render_executor() -> Executor:
+    global _render_executor
+    with _render_executor_lock:
+        if _render_executor is None:
+            if config.chart_render_executor == "process":
+                _render_executor = ProcessPoolExecutor(
+                    max_workers=config.chart_render_workers
+                )
+            else:
+                _render_executor = ThreadPoolExecutor(
+                    max_workers=config.chart_render_workers,
+                    thread_name_prefix="chart-render",
+                )
+        return _render_executor
+
+
+def shutdown_render_executor() -> None:
+    """Stop the render pool; the next chart request starts a new one."""
+    global _render_executor
+    with _render_executor_lock:
+        executor, _render_executor = _render_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def render_png_async(key: str, render: Callable[..., bytes], *args: Any) -> bytes:
+    """
+    PNG bytes for a chart with content hash `key`: from the chart cache, else
+    render(*args) on the render pool (awaited from the event loop) and cached.
+    """
+    png = _png_cache.get(key)
+    if png is None:
+        loop = asyncio.get_running_loop()
+        png = await loop.run_in_executor(_get_render_executor(), render, *args)
+        _png_cache.put(key, png)
+    return png
+
+
+async def render_bar_chart_png_async(values: List[int]) -> bytes:
+    return await render_png_async(chart_key(values), render_bar_chart_png, values)
+
+
+async def save_chart_artifact(
+    tool_context: ToolContext,
+    filename: str,
+    key: str,
+    render: Callable[..., bytes],
+    *args: Any,
+) -> Dict[str, Any]:
+    """
+    Save a chart as a PNG artifact and return {"filename", "version"}.
+
+    If the latest version saved under `filename` in this session is the
+    chart with content hash `key`, that version is returned without
+    rendering or saving again (and recorded in artifact_delta so the UI
+    shows it).
+    """
+    saved = tool_context.state.get(CHART_VERSIONS_STATE_KEY) or {}
+    latest = saved.get(filename) or {}
+    if key in latest and latest[key] == max(latest.values()):
+        version = latest[key]
+        tool_context.actions.artifact_delta[filename] = version
+        return {"filename": filename, "version": version}
+
+    png = await render_png_async(key, render, *args)
 
     image_part = types.Part.from_bytes(
-        data=buf.getvalue(),
+        data=png,
         mime_type="image/png",
     )
 
     version = await tool_context.save_artifact(
-        filename="daily_summary_chart.png",
+        filename=filename,
         artifact=image_part,
     )
+    tool_context.state[CHART_VERSIONS_STATE_KEY] = {**saved, filename: {key: version}}
 
     return {
-        "filename": "daily_summary_chart.png",
+        "filename": filename,
         "version": version,
     }
+
+
+async def create_bar_chart_artifact(
+    logs_for_day: List[Dict[str, Any]],
+    tool_context: ToolContext,
+) -> Dict[str, Any]:
+    """
+    Generate a PNG bar chart representing feeds, naps, and diapers for a given day.
+
+    Args:
+        logs_for_day: List of care events for the day.
+
+    Returns:
+        {
+          "filename": "daily_summary_chart.png",
+          "version": <int version>,
+        }
+
+        A chart identical to one already saved in this session returns that
+        artifact's version instead of saving a new one.
+    """
+    values = chart_values(logs_for_day)
+    return await save_chart_artifact(
+        tool_context,
+        CHART_FILENAME,
+        chart_key(values),
+        render_bar_chart_png,
+        values,
+    )
@@ -0,0 +1,67 @@
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+
+class CountingStage(BaseAgent):
+    """Stands in for the LLM summary stages and counts how often it runs."""
+
+    runs: int = 0
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        self.runs += 1
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text="summary")]),
+            actions=EventActions(
+                state_delta={"day_stats": {"runs": self.runs}, "summary_output": "summary"}
+            ),
+        )
+
+
+@pytest.fixture
+def counting_stage():
+    return CountingStage(name="stage")
+
+
+@pytest.fixture
+def run_turn():
+    """
+    Run one user turn on a new session and return (reply texts, final
+    state). Takes an agent, or a runner to share its services across turns.
+    """
+
+    def run_turn(runner, state, text="today"):
+        if isinstance(runner, BaseAgent):
+            runner = InMemoryRunner(agent=runner, app_name="test")
+
+        async def run():
+            session = await runner.session_service.create_session(
+                app_name="test", user_id="u", state=state
+            )
+            replies = []
+            async for event in runner.run_async(
+                user_id="u",
+                session_id=session.id,
+                new_message=types.Content(role="user", parts=[types.Part(text=text)]),
+            ):
+                if event.content and event.content.parts and event.content.parts[0].text:
+                    replies.append(event.content.parts[0].text)
+            session = await runner.session_service.get_session(
+                app_name="test", user_id="u", session_id=session.id
+            )
+            return replies, session.state
+
+        return asyncio.run(run())
+
+    return run_turn
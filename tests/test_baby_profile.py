@@ -56,3 +56,15 @@ def test_save_and_get_profile(tmp_path):
     assert profile["date_of_birth"] == dob_str
     assert profile["feeding_type"] == feeding_type
     assert profile["country"] == country
+
+
+def test_profile_cache_sees_external_edits(tmp_path):
+    test_file: Path = tmp_path / "profiles.json"
+    baby_profile_store.PROFILE_FILE = test_file
+
+    baby_profile_store.save_profile("Stephen", "Leo", "2024-08-01", "bottle", "UK")
+    assert baby_profile_store.get_profile()["profile"]["baby_name"] == "Leo"
+
+    # Another process rewrites the file; size/mtime change invalidates the cache.
+    test_file.write_text('{"profile": {"baby_name": "Mia"}}', encoding="utf-8")
+    assert baby_profile_store.get_profile()["profile"]["baby_name"] == "Mia"
@@ -1,7 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 from parent_concierge.tools import care_log_store
+from parent_concierge.tools.care_stats import compute_day_stats
 
 
 def test_add_and_get_logs_for_day(tmp_path):
@@ -50,3 +55,263 @@ def test_add_and_get_logs_for_day(tmp_path):
     assert only_event["event_type"] == "feed"
     assert only_event["volume_ml"] == 90
     assert only_event["notes"] == "Bottle feed"
+
+
+def test_journal_mode_appends_and_compacts(tmp_path, monkeypatch):
+    test_file: Path = tmp_path / "care_logs.json"
+    care_log_store.CARE_LOG_FILE = test_file
+    monkeypatch.setattr(care_log_store.config, "care_log_backend", "journal")
+
+    for hour in (6, 9, 12):
+        res = care_log_store.add_log(
+            event_type="feed",
+            timestamp=datetime(2025, 11, 21, hour, 0).isoformat(),
+            volume_ml=100 + hour,
+        )
+        assert res.get("status") == "success"
+
+    # Writes only touch the journal; the snapshot stays an empty array.
+    journal = tmp_path / "care_logs.jsonl"
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 3
+    assert test_file.read_text(encoding="utf-8") == "[]"
+
+    logs = care_log_store.get_logs_for_day("2025-11-21")
+    assert [e["volume_ml"] for e in logs] == [106, 109, 112]
+
+    result = care_log_store.compact_care_log()
+    assert result == {"status": "success", "compacted_events": 3}
+    assert not journal.exists()
+
+    # Reads are unchanged after compaction, and new writes go to a fresh journal.
+    care_log_store.add_log(
+        event_type="diaper", timestamp=datetime(2025, 11, 21, 13, 0).isoformat()
+    )
+    logs = care_log_store.get_logs_for_day("2025-11-21")
+    assert [e["event_type"] for e in logs] == ["feed", "feed", "feed", "diaper"]
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_day_index_is_maintained_and_rebuilt(tmp_path):
+    test_file: Path = tmp_path / "care_logs.json"
+    care_log_store.CARE_LOG_FILE = test_file
+
+    care_log_store.add_log(event_type="feed", timestamp="2025-11-20T08:00:00")
+    care_log_store.add_log(event_type="nap", timestamp="2025-11-21T13:00:00")
+
+    # The first read builds the shards; later writes append to them directly.
+    assert len(care_log_store.get_logs_for_day("2025-11-21")) == 1
+    shard = tmp_path / "care_logs_by_day" / "2025-11-21.jsonl"
+    assert shard.exists()
+
+    care_log_store.add_log(event_type="diaper", timestamp="2025-11-21T14:00:00")
+    assert len(shard.read_text(encoding="utf-8").splitlines()) == 2
+    assert [e["event_type"] for e in care_log_store.get_logs_for_day("2025-11-21")] == [
+        "nap",
+        "diaper",
+    ]
+
+    # Editing the log behind the store's back invalidates the shards.
+    test_file.write_text(
+        '[{"event_type": "feed", "timestamp": "2025-11-21T06:00:00"}]',
+        encoding="utf-8",
+    )
+    logs = care_log_store.get_logs_for_day("2025-11-21")
+    assert [e["event_type"] for e in logs] == ["feed"]
+    assert care_log_store.get_logs_for_day("2025-11-20") == []
+
+
+def test_multi_tenant_logs_are_sharded_per_user(tmp_path, monkeypatch):
+    test_file: Path = tmp_path / "care_logs.json"
+    care_log_store.CARE_LOG_FILE = test_file
+    monkeypatch.setattr(care_log_store.config, "multi_tenant", True)
+
+    def context_for(user_id):
+        return SimpleNamespace(session=SimpleNamespace(user_id=user_id))
+
+    care_log_store.add_log(
+        event_type="feed",
+        timestamp="2025-11-21T07:00:00",
+        volume_ml=90,
+        tool_context=context_for("family-a"),
+    )
+    care_log_store.add_log(
+        event_type="nap",
+        timestamp="2025-11-21T08:00:00",
+        duration_minutes=30,
+        tool_context=context_for("family/b"),
+    )
+
+    assert (tmp_path / "users" / "family-a" / "care_logs.json").exists()
+    assert not test_file.exists()
+
+    logs_a = care_log_store.get_logs_for_day("2025-11-21", context_for("family-a"))
+    logs_b = care_log_store.get_logs_for_day("2025-11-21", context_for("family/b"))
+    assert [e["event_type"] for e in logs_a] == ["feed"]
+    assert [e["event_type"] for e in logs_b] == ["nap"]
+
+
+@pytest.mark.parametrize("backend", ["json", "journal"])
+def test_concurrent_writers_do_not_lose_events(tmp_path, monkeypatch, backend):
+    test_file: Path = tmp_path / "care_logs.json"
+    care_log_store.CARE_LOG_FILE = test_file
+    monkeypatch.setattr(care_log_store.config, "care_log_backend", backend)
+
+    def write(i: int) -> None:
+        care_log_store.add_log(
+            event_type="diaper",
+            timestamp=datetime(2025, 11, 21, i // 60, i % 60).isoformat(),
+            notes=str(i),
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(200)))
+
+    logs = care_log_store.get_logs_for_day("2025-11-21")
+    assert sorted(int(e["notes"]) for e in logs) == list(range(200))
+
+
+def test_repeat_reads_are_served_from_cache(tmp_path):
+    test_file: Path = tmp_path / "care_logs.json"
+    care_log_store.CARE_LOG_FILE = test_file
+    care_log_store._day_cache.clear()
+
+    care_log_store.add_log(event_type="feed", timestamp="2025-11-21T07:00:00")
+    first = care_log_store.get_logs_for_day("2025-11-21")
+    first[0]["event_type"] = "mutated by caller"
+
+    second = care_log_store.get_logs_for_day("2025-11-21")
+    assert care_log_store._day_cache.hits == 1
+    assert second[0]["event_type"] == "feed"
+
+    # A write bumps the version, so the next read goes back to disk.
+    care_log_store.add_log(event_type="nap", timestamp="2025-11-21T09:00:00")
+    assert len(care_log_store.get_logs_for_day("2025-11-21")) == 2
+    assert care_log_store._day_cache.hits == 1
+
+
+@pytest.mark.parametrize("backend", ["json", "journal", "sqlite"])
+def test_logs_for_range_stream_in_timestamp_order(tmp_path, monkeypatch, backend):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+    care_log_store.sqlite_store.SQLITE_DB_FILE = tmp_path / "parent_concierge.db"
+    monkeypatch.setattr(care_log_store.config, "care_log_backend", backend)
+
+    for event_type, timestamp in [
+        ("nap", "2025-11-22T13:00:00"),
+        ("feed", "2025-11-20T07:00:00"),
+        ("diaper", "2025-11-22T06:00:00"),
+        ("feed", "2025-11-24T07:00:00"),
+        ("feed", "2025-11-21T23:30:00"),
+    ]:
+        care_log_store.add_log(event_type=event_type, timestamp=timestamp)
+
+    logs = care_log_store.get_logs_for_range("2025-11-21", "2025-11-23")
+    assert [e["timestamp"] for e in logs] == [
+        "2025-11-21T23:30:00",
+        "2025-11-22T06:00:00",
+        "2025-11-22T13:00:00",
+    ]
+
+    feeds = care_log_store.iter_logs_for_range(
+        date(2025, 11, 19), date(2025, 11, 30), event_types=["feed"]
+    )
+    assert [e["timestamp"][:10] for e in feeds] == ["2025-11-20", "2025-11-21", "2025-11-24"]
+    assert care_log_store.get_logs_for_range("2025-11-23", "2025-11-21") == []
+    assert care_log_store.get_logs_for_range("bad", "2025-11-21") == []
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_wide_ranges_only_read_days_with_events(tmp_path, monkeypatch, backend):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+    care_log_store.sqlite_store.SQLITE_DB_FILE = tmp_path / "parent_concierge.db"
+    monkeypatch.setattr(care_log_store.config, "care_log_backend", backend)
+    care_log_store._day_cache.clear()
+    care_log_store.add_log(event_type="feed", timestamp="2025-11-21T07:00:00")
+
+    logs = care_log_store.get_logs_for_range("0001-01-01", "9999-12-31")
+    assert [e["timestamp"] for e in logs] == ["2025-11-21T07:00:00"]
+    assert care_log_store.get_logs_for_range("9999-12-30", "9999-12-31") == []
+    assert care_log_store.get_logs_for_day("9999-12-31") == []
+    list(care_log_store.iter_daily_stats(date(2025, 11, 1), date(2025, 11, 30)))
+    # Days without events are never cached.
+    assert len(care_log_store._day_cache) <= 2
+
+
+@pytest.mark.parametrize("backend", ["json", "journal", "sqlite"])
+def test_daily_stats_are_maintained_on_write(tmp_path, monkeypatch, backend):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+    care_log_store.sqlite_store.SQLITE_DB_FILE = tmp_path / "parent_concierge.db"
+    monkeypatch.setattr(care_log_store.config, "care_log_backend", backend)
+
+    care_log_store.add_log(event_type="diaper", timestamp="2025-11-21T07:00:00")
+    # Build the index (and its stats) so later writes update it incrementally.
+    care_log_store.get_day_stats(date(2025, 11, 21))
+    care_log_store.add_log(event_type="feed", timestamp="2025-11-21T06:00:00", volume_ml=90)
+    care_log_store.add_log(event_type="nap", timestamp="2025-11-22T13:00:00", duration_minutes=30)
+
+    for day in ("2025-11-21", "2025-11-22", "2025-11-23"):
+        assert care_log_store.get_day_stats(date.fromisoformat(day)) == compute_day_stats(
+            care_log_store.get_logs_for_day(day)
+        )
+    assert care_log_store.get_day_stats(date(2025, 11, 21))["first_event_time"] == (
+        "2025-11-21T06:00:00"
+    )
+    assert care_log_store.rebuild_daily_stats(check_only=True) == {
+        "status": "success",
+        "days": 2,
+        "mismatched_days": [],
+    }
+
+
+def test_rebuild_daily_stats_repairs_the_table(tmp_path):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+    care_log_store.add_log(event_type="diaper", timestamp="2025-11-21T07:00:00")
+    care_log_store.rebuild_day_index()
+
+    stats_file = tmp_path / "care_logs_by_day" / "2025-11-21.stats.json"
+    stats_file.write_text('{"tampered": true}', encoding="utf-8")
+
+    assert care_log_store.rebuild_daily_stats(check_only=True)["mismatched_days"] == [
+        "2025-11-21"
+    ]
+    assert care_log_store.rebuild_daily_stats()["mismatched_days"] == ["2025-11-21"]
+    assert care_log_store.rebuild_daily_stats(check_only=True)["mismatched_days"] == []
+    assert care_log_store.get_day_stats(date(2025, 11, 21))["diapers"] == {"count": 1}
+
+
+@pytest.mark.parametrize("backend", ["json", "journal", "sqlite"])
+def test_add_logs_saves_a_batch_in_one_write(tmp_path, monkeypatch, backend):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+    care_log_store.sqlite_store.SQLITE_DB_FILE = tmp_path / "parent_concierge.db"
+    monkeypatch.setattr(care_log_store.config, "care_log_backend", backend)
+    care_log_store.rebuild_day_index()
+
+    result = care_log_store.add_logs(
+        [
+            {"event_type": "diaper", "timestamp": "2025-11-21T06:00:00", "notes": "wet"},
+            care_log_store.CareEvent(event_type="diaper", timestamp="2025-11-21T06:00:00"),
+            {"event_type": "feed", "timestamp": "2025-11-21T07:00:00", "volume_ml": 90.0},
+        ]
+    )
+
+    assert result == {"status": "success", "logged": 3}
+    logs = care_log_store.get_logs_for_day("2025-11-21")
+    assert [e["event_type"] for e in logs] == ["diaper", "diaper", "feed"]
+    assert logs[2]["volume_ml"] == 90 and isinstance(logs[2]["volume_ml"], int)
+    assert care_log_store.get_day_stats(date(2025, 11, 21))["diapers"] == {"count": 2}
+
+
+def test_add_logs_rejects_the_whole_batch_on_invalid_events(tmp_path):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+
+    result = care_log_store.add_logs(
+        [
+            {"event_type": "feed", "timestamp": "2025-11-21T07:00:00"},
+            {"event_type": "bath", "timestamp": "2025-11-21T08:00:00"},
+            {"event_type": "nap", "timestamp": "after lunch"},
+            {"event_type": "nap", "timestamp": "2025-11-21T13:00:00", "duration_minutes": -5},
+        ]
+    )
+
+    assert result["status"] == "error"
+    assert [e["index"] for e in result["errors"]] == [1, 2, 3]
+    assert care_log_store.get_logs_for_day("2025-11-21") == []
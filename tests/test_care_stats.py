@@ -0,0 +1,78 @@
+import asyncio
+
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from parent_concierge.subagents.local_stats_agent import LocalStatsAgent
+from parent_concierge.tools.care_stats import compute_day_stats, events_from_state
+from parent_concierge.tools.summary_template import NO_EVENTS_MESSAGE, build_summary_output
+
+EVENTS = [
+    {"event_type": "feed", "timestamp": "2025-11-21T06:40:00", "volume_ml": 110},
+    {"event_type": "diaper", "timestamp": "2025-11-21T07:05:00"},
+    {"event_type": "nap", "timestamp": "2025-11-21T07:45:00", "duration_minutes": 45},
+    {"event_type": "feed", "timestamp": "2025-11-21T05:50:00", "volume_ml": 120},
+]
+
+
+def test_compute_day_stats():
+    stats = compute_day_stats(EVENTS)
+
+    assert stats == {
+        "feeds": {"count": 2, "total_volume_ml": 230},
+        "naps": {"count": 1, "total_minutes": 45},
+        "diapers": {"count": 1},
+        "first_event_time": "2025-11-21T05:50:00",
+        "last_event_time": "2025-11-21T07:45:00",
+    }
+    assert compute_day_stats([])["first_event_time"] is None
+
+
+def test_events_from_state_accepts_llm_text():
+    text = '```json\n{"logs_for_day": [{"event_type": "diaper"}]}\n```'
+
+    assert events_from_state(text) == [{"event_type": "diaper"}]
+    assert events_from_state(EVENTS) == EVENTS
+    assert events_from_state("no events") == []
+    assert events_from_state(None) == []
+
+
+def test_local_stats_agent_writes_day_stats():
+    agent = LocalStatsAgent(name="compute_stats")
+    runner = InMemoryRunner(agent=agent, app_name="test")
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="u", state={"logs_for_day": EVENTS}
+        )
+        async for _ in runner.run_async(
+            user_id="u",
+            session_id=session.id,
+            new_message=types.Content(role="user", parts=[types.Part(text="today")]),
+        ):
+            pass
+        return await runner.session_service.get_session(
+            app_name="test", user_id="u", session_id=session.id
+        )
+
+    session = asyncio.run(run())
+    assert session.state["day_stats"] == compute_day_stats(EVENTS)
+
+
+def test_build_summary_output_merges_team_outputs():
+    output = build_summary_output(
+        EVENTS,
+        compute_day_stats(EVENTS),
+        "Busy morning with two feeds.",
+        '```json\n{"artifact_id": "daily_summary_chart.png"}\n```',
+    )
+
+    assert output == {
+        "message": "Busy morning with two feeds. In total that's 2 feeds (230 ml), "
+        "1 nap (45 min) and 1 diaper change.",
+        "visualization_artifact_id": "daily_summary_chart.png",
+    }
+    assert build_summary_output([], None, "Nothing logged.", None) == {
+        "message": NO_EVENTS_MESSAGE,
+        "visualization_artifact_id": None,
+    }
@@ -0,0 +1,126 @@
+import asyncio
+from datetime import date, timedelta
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from parent_concierge.subagents.care_event_fetcher import ResolvedDayFetcher
+from parent_concierge.tools import care_log_store
+from parent_concierge.tools.date_resolver import resolve_day
+
+FRIDAY = date(2025, 11, 21)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("How has today been?", "2025-11-21"),
+        ("What did feeds and naps look like this morning?", "2025-11-21"),
+        ("How was her day?", "2025-11-21"),
+        ("Can you summarise yesterday?", "2025-11-20"),
+        ("how did last night go", "2025-11-20"),
+        ("the day before yesterday", "2025-11-19"),
+        ("3 days ago", "2025-11-18"),
+        ("summary for 12 Nov 2025", "2025-11-12"),
+        ("November 12, 2025 please", "2025-11-12"),
+        ("the 12th of November", "2025-11-12"),
+        ("2025-11-02", "2025-11-02"),
+        ("how was Tuesday?", "2025-11-18"),
+        ("last Friday", "2025-11-14"),
+        ("28 Dec", "2024-12-28"),
+    ],
+)
+def test_resolve_day(text, expected):
+    assert resolve_day(text, today=FRIDAY) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "compare today with yesterday",
+        "how was last week?",
+        "12/11/2025",
+        "31 Feb 2025",
+        "the day after his jabs",
+    ],
+)
+def test_resolve_day_defers_to_llm(text):
+    assert resolve_day(text, today=FRIDAY) is None
+
+
+def test_resolve_day_can_refuse_to_default_to_today():
+    assert resolve_day("how was she?", today=FRIDAY, default_to_today=False) is None
+    assert resolve_day("how was today?", today=FRIDAY, default_to_today=False) == "2025-11-21"
+
+
+def test_fetcher_fills_logs_for_day_without_llm(tmp_path):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    care_log_store.add_log(event_type="feed", timestamp=f"{yesterday}T07:00:00")
+
+    fetcher = ResolvedDayFetcher(name="care_event_fetcher")
+    runner = InMemoryRunner(agent=fetcher, app_name="test")
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="u"
+        )
+        message = types.Content(
+            role="user", parts=[types.Part(text="Can you summarise yesterday?")]
+        )
+        async for _ in runner.run_async(
+            user_id="u", session_id=session.id, new_message=message
+        ):
+            pass
+        return await runner.session_service.get_session(
+            app_name="test", user_id="u", session_id=session.id
+        )
+
+    state = asyncio.run(run()).state
+    assert state["summary_day"] == yesterday
+    assert [e["event_type"] for e in state["logs_for_day"]] == ["feed"]
+
+
+class StubLlmFetcher(BaseAgent):
+    """Stands in for the LLM fetcher on requests the resolver can't read."""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={"logs_for_day": "[]"}),
+        )
+
+
+def test_fetcher_clears_a_day_resolved_on_an_earlier_turn():
+    fetcher = ResolvedDayFetcher(
+        name="care_event_fetcher", sub_agents=[StubLlmFetcher(name="llm_fetcher")]
+    )
+    runner = InMemoryRunner(agent=fetcher, app_name="test")
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="u", state={"summary_day": "2025-11-20"}
+        )
+        message = types.Content(
+            role="user", parts=[types.Part(text="Summarise the 12th please")]
+        )
+        async for _ in runner.run_async(
+            user_id="u", session_id=session.id, new_message=message
+        ):
+            pass
+        return await runner.session_service.get_session(
+            app_name="test", user_id="u", session_id=session.id
+        )
+
+    state = asyncio.run(run()).state
+    assert state["summary_day"] is None
+    assert state["logs_for_day"] == "[]"
@@ -0,0 +1,31 @@
+from parent_concierge.tools.event_columns import EventColumns
+
+EVENTS = [
+    {"event_type": "feed", "timestamp": "2025-11-21T06:40:00", "volume_ml": 110,
+     "duration_minutes": None, "notes": "left side"},
+    {"event_type": "nap", "timestamp": "2025-11-21T07:45:00", "volume_ml": None,
+     "duration_minutes": 45, "notes": None},
+    {"event_type": "diaper", "timestamp": "2025-11-21T05:05:00", "volume_ml": None,
+     "duration_minutes": None, "notes": None},
+    # Irregular rows keep their exact original dict.
+    {"event_type": "feed", "timestamp": "2025-11-21T08:00:00+01:00", "volume_ml": 60.5,
+     "duration_minutes": None, "notes": None},
+    {"event_type": "bath", "timestamp": "2025-11-21T19:00", "extra": True},
+]
+
+
+def test_round_trips_to_the_original_dicts():
+    columns = EventColumns.from_events(EVENTS)
+
+    assert len(columns) == len(EVENTS)
+    assert columns.to_dicts() == EVENTS
+
+
+def test_time_order_and_type_filter():
+    columns = EventColumns.from_events(EVENTS)
+
+    ordered = [e["timestamp"][11:16] for e in columns.iter_dicts(columns.time_order())]
+    assert ordered == ["05:05", "06:40", "07:45", "08:00", "19:00"]
+    feeds = columns.iter_dicts(columns.time_order(["feed"]))
+    assert [e["volume_ml"] for e in feeds] == [110, 60.5]
+
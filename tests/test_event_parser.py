@@ -0,0 +1,123 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from parent_concierge.subagents.care_event_agent import ParsedCareEventAgent
+from parent_concierge.tools import care_log_store
+from parent_concierge.tools.event_parser import parse_care_events
+
+NOW = datetime(2025, 11, 21, 16, 30)
+
+
+def _event(event_type, timestamp, volume_ml=None, duration_minutes=None, notes=None):
+    return {
+        "event_type": event_type,
+        "timestamp": timestamp,
+        "volume_ml": volume_ml,
+        "duration_minutes": duration_minutes,
+        "notes": notes,
+    }
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("90ml at 7:10", [_event("feed", "2025-11-21T07:10:00", volume_ml=90)]),
+        ("4oz bottle at 2pm", [_event("feed", "2025-11-21T14:00:00", volume_ml=118)]),
+        ("fed at 9:15", [_event("feed", "2025-11-21T09:15:00")]),
+        (
+            "nap from 2:15 to 3pm",
+            [_event("nap", "2025-11-21T14:15:00", duration_minutes=45)],
+        ),
+        (
+            "slept from 7pm to 6am",
+            [_event("nap", "2025-11-20T19:00:00", duration_minutes=660)],
+        ),
+        ("napped for 45 mins", [_event("nap", "2025-11-21T16:30:00", duration_minutes=45)]),
+        ("wet diaper", [_event("diaper", "2025-11-21T16:30:00", notes="wet")]),
+        (
+            "yesterday 120ml at 9pm",
+            [_event("feed", "2025-11-20T21:00:00", volume_ml=120)],
+        ),
+        (
+            "two wet diapers since 6am and a 90ml feed at 7",
+            [
+                _event("diaper", "2025-11-21T06:00:00", notes="wet"),
+                _event("diaper", "2025-11-21T06:00:00", notes="wet"),
+                _event("feed", "2025-11-21T07:00:00", volume_ml=90),
+            ],
+        ),
+    ],
+)
+def test_parse_care_events(text, expected):
+    assert parse_care_events(text, now=NOW) == expected
+
+
+def test_time_without_am_pm_is_the_most_recent_past_one():
+    morning = datetime(2025, 11, 21, 8, 0)
+    assert parse_care_events("90ml at 7:10", now=morning)[0]["timestamp"] == "2025-11-21T07:10:00"
+    assert parse_care_events("90ml at 7:10", now=NOW)[0]["timestamp"] == "2025-11-21T07:10:00"
+    evening = datetime(2025, 11, 21, 20, 0)
+    assert parse_care_events("90ml at 7:10", now=evening)[0]["timestamp"] == "2025-11-21T19:10:00"
+    early = datetime(2025, 11, 21, 6, 0)
+    assert parse_care_events("90ml at 7:10", now=early)[0]["timestamp"] == "2025-11-20T19:10:00"
+
+
+@pytest.mark.parametrize("text", ["dirty nappy 3:15pm", "dirty nappy at 15:15"])
+def test_unambiguous_future_time_defers_to_llm(text):
+    assert parse_care_events(text, now=datetime(2025, 11, 21, 15, 0)) is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "how many feeds today?",
+        "no wet diapers today",
+        "she didn't nap at all",
+        "fed 20 minutes on the left side",
+        "she spat up most of her 90ml bottle",
+        "yesterday at 7 she had a bottle",
+        "log a feed at 7:10 on Tuesday",
+        "thanks!",
+        "expressed 120ml at 7",
+        "sleep",
+        "milk",
+    ],
+)
+def test_parse_care_events_defers_to_llm(text):
+    assert parse_care_events(text, now=NOW) is None
+
+
+def test_agent_logs_parsed_events_without_llm(tmp_path):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+
+    agent = ParsedCareEventAgent(name="care_event_agent")
+    runner = InMemoryRunner(agent=agent, app_name="test")
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="u"
+        )
+        message = types.Content(
+            role="user", parts=[types.Part(text="wet diaper and 90ml feed")]
+        )
+        texts = []
+        async for event in runner.run_async(
+            user_id="u", session_id=session.id, new_message=message
+        ):
+            if event.content and event.content.parts:
+                texts.append(event.content.parts[0].text)
+        session = await runner.session_service.get_session(
+            app_name="test", user_id="u", session_id=session.id
+        )
+        return texts, session.state
+
+    texts, state = asyncio.run(run())
+    assert texts == ["2 events logged successfully."]
+    assert state["care_event_log_output"] == "2 events logged successfully."
+
+    logs = care_log_store.get_logs_for_day(datetime.now().date().isoformat())
+    assert sorted(e["event_type"] for e in logs) == ["diaper", "feed"]
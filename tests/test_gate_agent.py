@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from parent_concierge.subagents.daily_summary_agent import (
+    daily_summary_agent,
+    no_events_summary,
+)
+from parent_concierge.subagents.gate_agent import GateAgent
+from parent_concierge.tools import care_log_store
+from parent_concierge.tools.summary_template import NO_EVENTS_MESSAGE
+
+
+def _gate(stage):
+    return GateAgent(
+        name="gate",
+        sub_agents=[stage],
+        checks=[
+            lambda state: None,
+            lambda state: {"summary_output": "from gate"} if state.get("skip") else None,
+        ],
+        output_key="summary_output",
+    )
+
+
+def test_gate_answers_and_skips_the_stages(counting_stage, run_turn):
+    replies, state = run_turn(_gate(counting_stage), {"skip": True})
+
+    assert counting_stage.runs == 0
+    assert replies == ["from gate"]
+    assert state["summary_output"] == "from gate"
+
+
+def test_gate_runs_the_stages_when_no_check_answers(counting_stage, run_turn):
+    _, state = run_turn(_gate(counting_stage), {"skip": False})
+
+    assert counting_stage.runs == 1
+    assert state["summary_output"] == "summary"
+
+
+def test_empty_day_summary_makes_no_model_call(tmp_path, run_turn):
+    # Any model call would fail here: no API key, and the summary team's
+    # LLM agents would be the ones making it.
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+
+    replies, state = run_turn(daily_summary_agent, {}, text="how was today?")
+
+    expected = {"message": NO_EVENTS_MESSAGE, "visualization_artifact_id": None}
+    assert state["logs_for_day"] == []
+    assert state["summary_output"] == expected
+    assert json.loads(replies[-1]) == expected
+
+
+@pytest.mark.parametrize(
+    "logs_for_day, answered",
+    [
+        ([], True),
+        ("[]", True),
+        ("```json\n[]\n```", True),
+        (None, False),
+        ("", False),
+        ('Here are the logs for 2025-11-19: [{"event_type": "feed"}]', False),
+        ('{"logs_for_day": [{"event_type": "feed"}]}', False),
+    ],
+)
+def test_only_a_certainly_empty_day_skips_the_stages(logs_for_day, answered):
+    assert (no_events_summary({"logs_for_day": logs_for_day}) is not None) == answered
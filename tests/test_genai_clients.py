@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+from parent_concierge.config import GenAiClientRegistry, PooledGemini, config, genai_clients
+
+
+def test_every_model_shares_one_pooled_client(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test")
+
+    async def run():
+        clients = [PooledGemini(model=config.worker_model).api_client for _ in range(3)]
+        pool = clients[0]._api_client._async_httpx_client
+        await genai_clients.aclose()
+        return clients, pool
+
+    clients, pool = asyncio.run(run())
+    assert clients[0] is clients[1] is clients[2]
+    assert pool is clients[0]._api_client._http_options.httpx_async_client
+    assert not clients[0]._api_client._use_aiohttp()
+    assert pool._transport._pool._max_connections == config.http_max_connections
+
+
+def test_registry_makes_a_fresh_client_per_event_loop():
+    registry = GenAiClientRegistry()
+
+    async def get():
+        return registry.get(api_key="test", base_url="http://127.0.0.1:1")
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+    assert first is not second
+
+
+def test_registry_closes_a_replaced_pool():
+    registry = GenAiClientRegistry()
+
+    async def get():
+        client = registry.get(api_key="test", base_url="http://127.0.0.1:1")
+        await asyncio.sleep(0)  # let the replaced pool's aclose() run
+        return client._api_client._http_options.httpx_async_client
+
+    first = asyncio.run(get())
+    assert not first.is_closed
+    second = asyncio.run(get())
+    assert first.is_closed and not second.is_closed
+
+
+def test_registry_closes_a_replaced_pool_on_its_running_loop():
+    registry = GenAiClientRegistry()
+
+    async def get():
+        client = registry.get(api_key="test", base_url="http://127.0.0.1:1")
+        return client._api_client._http_options.httpx_async_client
+
+    old_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=old_loop.run_forever)
+    thread.start()
+    try:
+        first = asyncio.run_coroutine_threadsafe(get(), old_loop).result()
+        asyncio.run(get())
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.01), old_loop).result()
+        assert first.is_closed
+    finally:
+        old_loop.call_soon_threadsafe(old_loop.stop)
+        thread.join()
+        old_loop.close()
+
+
+def test_registry_keys_clients_by_api_key_and_headers():
+    registry = GenAiClientRegistry()
+
+    async def run():
+        clients = [
+            registry.get(api_key="a", headers={"x-app": "1"}),
+            registry.get(api_key="a", headers={"x-app": "1"}),
+            registry.get(api_key="b", headers={"x-app": "1"}),
+            registry.get(api_key="a", headers={"x-app": "2"}),
+            registry.get(api_key="a"),
+        ]
+        await registry.aclose()
+        return clients
+
+    same, again, *others = asyncio.run(run())
+    assert same is again
+    assert len({id(client) for client in [same, *others]}) == 4
+    assert same._api_client.api_key == "a"
+    assert others[1]._api_client._http_options.headers["x-app"] == "2"
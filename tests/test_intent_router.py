@@ -0,0 +1,220 @@
+import asyncio
+import json
+import sys
+from typing import AsyncGenerator, List
+
+import pytest
+from google.adk.agents import LlmAgent
+from google.adk.events import Event
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from parent_concierge.parent_concierge_agent import IntentRouter
+from parent_concierge.tools import baby_profile_store, care_log_store
+from parent_concierge.tools.intent_classifier import classify_intent
+
+# The subagents package re-exports the agent under the module's name.
+care_event_module = sys.modules["parent_concierge.subagents.care_event_agent"]
+
+
+@pytest.mark.parametrize(
+    "text, intent",
+    [
+        ("90ml at 7", "log"),
+        ("nap from 2:15 to 3pm", "log"),
+        ("two wet diapers since 6am", "log"),
+        ("how has today been?", "summary"),
+        ("can you summarise yesterday", "summary"),
+        ("how have feeds been this week?", "other"),
+        ("change her date of birth to 3 March", "other"),
+    ],
+)
+def test_classify_intent(text, intent):
+    assert classify_intent(text)[0] == intent
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "how is her fever today?",
+        "how did she get a rash?",
+        "I am worried, how is my baby doing",
+        "she vomited after the 7am feed",
+        "no wet diaper since 6am",
+    ],
+)
+def test_health_and_worries_are_never_routed(text):
+    assert classify_intent(text) == ("other", 1.0)
+
+
+def test_how_questions_need_a_named_day_to_be_a_summary_rule():
+    assert classify_intent("how was yesterday?") == ("summary", 1.0)
+    assert classify_intent("how is she sleeping?")[1] < 1.0
+
+
+def test_rules_are_certain_and_the_model_is_not():
+    assert classify_intent("90ml at 7") == ("log", 1.0)
+    intent, confidence = classify_intent("she had a bottle around 7ish")
+    assert intent == "log" and confidence < 1.0
+
+
+class EchoLlm(BaseLlm):
+    """Answers every call with its own name and counts the calls."""
+
+    model: str = "echo"
+    calls: int = 0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.calls += 1
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=self.model)])
+        )
+
+
+def _router():
+    onboarding = LlmAgent(name="onboarding_agent", model=EchoLlm(model="onboarding"))
+    orchestrator = LlmAgent(
+        name="parent_concierge_agent",
+        model=EchoLlm(model="orchestrator"),
+        sub_agents=[onboarding],
+        disallow_transfer_to_parent=True,
+    )
+    return IntentRouter(name="intent_router", sub_agents=[orchestrator])
+
+
+def _run(router, texts: List[str], history: List[Event] = ()):
+    runner = InMemoryRunner(agent=router, app_name="test")
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="u"
+        )
+        for event in history:
+            await runner.session_service.append_event(session, event)
+        replies = []
+        for text in texts:
+            message = types.Content(role="user", parts=[types.Part(text=text)])
+            async for event in runner.run_async(
+                user_id="u", session_id=session.id, new_message=message
+            ):
+                if event.content and event.content.parts and event.content.parts[0].text:
+                    replies.append((event.author, event.content.parts[0].text))
+        session = await runner.session_service.get_session(
+            app_name="test", user_id="u", session_id=session.id
+        )
+        return replies, session.state
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def stores(tmp_path):
+    baby_profile_store.PROFILE_FILE = tmp_path / "profiles.json"
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_log.json"
+
+
+def _save_profile():
+    baby_profile_store.save_profile(
+        parent_name="Sam",
+        baby_name="Leo",
+        date_of_birth="2025-08-01",
+        feeding_type="bottle",
+        country="UK",
+    )
+
+
+def test_clear_log_is_saved_without_a_model_call(stores):
+    _save_profile()
+    router = _router()
+
+    replies, state = _run(router, ["90ml at 7"])
+
+    [(author, text)] = replies
+    assert author == "intent_router"
+    assert text.startswith("Logged a 90 ml feed at 07:00")
+    assert state["care_event_log_output"] == "1 event logged successfully."
+    assert router.sub_agents[0].model.calls == 0
+    [event] = json.loads(care_log_store.CARE_LOG_FILE.read_text())
+    assert event["event_type"] == "feed" and event["volume_ml"] == 90
+    assert state["care_event_logged_events"] == [event]
+
+
+def test_reply_reports_what_add_logs_saved(stores, monkeypatch):
+    _save_profile()
+    saved = {"event_type": "feed", "timestamp": "2025-11-19T06:55:00", "volume_ml": 90}
+    monkeypatch.setattr(
+        care_event_module, "parse_care_events", lambda text: [dict(saved, notes=None)]
+    )
+
+    replies, _ = _run(_router(), ["90ml at 7"])
+
+    assert replies == [("intent_router", "Logged a 90 ml feed at 06:55 on 19 Nov.")]
+
+
+def test_model_only_log_goes_to_the_orchestrator(stores):
+    _save_profile()
+    router = _router()
+
+    replies, _ = _run(router, ["she had a bottle around 7ish"])
+
+    assert replies == [("parent_concierge_agent", "orchestrator")]
+    assert not care_log_store.CARE_LOG_FILE.exists()
+
+
+@pytest.mark.parametrize(
+    "text", ["today was hard", "she seems hungry today", "what did she eat today"]
+)
+def test_model_only_summary_goes_to_the_orchestrator(stores, text):
+    _save_profile()
+    router = _router()
+
+    replies, _ = _run(router, [text])
+
+    assert classify_intent(text)[1] < 1.0
+    assert replies == [("parent_concierge_agent", "orchestrator")]
+
+
+def test_unclear_message_goes_to_the_orchestrator(stores):
+    _save_profile()
+    router = _router()
+
+    replies, _ = _run(router, ["any tips for getting her to sleep longer?"])
+
+    assert replies == [("parent_concierge_agent", "orchestrator")]
+
+
+def test_everything_goes_to_the_orchestrator_before_onboarding(stores):
+    router = _router()
+
+    replies, _ = _run(router, ["90ml at 7"])
+
+    assert replies == [("parent_concierge_agent", "orchestrator")]
+
+
+def test_onboarding_in_progress_is_resumed(stores):
+    _save_profile()
+    router = _router()
+    asked = Event(
+        invocation_id="earlier",
+        author="onboarding_agent",
+        content=types.Content(role="model", parts=[types.Part(text="What's the baby's name?")]),
+    )
+
+    replies, _ = _run(router, ["90ml at 7"], history=[asked])
+
+    assert replies == [("onboarding_agent", "onboarding")]
+
+
+def test_rule_summary_is_answered_without_the_orchestrator(stores):
+    _save_profile()
+    router = _router()
+
+    [(author, _)] = _run(router, ["how was yesterday?"])[0]
+
+    assert author == "intent_router"
+    assert router.sub_agents[0].model.calls == 0
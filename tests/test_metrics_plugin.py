@@ -0,0 +1,97 @@
+import asyncio
+import json
+import logging
+from typing import AsyncGenerator, List
+
+from google.adk.agents import LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.adk.tools import FunctionTool
+from google.genai import types
+
+from parent_concierge import metrics_plugin
+from parent_concierge.metrics_plugin import GENAI_CLIENT_LOGGER, LatencyMetricsPlugin
+
+
+class ScriptedLlm(BaseLlm):
+    """Replies with a tool call, then text; logs one client retry first."""
+
+    model: str = "scripted"
+    calls: int = 0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.calls += 1
+        if self.calls == 1:
+            # What google-genai logs before each backoff sleep.
+            logging.getLogger(GENAI_CLIENT_LOGGER).info(
+                "Retrying %s in %s seconds as it raised %s.", "request", 0.1, "503"
+            )
+            part = types.Part(function_call=types.FunctionCall(name="lookup", args={}))
+        else:
+            part = types.Part(text="done")
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[part]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=10, candidates_token_count=3, total_token_count=13
+            ),
+        )
+
+
+def lookup() -> dict:
+    """Return a fixed value."""
+    return {"value": 1}
+
+
+def test_plugin_records_agent_model_and_tool_metrics(tmp_path):
+    metrics_file = tmp_path / "metrics.jsonl"
+    plugin = LatencyMetricsPlugin(jsonl_path=metrics_file)
+    agent = LlmAgent(name="worker", model=ScriptedLlm(), tools=[FunctionTool(lookup)])
+    runner = InMemoryRunner(agent=agent, app_name="test", plugins=[plugin])
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="u"
+        )
+        message = types.Content(role="user", parts=[types.Part(text="go")])
+        async for _ in runner.run_async(
+            user_id="u", session_id=session.id, new_message=message
+        ):
+            pass
+
+    asyncio.run(run())
+
+    records: List[dict] = [json.loads(line) for line in metrics_file.read_text().splitlines()]
+    assert records == list(plugin.records)
+    kinds = [r["kind"] for r in records]
+    assert kinds == ["model", "tool", "model", "agent", "run"]
+
+    first_model, tool = records[0], records[1]
+    assert first_model["agent"] == "worker"
+    assert first_model["retries"] == 1
+    assert first_model["tokens"]["prompt"] == 10
+    assert tool["tool"] == "lookup"
+    assert all(r["duration_ms"] >= 0 for r in records)
+
+    text = plugin.prometheus_text()
+    assert 'parent_concierge_model_retries_total{agent="worker"} 1.0' in text
+    assert 'parent_concierge_model_seconds_count{agent="worker"} 2.0' in text
+    assert 'parent_concierge_model_tokens_total{agent="worker",type="prompt"} 20.0' in text
+    assert 'parent_concierge_tool_seconds_count{agent="worker",tool="lookup"} 1.0' in text
+    assert "# TYPE parent_concierge_agent_seconds_max gauge" in text
+
+
+def test_plugin_keeps_only_recent_records_in_memory(monkeypatch, tmp_path):
+    monkeypatch.setattr(metrics_plugin, "RECENT_RECORDS", 3)
+    metrics_file = tmp_path / "metrics.jsonl"
+    plugin = LatencyMetricsPlugin(jsonl_path=metrics_file)
+
+    for index in range(5):
+        plugin._emit({"kind": "tool", "index": index})
+    plugin.close()
+
+    assert [r["index"] for r in plugin.records] == [2, 3, 4]
+    assert len(metrics_file.read_text().splitlines()) == 5
@@ -0,0 +1,102 @@
+import asyncio
+
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+
+from parent_concierge.rate_limiter import ModelRateLimiter, TokenBucket, estimate_tokens
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(60, capacity=2, clock=clock)
+    bucket.take(2)
+    assert bucket.wait_time(1) == 1.0
+    clock.now = 0.5
+    assert bucket.wait_time(1) == 0.5
+    clock.now = 10
+    assert bucket.wait_time(2) == 0.0
+    assert bucket.level == 2  # capped at capacity
+
+
+def _grant_order(limiter, requests):
+    """Queue (label, user, priority, tokens) requests at once; return grant order."""
+
+    async def run():
+        # Use up the burst so every request below has to queue.
+        await limiter.acquire(0)
+        granted = []
+
+        async def one(label, user, priority, tokens):
+            await limiter.acquire(tokens, user, priority)
+            granted.append(label)
+
+        await asyncio.gather(*(one(*r) for r in requests))
+        return granted
+
+    return asyncio.run(run())
+
+
+def test_interactive_calls_go_before_background_ones():
+    limiter = ModelRateLimiter(1200, None, request_burst=1)  # one per 50 ms
+    order = _grant_order(
+        limiter,
+        [
+            ("summary-1", "a", "background", 0),
+            ("summary-2", "a", "background", 0),
+            ("log", "b", "interactive", 0),
+        ],
+    )
+    assert order == ["log", "summary-1", "summary-2"]
+
+
+def test_users_take_turns_within_a_priority():
+    limiter = ModelRateLimiter(1200, None, request_burst=1)
+    order = _grant_order(
+        limiter,
+        [
+            ("a1", "a", "background", 0),
+            ("a2", "a", "background", 0),
+            ("a3", "a", "background", 0),
+            ("b1", "b", "background", 0),
+        ],
+    )
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+def test_token_budget_holds_back_large_calls():
+    limiter = ModelRateLimiter(None, 60_000, token_burst=1000)  # 1000 tokens/s
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire(1000)
+        await limiter.acquire(200)
+        return loop.time() - start
+
+    assert 0.15 < asyncio.run(run()) < 0.6
+
+
+def test_settle_corrects_the_token_estimate():
+    clock = FakeClock()
+    limiter = ModelRateLimiter(None, 60, token_burst=100, clock=clock)
+    asyncio.run(limiter.acquire(10))
+    limiter.settle(estimated=10, actual=40)
+    assert limiter.tokens.level == 60
+
+
+def test_estimate_tokens_counts_input_and_expected_output():
+    request = LlmRequest(
+        contents=[types.Content(role="user", parts=[types.Part(text="x" * 400)])],
+        config=types.GenerateContentConfig(
+            system_instruction="y" * 400, max_output_tokens=50
+        ),
+    )
+    assert estimate_tokens(request) == 200 + 50
@@ -0,0 +1,214 @@
+import asyncio
+import time
+from typing import AsyncGenerator, List
+
+import pytest
+from google.adk.agents import LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.genai import errors, types
+
+from parent_concierge import resilience
+from parent_concierge.resilience import (
+    DeadlineRetryLlm,
+    TurnDeadlineExceeded,
+    TurnDeadlinePlugin,
+    remaining_budget,
+    turn_deadline,
+)
+
+
+class FaultyLlm(BaseLlm):
+    """
+    Local model stub that plays a script of faults, one entry per call:
+    an HTTP status code to fail with, a float number of seconds to take
+    before answering, or "ok" to answer at once.
+    """
+
+    model: str = "faulty"
+    script: List[object]
+    calls: int = 0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        step = self.script[min(self.calls, len(self.script) - 1)]
+        self.calls += 1
+        if isinstance(step, int):
+            raise errors.APIError(step, {"error": {"code": step, "message": "injected"}})
+        if isinstance(step, float):
+            await asyncio.sleep(step)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=f"call {self.calls}")])
+        )
+
+
+def _options(**overrides):
+    values = dict(
+        attempts=4,
+        initial_delay=0.01,
+        exp_base=2,
+        max_delay=0.05,
+        http_status_codes=[429, 500, 503, 504],
+    )
+    values.update(overrides)
+    return types.HttpRetryOptions(**values)
+
+
+def _wrap(inner, **kwargs):
+    kwargs.setdefault("retry_options", _options())
+    return DeadlineRetryLlm(model=inner.model, inner=inner, **kwargs)
+
+
+def _generate(llm, budget_s=None):
+    async def run():
+        request = LlmRequest(model=llm.model)
+        if budget_s is None:
+            return [r async for r in llm.generate_content_async(request)]
+        with turn_deadline(budget_s):
+            return [r async for r in llm.generate_content_async(request)]
+
+    return asyncio.run(run())
+
+
+@pytest.fixture(autouse=True)
+def _fresh_latencies():
+    resilience._latencies.clear()
+    yield
+    resilience._latencies.clear()
+
+
+def test_retries_transient_errors_then_answers():
+    inner = FaultyLlm(script=[503, 429, "ok"])
+    responses = _generate(_wrap(inner), budget_s=5)
+    assert inner.calls == 3
+    assert responses[0].content.parts[0].text == "call 3"
+
+
+def test_gives_up_after_attempts():
+    inner = FaultyLlm(script=[503])
+    with pytest.raises(errors.APIError):
+        _generate(_wrap(inner, retry_options=_options(attempts=3)))
+    assert inner.calls == 3
+
+
+def test_does_not_retry_client_errors():
+    inner = FaultyLlm(script=[400, "ok"])
+    with pytest.raises(errors.APIError):
+        _generate(_wrap(inner), budget_s=5)
+    assert inner.calls == 1
+
+
+def test_backoff_never_sleeps_past_the_budget(monkeypatch):
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+    inner = FaultyLlm(script=[503, "ok"])
+    llm = _wrap(inner, retry_options=_options(initial_delay=30, max_delay=30))
+
+    start = time.monotonic()
+    with pytest.raises(errors.APIError):
+        _generate(llm, budget_s=0.2)
+    assert time.monotonic() - start < 1
+    assert inner.calls == 1
+
+
+def test_slow_model_is_cut_off_at_the_deadline():
+    inner = FaultyLlm(script=[5.0])
+    start = time.monotonic()
+    with pytest.raises(TurnDeadlineExceeded):
+        _generate(_wrap(inner), budget_s=0.2)
+    assert time.monotonic() - start < 1
+
+
+def test_hedges_a_call_slower_than_recent_p95():
+    for _ in range(resilience.HEDGE_MIN_SAMPLES):
+        resilience.record_latency("faulty", 0.01)
+    inner = FaultyLlm(script=[2.0, "ok"])
+
+    start = time.monotonic()
+    responses = _generate(_wrap(inner, hedge=True), budget_s=5)
+    assert time.monotonic() - start < 1
+    assert inner.calls == 2
+    assert responses[0].content.parts[0].text == "call 2"
+
+
+def test_no_hedge_without_enough_samples():
+    inner = FaultyLlm(script=[0.2, "ok"])
+    responses = _generate(_wrap(inner, hedge=True), budget_s=5)
+    assert inner.calls == 1
+    assert responses[0].content.parts[0].text == "call 1"
+
+
+class BudgetProbeLlm(BaseLlm):
+    model: str = "probe"
+    seen: List[object] = []
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.seen.append(remaining_budget())
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="ok")]))
+
+
+def test_plugin_starts_and_clears_the_turn_budget():
+    probe = BudgetProbeLlm()
+    agent = LlmAgent(name="worker", model=probe)
+    runner = InMemoryRunner(
+        agent=agent, app_name="test", plugins=[TurnDeadlinePlugin(budget_s=30)]
+    )
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="u"
+        )
+        message = types.Content(role="user", parts=[types.Part(text="hi")])
+        async for _ in runner.run_async(
+            user_id="u", session_id=session.id, new_message=message
+        ):
+            pass
+        return remaining_budget()
+
+    assert asyncio.run(run()) is None
+    assert len(probe.seen) == 1 and 25 < probe.seen[0] <= 30
+
+
+class FailingProbeLlm(BudgetProbeLlm):
+    """Records the budget like BudgetProbeLlm, then fails its first call."""
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.seen.append(remaining_budget())
+        if len(self.seen) == 1:
+            raise RuntimeError("model blew up")
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="ok")]))
+
+
+def test_turn_after_a_failed_turn_gets_a_fresh_budget():
+    probe = FailingProbeLlm(seen=[])
+    agent = LlmAgent(name="worker", model=probe)
+    runner = InMemoryRunner(
+        agent=agent, app_name="test", plugins=[TurnDeadlinePlugin(budget_s=30)]
+    )
+
+    async def turn(session_id):
+        message = types.Content(role="user", parts=[types.Part(text="hi")])
+        async for _ in runner.run_async(
+            user_id="u", session_id=session_id, new_message=message
+        ):
+            pass
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="u"
+        )
+        with pytest.raises(RuntimeError):
+            await turn(session.id)
+        await asyncio.sleep(0.2)
+        await turn(session.id)
+        return remaining_budget()
+
+    assert asyncio.run(run()) is None
+    # The failed turn's budget was 0.2 s older by the time the second began.
+    assert 29.9 < probe.seen[1] <= 30
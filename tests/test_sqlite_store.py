@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+from parent_concierge import migrate_to_sqlite
+from parent_concierge.tools import baby_profile_store, care_log_store, sqlite_store
+
+
+def _use_sqlite(tmp_path, monkeypatch) -> Path:
+    db_file: Path = tmp_path / "parent_concierge.db"
+    sqlite_store.SQLITE_DB_FILE = db_file
+    monkeypatch.setattr(care_log_store.config, "care_log_backend", "sqlite")
+    monkeypatch.setattr(care_log_store.config, "profile_backend", "sqlite")
+    return db_file
+
+
+def test_sqlite_backend_keeps_tool_api(tmp_path, monkeypatch):
+    db_file = _use_sqlite(tmp_path, monkeypatch)
+
+    care_log_store.add_log(
+        event_type="feed", timestamp="2025-11-21T07:10:00", volume_ml=90
+    )
+    care_log_store.add_log(
+        event_type="nap", timestamp="2025-11-20T23:30:00", duration_minutes=40
+    )
+
+    logs = care_log_store.get_logs_for_day("2025-11-21")
+    assert logs == [
+        {
+            "event_type": "feed",
+            "timestamp": "2025-11-21T07:10:00",
+            "volume_ml": 90,
+            "duration_minutes": None,
+            "notes": None,
+        }
+    ]
+    assert care_log_store.get_logs_for_day("not-a-date") == []
+
+    assert baby_profile_store.get_profile() == {"exists": False, "profile": None}
+    baby_profile_store.save_profile("Stephen", "Leo", "2025-01-01", "mixed", "UK")
+    assert baby_profile_store.get_profile()["profile"]["baby_name"] == "Leo"
+
+    conn = sqlite_store.get_connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert db_file.exists()
+
+
+def test_migrate_imports_json_files(tmp_path, monkeypatch):
+    care_file: Path = tmp_path / "care_logs.json"
+    care_file.write_text(
+        json.dumps(
+            [
+                {"event_type": "feed", "timestamp": "2025-11-21T06:40:00", "volume_ml": 110},
+                {"event_type": "diaper", "timestamp": "2025-11-21T07:05:00"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    profile_file: Path = tmp_path / "profiles.json"
+    profile_file.write_text(
+        json.dumps({"profile": {"parent_name": "Stephen", "baby_name": "Leo"}}),
+        encoding="utf-8",
+    )
+    care_log_store.CARE_LOG_FILE = care_file
+    baby_profile_store.PROFILE_FILE = profile_file
+    _use_sqlite(tmp_path, monkeypatch)
+
+    result = migrate_to_sqlite.migrate()
+    assert result == {"status": "success", "events": 2, "profile": True}
+    assert len(care_log_store.get_logs_for_day("2025-11-21")) == 2
+    assert baby_profile_store.get_profile()["profile"]["baby_name"] == "Leo"
+
+    # A second run must not duplicate history unless asked to replace it.
+    assert migrate_to_sqlite.migrate()["status"] == "error"
+    assert migrate_to_sqlite.migrate(replace=True)["events"] == 2
+    assert len(care_log_store.get_logs_for_day("2025-11-21")) == 2
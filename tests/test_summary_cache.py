@@ -0,0 +1,149 @@
+import asyncio
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from parent_concierge.subagents.cached_summary_agent import CHART_TOOL_NAME, CachedSummaryAgent
+from parent_concierge.tools import care_log_store, summary_cache
+
+EVENTS = [
+    {"event_type": "feed", "timestamp": "2025-11-21T06:40:00", "volume_ml": 110},
+    {"event_type": "diaper", "timestamp": "2025-11-21T07:05:00"},
+]
+
+
+def test_lookup_requires_identical_events():
+    summary_cache.store("u", "2025-11-21", EVENTS, {"state": {}})
+
+    assert summary_cache.lookup("u", "2025-11-21", [dict(e) for e in EVENTS]) == {"state": {}}
+    assert summary_cache.lookup("u", "2025-11-21", EVENTS[:1]) is None
+
+    summary_cache.invalidate_day("u", "2025-11-21")
+    assert summary_cache.lookup("u", "2025-11-21", EVENTS) is None
+
+
+def test_unchanged_day_is_served_from_cache(counting_stage, run_turn):
+    summary_cache._summary_cache.clear()
+    runner = InMemoryRunner(
+        agent=CachedSummaryAgent(name="cached", sub_agents=[counting_stage]), app_name="test"
+    )
+    state = {"logs_for_day": EVENTS, "summary_day": "2025-11-21"}
+
+    _, first = run_turn(runner, state)
+    _, second = run_turn(runner, state)
+    assert counting_stage.runs == 1
+    assert second["day_stats"] == first["day_stats"]
+    assert second["summary_output"] == "summary"
+
+    run_turn(runner, {**state, "logs_for_day": EVENTS[:1]})
+    assert counting_stage.runs == 2
+
+
+def test_add_log_invalidates_day(tmp_path):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+    summary_cache.store(None, "2025-11-21", EVENTS, {"state": {}})
+    summary_cache.store(None, "2025-11-22", EVENTS, {"state": {}})
+
+    care_log_store.add_log("nap", "2025-11-21T09:00:00", duration_minutes=30)
+
+    assert summary_cache.lookup(None, "2025-11-21", EVENTS) is None
+    assert summary_cache.lookup(None, "2025-11-22", EVENTS) is not None
+
+
+class ChartStage(BaseAgent):
+    """Saves a chart artifact and reports it the way the chart tool does."""
+
+    runs: int = 0
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        self.runs += 1
+        version = await ctx.artifact_service.save_artifact(
+            app_name=ctx.app_name,
+            user_id=ctx.user_id,
+            session_id=ctx.session.id,
+            filename="daily_summary_chart.png",
+            artifact=types.Part.from_bytes(data=b"png", mime_type="image/png"),
+        )
+        chart = {"filename": "daily_summary_chart.png", "version": version}
+        response = types.Part(
+            function_response=types.FunctionResponse(name=CHART_TOOL_NAME, response=chart)
+        )
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="user", parts=[response]),
+            actions=EventActions(
+                state_delta={"summary_output": "summary"},
+                artifact_delta={"daily_summary_chart.png": version},
+            ),
+        )
+
+
+def test_cache_hit_replays_the_chart_artifact():
+    summary_cache._summary_cache.clear()
+    stage = ChartStage(name="stage")
+    runner = InMemoryRunner(
+        agent=CachedSummaryAgent(name="cached", sub_agents=[stage]), app_name="test"
+    )
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test",
+            user_id="u",
+            state={"logs_for_day": EVENTS, "summary_day": "2025-11-21"},
+        )
+        deltas = []
+        for _ in range(2):
+            async for event in runner.run_async(
+                user_id="u",
+                session_id=session.id,
+                new_message=types.Content(role="user", parts=[types.Part(text="today")]),
+            ):
+                deltas.append(event.actions.artifact_delta)
+        return deltas
+
+    deltas = asyncio.run(run())
+    assert stage.runs == 1
+    assert deltas[-1] == {"daily_summary_chart.png": 0}
+
+
+def test_cache_hit_needs_the_latest_chart_version():
+    summary_cache._summary_cache.clear()
+    stage = ChartStage(name="stage")
+    runner = InMemoryRunner(
+        agent=CachedSummaryAgent(name="cached", sub_agents=[stage]), app_name="test"
+    )
+    other_day = [dict(EVENTS[0], timestamp="2025-11-22T06:40:00")]
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="u"
+        )
+        for day, events in [("2025-11-21", EVENTS), ("2025-11-22", other_day)] * 2:
+            # Day A, day B, then day A again: A's chart (v0) is no longer the
+            # version its summary's filename would load.
+            await runner.session_service.append_event(
+                session,
+                Event(
+                    author="user",
+                    actions=EventActions(
+                        state_delta={"logs_for_day": events, "summary_day": day}
+                    ),
+                ),
+            )
+            async for _ in runner.run_async(
+                user_id="u",
+                session_id=session.id,
+                new_message=types.Content(role="user", parts=[types.Part(text="today")]),
+            ):
+                pass
+
+    asyncio.run(run())
+    assert stage.runs == 4
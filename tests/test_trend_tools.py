@@ -0,0 +1,63 @@
+import asyncio
+import math
+from datetime import date
+from types import SimpleNamespace
+
+from parent_concierge.tools import care_log_store
+from parent_concierge.tools.trend_tools import aggregate_trends, create_trend_chart_artifact
+
+EVENTS = [
+    {"event_type": "feed", "timestamp": "2025-11-20T22:00:00", "volume_ml": 100},
+    {"event_type": "feed", "timestamp": "2025-11-21T01:00:00", "volume_ml": 90},
+    {"event_type": "feed", "timestamp": "2025-11-21T05:00:00", "volume_ml": 120},
+    {"event_type": "nap", "timestamp": "2025-11-21T09:00:00", "duration_minutes": 40},
+    {"event_type": "nap", "timestamp": "2025-11-21T13:00:00", "duration_minutes": 50},
+    {"event_type": "diaper", "timestamp": "2025-11-23T09:00:00"},
+    {"event_type": "diaper", "timestamp": "not a time"},
+]
+
+
+class ToolContextStub:
+    def __init__(self):
+        self.session = SimpleNamespace(user_id=None)
+        self.state = {}
+        self.actions = SimpleNamespace(artifact_delta={})
+        self.saved = []
+
+    async def save_artifact(self, filename, artifact):
+        self.saved.append(filename)
+        return len(self.saved) - 1
+
+
+def test_aggregate_trends_per_day():
+    table = aggregate_trends(EVENTS, date(2025, 11, 21), date(2025, 11, 23))
+
+    assert [d.date().isoformat() for d in table.index] == ["2025-11-21", "2025-11-22", "2025-11-23"]
+    assert table["feed_volume_ml"].tolist() == [210, 0, 0]
+    assert table["nap_minutes"].tolist() == [90, 0, 0]
+    assert table["diaper_count"].tolist() == [0, 0, 1]
+    # 22:00 -> 01:00 -> 05:00: intervals of 180 and 240 minutes.
+    assert table["mean_feed_interval_minutes"].iloc[0] == 210
+    assert math.isnan(table["mean_feed_interval_minutes"].iloc[1])
+
+
+def test_create_trend_chart_artifact(tmp_path):
+    care_log_store.CARE_LOG_FILE = tmp_path / "care_logs.json"
+    for event in EVENTS[:-1]:
+        care_log_store.add_log(**event)
+    tool_context = ToolContextStub()
+
+    async def run():
+        first = await create_trend_chart_artifact("week", "2025-11-23", tool_context=tool_context)
+        again = await create_trend_chart_artifact("week", "2025-11-23", tool_context=tool_context)
+        return first, again
+
+    first, again = asyncio.run(run())
+    assert first == {
+        "filename": "care_trend_chart.png",
+        "version": 0,
+        "start_date": "2025-11-17",
+        "end_date": "2025-11-23",
+    }
+    assert again == first and tool_context.saved == ["care_trend_chart.png"]
+    assert "error" in asyncio.run(create_trend_chart_artifact("year", None, tool_context=tool_context))
@@ -0,0 +1,110 @@
+import asyncio
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from parent_concierge.tools import visualizations_tools
+from parent_concierge.tools.read_cache import LRUCache
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+LOGS = [
+    {"event_type": "feed", "timestamp": "2025-11-21T06:40:00", "volume_ml": 110},
+    {"event_type": "nap", "timestamp": "2025-11-21T07:45:00", "duration_minutes": 45},
+    {"event_type": "diaper", "timestamp": "2025-11-21T08:05:00"},
+]
+
+
+class ArtifactSink:
+    def __init__(self):
+        self.saved = []
+        self.state = {}
+        self.actions = SimpleNamespace(artifact_delta={})
+
+    async def save_artifact(self, filename, artifact):
+        self.saved.append((filename, artifact))
+        return len(self.saved) - 1
+
+
+def test_chart_values():
+    assert visualizations_tools.chart_values(LOGS) == [110, 45, 1]
+    assert visualizations_tools.chart_values(None) == [0, 0, 0]
+
+
+def test_render_is_safe_from_many_threads():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        pngs = list(pool.map(visualizations_tools.render_bar_chart_png, [[i, 2, 3] for i in range(8)]))
+
+    assert all(png.startswith(PNG_MAGIC) for png in pngs)
+
+
+def test_create_bar_chart_artifact_saves_png():
+    sink = ArtifactSink()
+
+    result = asyncio.run(visualizations_tools.create_bar_chart_artifact(LOGS, sink))
+
+    assert result == {"filename": "daily_summary_chart.png", "version": 0}
+    filename, part = sink.saved[0]
+    assert filename == "daily_summary_chart.png"
+    assert part.inline_data.data.startswith(PNG_MAGIC)
+
+
+def test_identical_chart_reuses_artifact_version(monkeypatch):
+    renders = []
+    render = visualizations_tools.render_bar_chart_png
+    monkeypatch.setattr(
+        visualizations_tools,
+        "render_bar_chart_png",
+        lambda values: renders.append(values) or render(values),
+    )
+    visualizations_tools._png_cache.clear()
+    first, second = ArtifactSink(), ArtifactSink()
+
+    async def run():
+        await visualizations_tools.create_bar_chart_artifact(LOGS, first)
+        again = await visualizations_tools.create_bar_chart_artifact(LOGS, first)
+        other_session = await visualizations_tools.create_bar_chart_artifact(LOGS, second)
+        changed = await visualizations_tools.create_bar_chart_artifact(LOGS[:2], first)
+        return again, other_session, changed
+
+    again, other_session, changed = asyncio.run(run())
+    assert again["version"] == 0 and len(first.saved) == 2
+    assert first.actions.artifact_delta == {"daily_summary_chart.png": 0}
+    assert other_session["version"] == 0 and len(second.saved) == 1
+    assert changed["version"] == 1
+    # The second session saved its own artifact but reused the rendered PNG.
+    assert renders == [[110, 45, 1], [110, 45, 0]]
+
+
+def test_only_the_latest_chart_version_is_reused():
+    sink = ArtifactSink()
+
+    async def run():
+        day_a = await visualizations_tools.create_bar_chart_artifact(LOGS, sink)
+        day_b = await visualizations_tools.create_bar_chart_artifact(LOGS[:2], sink)
+        day_a_again = await visualizations_tools.create_bar_chart_artifact(LOGS, sink)
+        return day_a, day_b, day_a_again
+
+    day_a, day_b, day_a_again = asyncio.run(run())
+    assert (day_a["version"], day_b["version"]) == (0, 1)
+    # Version 0 is no longer what the filename resolves to: save it again.
+    assert day_a_again["version"] == 2 and len(sink.saved) == 3
+
+
+def test_png_cache_is_bounded_by_size():
+    cache = LRUCache(max_entries=10, max_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    cache.put("c", b"1")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"12345" and cache.total_bytes == 6
+
+
+def test_agent_import_does_not_load_matplotlib():
+    code = (
+        "import sys, parent_concierge.parent_concierge_agent; "
+        "sys.exit('matplotlib' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True).returncode == 0